@@ -19,12 +19,13 @@ function SetQueryParam(key, value) {
     } catch { }
 }
 
-function SaveToCache(Data) {
+function SaveToCache(Data, Hash) {
     try {
         const CacheData = {
             data: Data,
             timestamp: Date.now(),
-            version: '1.0'
+            version: '1.0',
+            hash: Hash || null
         };
         localStorage.setItem('sdk_cache', JSON.stringify(CacheData));
         console.log('Data cached successfully');
@@ -33,7 +34,7 @@ function SaveToCache(Data) {
     }
 }
 
-function LoadFromCache() {
+function LoadFromCache(Hash) {
     try {
         const Cached = localStorage.getItem('sdk_cache');
         if (!Cached) return null;
@@ -43,7 +44,11 @@ function LoadFromCache() {
         const CacheAge = Now - CacheData.timestamp;
         const MaxAge = 24 * 60 * 60 * 1000;
 
-        if (CacheAge > MaxAge) {
+        // With a content hash the copy is valid exactly as long as the hash matches;
+        // a mismatched copy is kept as the base for PatchCachedData
+        if (Hash) {
+            if (CacheData.hash !== Hash) return null;
+        } else if (CacheAge > MaxAge) {
             localStorage.removeItem('sdk_cache');
             return null;
         }
@@ -63,15 +68,237 @@ function ClearCache() {
     location.reload();
 }
 
+function NormalizeClass(cls) {
+    const name = (cls.N || cls.n || '').toString();
+    if (!name) return null;
+    return {
+        n: cls.N || cls.n || '',
+        p: cls.P || cls.p || '',
+        s: cls.S || cls.s || 0,
+        m: Array.isArray(cls.M || cls.m) ? (cls.M || cls.m).map(member => ({
+            n: (member && (member.N || member.n)) ? member.N || member.n : '',
+            t: (member && (member.T || member.t)) ? member.T || member.t : '',
+            o: (member && (member.O || member.o)) ? member.O || member.o : '',
+            s: (member && (member.S || member.s)) ? member.S || member.s : ''
+        })) : [],
+        t: cls.T || cls.t || ''
+    };
+}
+
+// Schema 2 (sdk_schema.py): member names/types are indices into shared tables, offsets/sizes are integers
+function DecodeSchemaV2(Data) {
+    const Names = Data.names || [];
+    const Types = Data.types || [];
+    return (Data.classes || []).map(([N, P, S, T, MemberNames, MemberTypes, Offsets, Sizes]) => ({
+        N, P, S, T,
+        M: MemberNames.map((NameId, i) => ({
+            N: Names[NameId],
+            T: Types[MemberTypes[i]],
+            O: '0x' + Offsets[i].toString(16).toUpperCase(),
+            S: '0x' + Sizes[i].toString(16).toUpperCase()
+        }))
+    }));
+}
+
+// Content-hashed data files: only the tiny manifest is revalidated, hashed files never change
+let DataManifest = null;
+
+async function LoadDataManifest() {
+    try {
+        const Response = await fetch('./Data/data_manifest.json', { cache: 'no-store' });
+        if (!Response.ok) return null;
+        const Manifest = await Response.json();
+        if (!Manifest || !Manifest.files) return null;
+        return Manifest;
+    } catch {
+        return null;
+    }
+}
+
+function DataHash(Name) {
+    const Entry = DataManifest && DataManifest.files[Name];
+    return Entry ? Entry.hash : null;
+}
+
+function FetchData(Name) {
+    const Entry = DataManifest && DataManifest.files[Name];
+    if (Entry) return fetch('./Data/' + Entry.path, { cache: 'force-cache' });
+    return fetch('./Data/' + Name, { cache: 'no-store' });
+}
+
+// Patches (SDK Data Converter/sdk_patch.py) move a cached release to the next one
+function PatchKeys(Records) {
+    const Seen = new Map();
+    return Records.map(Record => {
+        const Count = Seen.get(Record.N) || 0;
+        Seen.set(Record.N, Count + 1);
+        return Count ? `${Record.N}#${Count}` : Record.N;
+    });
+}
+
+function ApplyPatch(Data, Patch) {
+    if (Patch.version !== 1) throw new Error(`Unsupported patch version ${Patch.version}`);
+    const Dropped = new Set(Patch.deletes);
+    const Upserts = new Map();
+    Patch.upserts.forEach(([Index, Record, Key]) => {
+        Upserts.set(Index, Record);
+        Dropped.add(Key || Record.N);
+    });
+    const Keys = PatchKeys(Data);
+    const Remaining = Data.filter((_, i) => !Dropped.has(Keys[i]));
+    const Result = [];
+    let Next = 0;
+    for (let i = 0; i < Patch.classes; i++) {
+        if (Upserts.has(i)) Result.push(Upserts.get(i));
+        else if (Next < Remaining.length) Result.push(Remaining[Next++]);
+        else throw new Error('Patch does not match cached data');
+    }
+    if (Next !== Remaining.length) throw new Error('Patch does not match cached data');
+    return Result;
+}
+
+async function PatchCachedData(Hash) {
+    try {
+        const Cached = localStorage.getItem('sdk_cache');
+        if (!Cached) return null;
+        const CacheData = JSON.parse(Cached);
+        let Data = CacheData.data;
+        let Current = CacheData.hash;
+        // Follow the chain of patches, but give up and download if it gets long
+        for (let Step = 0; Current && Current !== Hash && Step < 10; Step++) {
+            const Response = await fetch(`./Data/patches/${Current}.json`, { cache: 'force-cache' });
+            if (!Response.ok) return null;
+            const Patch = await Response.json();
+            if (Patch.base !== Current) return null;
+            Data = ApplyPatch(Data, Patch);
+            Current = Patch.target;
+        }
+        if (Current !== Hash) return null;
+        SaveToCache(Data, Hash);
+        console.log('Cached data patched to', Hash);
+        return Data;
+    } catch (error) {
+        console.warn('Failed to patch cached data:', error);
+        return null;
+    }
+}
+
+// Sharded data: the manifest lists every class, shards are fetched when a class is opened
+let ShardManifest = null;
+const ShardRequests = {};
+
+async function LoadSDKManifest() {
+    try {
+        const Response = await FetchData('sdk_manifest.json');
+        if (!Response.ok) return null;
+        const Manifest = await Response.json();
+        if (!Manifest || !Array.isArray(Manifest.shards) || !Manifest.classes) return null;
+        // Shards cut from an older sdk_data.json than the published one are stale
+        const Expected = DataHash('sdk_data.json');
+        if (Expected && Manifest.data !== Expected) return null;
+        return Manifest;
+    } catch {
+        return null;
+    }
+}
+
+function LoadShard(Index) {
+    if (!ShardRequests[Index]) {
+        // Shard names are content hashes, so a cached copy is always current
+        ShardRequests[Index] = fetch('./Data/' + ShardManifest.shards[Index], { cache: 'force-cache' })
+            .then(Response => {
+                if (!Response.ok) throw new Error(`HTTP error! status: ${Response.status}`);
+                return Response.json();
+            })
+            .then(Data => {
+                Data.forEach(cls => {
+                    const Normalized = NormalizeClass(cls);
+                    if (Normalized) Classes[Normalized.n] = Normalized;
+                });
+            })
+            .catch(error => {
+                delete ShardRequests[Index];
+                throw error;
+            });
+    }
+    return ShardRequests[Index];
+}
+
+// Served by SDK Data Converter/sdk_server.py: the class list comes from /classes, each class from /class/<name>
+let ServerBackend = false;
+const ServerRequests = {};
+
+async function LoadServerClasses() {
+    // sdk_server.py marks the page it serves; static hosting has no API to probe
+    if (!window.SDKServer) return null;
+    try {
+        const Response = await fetch('./classes', { cache: 'no-cache' });
+        if (!Response.ok || !(Response.headers.get('Content-Type') || '').includes('application/json')) return null;
+        const Data = await Response.json();
+        return Data && Array.isArray(Data.classes) ? Data.classes : null;
+    } catch {
+        return null;
+    }
+}
+
+function LoadServerClass(Name) {
+    if (!ServerRequests[Name]) {
+        ServerRequests[Name] = fetch('./class/' + encodeURIComponent(Name), { cache: 'no-cache' })
+            .then(Response => {
+                if (!Response.ok) throw new Error(`HTTP error! status: ${Response.status}`);
+                return Response.json();
+            })
+            .then(cls => {
+                const Normalized = NormalizeClass(cls);
+                if (Normalized) Classes[Normalized.n] = Normalized;
+            })
+            .catch(error => {
+                delete ServerRequests[Name];
+                throw error;
+            });
+    }
+    return ServerRequests[Name];
+}
+
 async function LoadSDKData() {
     try {
         const StatusEl = document.getElementById('LoadingStatus');
         const ProgressBar = document.querySelector('.LoadingProgressBar');
-        const Response = await fetch('./Data/sdk_data.json', { cache: 'no-store' });
-        if (!Response.ok) throw new Error(`HTTP error! status: ${Response.status}`);
-        const Data = await Response.json();
+        const ServerClasses = await LoadServerClasses();
+        if (ServerClasses) {
+            ServerBackend = true;
+            const OutputClasses = { ...Classes };
+            ServerClasses.forEach(([name, parent, size]) => {
+                OutputClasses[name] = { n: name, p: parent || '', s: size || 0, m: null, t: 'class' };
+            });
+            Classes = OutputClasses;
+            ProgressBar.style.width = '100%';
+            StatusEl.textContent = `Loaded ${ServerClasses.length} classes`;
+            return true;
+        }
+        const Manifest = await LoadSDKManifest();
+        if (Manifest) {
+            ShardManifest = Manifest;
+            const OutputClasses = { ...Classes };
+            Object.keys(Manifest.classes).forEach(name => {
+                const [shard, size, , parent] = Manifest.classes[name];
+                OutputClasses[name] = { n: name, p: parent || '', s: size || 0, m: null, t: 'class', shard };
+            });
+            Classes = OutputClasses;
+            ProgressBar.style.width = '100%';
+            StatusEl.textContent = `Loaded ${Object.keys(Manifest.classes).length} classes`;
+            return true;
+        }
+        const Hash = DataHash('sdk_data.json');
+        let Data = Hash ? LoadFromCache(Hash) || await PatchCachedData(Hash) : null;
+        if (!Data) {
+            const Response = await FetchData('sdk_data.json');
+            if (!Response.ok) throw new Error(`HTTP error! status: ${Response.status}`);
+            Data = await Response.json();
+            if (Hash) SaveToCache(Data, Hash);
+        }
         let ClassArray = [];
-        if (Array.isArray(Data)) ClassArray = Data; else if (Data.Classes && Array.isArray(Data.Classes)) ClassArray = Data.Classes; else if (Data.classes && Array.isArray(Data.classes)) ClassArray = Data.classes;
+        if (Data && Data.schema === 2) ClassArray = DecodeSchemaV2(Data); else if (Array.isArray(Data)) ClassArray = Data; else if (Data.Classes && Array.isArray(Data.Classes)) ClassArray = Data.Classes; else if (Data.classes && Array.isArray(Data.classes)) ClassArray = Data.classes;
         const Total = ClassArray.length || 0;
         StatusEl.textContent = `Loading classes... 0 / ${Total}`;
         ProgressBar.style.width = '0%';
@@ -80,21 +307,8 @@ async function LoadSDKData() {
         for (let i = 0; i < Total; i += BatchSize) {
             const batch = ClassArray.slice(i, i + BatchSize);
             for (let j = 0; j < batch.length; j++) {
-                const cls = batch[j];
-                const name = (cls.N || cls.n || '').toString();
-                if (!name) continue;
-                OutputClasses[name] = {
-                    n: cls.N || cls.n || '',
-                    p: cls.P || cls.p || '',
-                    s: cls.S || cls.s || 0,
-                    m: Array.isArray(cls.M || cls.m) ? (cls.M || cls.m).map(member => ({
-                        n: (member && (member.N || member.n)) ? member.N || member.n : '',
-                        t: (member && (member.T || member.t)) ? member.T || member.t : '',
-                        o: (member && (member.O || member.o)) ? member.O || member.o : '',
-                        s: (member && (member.S || member.s)) ? member.S || member.s : ''
-                    })) : [],
-                    t: cls.T || cls.t || ''
-                };
+                const Normalized = NormalizeClass(batch[j]);
+                if (Normalized) OutputClasses[Normalized.n] = Normalized;
             }
             const processed = Math.min(i + BatchSize, Total);
             StatusEl.textContent = `Loading classes... ${processed} / ${Total}`;
@@ -112,7 +326,7 @@ async function LoadSDKData() {
 
 async function LoadGlobals() {
     try {
-        const res = await fetch('./Data/globals.json', { cache: 'no-store' });
+        const res = await FetchData('globals.json');
         if (!res.ok) return null;
         const data = await res.json();
         class Globals {
@@ -151,6 +365,7 @@ async function LoadGlobals() {
 async function InitializeViewer() {
     document.getElementById('LoadingOverlay').style.display = 'flex';
 
+    DataManifest = await LoadDataManifest();
     const globalsInstance = await LoadGlobals();
     Classes = {};
     try {
@@ -268,6 +483,18 @@ function PopulateClassList() {
 }
 
 function SelectClass(ClassName) {
+    const Target = Classes[ClassName];
+    if (Target && Target.m === null && (ServerBackend || ShardManifest)) {
+        (ServerBackend ? LoadServerClass(ClassName) : LoadShard(Target.shard))
+            .then(() => {
+                // Index and class data disagree; show the class empty rather than refetching forever
+                if (Classes[ClassName] && Classes[ClassName].m === null) Classes[ClassName].m = [];
+                SelectClass(ClassName);
+            })
+            .catch(error => console.error('Failed to load class:', error));
+        return;
+    }
+
     document.querySelectorAll('.ClassItem').forEach(item => { item.classList.remove('Active'); });
     if (Recycler && typeof Recycler.markActive === 'function') {
         Recycler.markActive(ClassName);
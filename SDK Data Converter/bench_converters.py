@@ -0,0 +1,283 @@
+"""
+Benchmark both converters on a synthetic corpus
+
+Generates (or reuses) a deterministic corpus with sdk_corpus.py, then runs
+every case in a fresh child process so peak memory belongs to that case
+alone. Wall time, files/sec, members/sec and peak RSS are recorded per
+converter and per phase and written as JSON, so runs on different commits
+can be compared with --compare.
+
+Usage:
+    python bench_converters.py [--classes 15000] [--members 16] [-o bench_results.json]
+    python bench_converters.py --compare bench_results.json -o bench_new.json
+"""
+
+import argparse
+import contextlib
+import importlib.util
+import json
+import logging
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import sdk_corpus
+from sdk_metrics import get_peak_rss
+from sdk_writer import write_json_atomic
+
+
+SCRIPT_DIR = Path(__file__).parent
+RESULTS_VERSION = 1
+CORPUS_INFO = "corpus.json"
+
+# name -> (converter, mode)
+CASES = {
+    "convert_sdk": ("convert_sdk.py", "serial"),
+    "convert_sdk_jobs": ("convert_sdk.py", "parallel"),
+    "convert_sdk_stream": ("convert_sdk.py", "stream"),
+    "single_hpp": ("single-hpp-to-json.py", "in-memory"),
+    "single_hpp_stream": ("single-hpp-to-json.py", "stream"),
+}
+
+
+def load_hpp_module():
+    """single-hpp-to-json.py isn't importable by name, load it from its path"""
+    spec = importlib.util.spec_from_file_location("single_hpp_to_json", SCRIPT_DIR / "single-hpp-to-json.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class PhaseTimer:
+    """Collects wall time and the RSS high-water mark at the end of each phase"""
+
+    def __init__(self):
+        self.phases: Dict[str, Dict] = {}
+
+    @contextlib.contextmanager
+    def phase(self, name: str):
+        start = time.perf_counter()
+        yield
+        self.phases[name] = {"seconds": time.perf_counter() - start, "peak_rss_after": get_peak_rss()}
+
+
+def _run_convert_sdk(corpus: Path, work: Path, jobs: int, stream: bool = False) -> Dict:
+    from convert_sdk import FortniteSDKConverter
+
+    converter = FortniteSDKConverter()
+    timer = PhaseTimer()
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        if stream:
+            with timer.phase("stream"):
+                converter.convert_sdk_streaming(str(corpus / "SDK"), str(work), jobs=jobs)
+        else:
+            with timer.phase("parse"):
+                converter.convert_sdk_directory(str(corpus / "SDK"), jobs=jobs)
+            with timer.phase("write"):
+                converter.save_to_json(str(work))
+
+    return {
+        "files": len(list((corpus / "SDK").rglob("*.h"))),
+        "classes": converter.metrics.counters["classes"],
+        "members": converter.metrics.counters["members"],
+        "output_bytes": os.path.getsize(work / "sdk_data.json"),
+        "phases": timer.phases,
+    }
+
+
+def _run_single_hpp(corpus: Path, work: Path, stream: bool) -> Dict:
+    module = load_hpp_module()
+    # INFO like the CLI, but no handler I/O so only the converter itself is measured
+    logger = logging.getLogger("HPPConverter.bench")
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    logger.handlers[:] = [logging.NullHandler()]
+
+    converter = module.HPPToJSONConverter(logger)
+    output = work / "sdk_data.json"
+    timer = PhaseTimer()
+    if stream:
+        with timer.phase("stream"):
+            converter.convert_streaming(corpus / "dump.hpp", output)
+    else:
+        with timer.phase("parse"):
+            converter.parse_hpp_file(corpus / "dump.hpp")
+        with timer.phase("write"):
+            converter.save_to_json(output)
+
+    return {
+        "files": 1,
+        "classes": converter.completed_count,
+        "members": converter.stats.members_found,
+        "output_bytes": os.path.getsize(output),
+        "phases": timer.phases,
+    }
+
+
+def run_case(name: str, corpus: Path, jobs: int) -> Dict:
+    """Run one case in this process and return its metrics"""
+    with tempfile.TemporaryDirectory(prefix="bench_") as work_dir:
+        work = Path(work_dir)
+        start = time.perf_counter()
+        if name == "convert_sdk":
+            result = _run_convert_sdk(corpus, work, jobs=1)
+        elif name == "convert_sdk_jobs":
+            result = _run_convert_sdk(corpus, work, jobs=jobs)
+        elif name == "convert_sdk_stream":
+            result = _run_convert_sdk(corpus, work, jobs=1, stream=True)
+        elif name == "single_hpp":
+            result = _run_single_hpp(corpus, work, stream=False)
+        else:
+            result = _run_single_hpp(corpus, work, stream=True)
+        wall = time.perf_counter() - start
+
+    converter, mode = CASES[name]
+    if name == "convert_sdk_jobs":
+        mode = f"jobs={jobs}"
+
+    for phase in result["phases"].values():
+        seconds = phase["seconds"]
+        phase["files_per_sec"] = result["files"] / seconds if seconds > 0 else None
+        phase["members_per_sec"] = result["members"] / seconds if seconds > 0 else None
+
+    return dict(
+        result,
+        case=name,
+        converter=converter,
+        mode=mode,
+        wall_seconds=wall,
+        files_per_sec=result["files"] / wall if wall > 0 else None,
+        members_per_sec=result["members"] / wall if wall > 0 else None,
+        peak_rss=get_peak_rss(),
+    )
+
+
+def run_case_isolated(name: str, corpus: Path, jobs: int) -> Dict:
+    """Run one case in a fresh interpreter and collect its JSON result"""
+    completed = subprocess.run(
+        [sys.executable, str(Path(__file__).resolve()), "--run-case", name, "--corpus", str(corpus), "--jobs", str(jobs)],
+        cwd=str(SCRIPT_DIR), capture_output=True, text=True,
+    )
+    if completed.returncode != 0:
+        raise RuntimeError(f"Case {name} failed:\n{completed.stderr}")
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def prepare_corpus(corpus: Path, classes: int, members: int, seed: int) -> Dict:
+    """Generate the corpus unless one with the same parameters is already there"""
+    params = {"classes": classes, "members": members, "seed": seed}
+    info_path = corpus / CORPUS_INFO
+    if info_path.exists():
+        with open(info_path, 'r', encoding='utf-8') as f:
+            info = json.load(f)
+        if info.get("params") == params:
+            print(f"🧪 Reusing corpus in {corpus}")
+            return info
+
+    print(f"🧪 Generating corpus in {corpus} ({classes:,} classes, ~{members} members each)...")
+    info = {
+        "params": params,
+        "dumper7": sdk_corpus.generate_dumper7(str(corpus / "SDK"), classes, members, seed=seed),
+        "hpp": sdk_corpus.generate_hpp(str(corpus / "dump.hpp"), classes, members, seed=seed),
+    }
+    write_json_atomic(str(info_path), info)
+    return info
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        completed = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=str(SCRIPT_DIR),
+                                   capture_output=True, text=True, timeout=10)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return completed.stdout.strip() or None
+
+
+def _format_rate(value: Optional[float]) -> str:
+    return f"{value:,.0f}" if value is not None else "n/a"
+
+
+def print_results(results: List[Dict]):
+    for result in results:
+        peak = result["peak_rss"]
+        print(f"  {result['converter']:22} {result['mode']:10} {result['wall_seconds']:8.2f}s  "
+              f"{_format_rate(result['files_per_sec']):>8} files/s  {_format_rate(result['members_per_sec']):>10} members/s  "
+              f"peak {peak / 1024 / 1024 if peak else 0:7.1f} MB")
+        for name, phase in result["phases"].items():
+            print(f"      {name:8} {phase['seconds']:8.2f}s  {_format_rate(phase['members_per_sec']):>10} members/s")
+
+
+def print_comparison(old: Dict, new: Dict):
+    """Per case and phase: old time, new time and speedup"""
+    old_results = {result["case"]: result for result in old.get("results", [])}
+    print(f"📊 Compared with {old.get('commit') or 'previous run'} ({old.get('created', '?')}):")
+    for result in new["results"]:
+        previous = old_results.get(result["case"])
+        if previous is None:
+            continue
+        rows = [("total", previous["wall_seconds"], result["wall_seconds"])]
+        rows += [(name, previous["phases"][name]["seconds"], phase["seconds"])
+                 for name, phase in result["phases"].items() if name in previous.get("phases", {})]
+        for name, before, after in rows:
+            speedup = before / after if after > 0 else float('inf')
+            print(f"  {result['case']:18} {name:8} {before:8.2f}s -> {after:8.2f}s  ({speedup:.2f}x)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the SDK converters on a synthetic corpus')
+    parser.add_argument('--classes', type=int, default=15000, help='Classes in the corpus (default: %(default)s)')
+    parser.add_argument('--members', type=int, default=16, help='Average members per class (default: %(default)s)')
+    parser.add_argument('--seed', type=int, default=sdk_corpus.DEFAULT_SEED)
+    parser.add_argument('--corpus', help='Directory to keep the corpus in (default: a temp dir)')
+    parser.add_argument('-j', '--jobs', type=int, default=0, help='Workers for the parallel case (0 = all cores)')
+    parser.add_argument('--cases', nargs='+', choices=list(CASES), default=list(CASES))
+    parser.add_argument('--repeat', type=int, default=1, help='Run each case N times and keep the fastest')
+    parser.add_argument('-o', '--output', default='bench_results.json', help='Results JSON (default: %(default)s)')
+    parser.add_argument('--compare', help='Earlier results JSON to compare against')
+    parser.add_argument('--run-case', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+
+    if args.run_case:
+        # Child process: run one case and report on the last stdout line
+        print(json.dumps(run_case(args.run_case, Path(args.corpus), jobs)))
+        return
+
+    with contextlib.ExitStack() as stack:
+        corpus = Path(args.corpus) if args.corpus else Path(stack.enter_context(tempfile.TemporaryDirectory(prefix="sdk_corpus_")))
+        info = prepare_corpus(corpus, args.classes, args.members, args.seed)
+
+        results = []
+        for name in args.cases:
+            print(f"⏱️  {name}...")
+            runs = [run_case_isolated(name, corpus, jobs) for _ in range(max(1, args.repeat))]
+            results.append(min(runs, key=lambda run: run["wall_seconds"]))
+
+    report = {
+        "version": RESULTS_VERSION,
+        "created": datetime.now().isoformat(timespec='seconds'),
+        "commit": _git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "corpus": info,
+        "results": results,
+    }
+    write_json_atomic(args.output, report)
+
+    print_results(results)
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            print_comparison(json.load(f), report)
+    print(f"💾 Wrote {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+"""
+Micro-benchmark for FortniteSDKConverter.parse_members_dumper7
+
+Builds one large synthetic Dumper-7 class body that mixes all four member
+comment styles with access specifiers, comment lines and padding, then times
+the single-pass matcher against the original four-regex cascade.
+
+Usage:
+    python bench_members.py [--members 50000] [--repeat 5]
+"""
+
+import argparse
+import random
+import re
+import time
+
+from convert_sdk import FortniteSDKConverter
+
+
+MEMBER_TYPES = [
+    'int32', 'float', 'bool', 'uint8', 'double', 'uint64',
+    'class AActor*', 'struct FVector', 'struct FName',
+    'TArray<class UObject*>', 'TMap<struct FName, int32>',
+    'unsigned char', 'unsigned long long', 'class USceneComponent*',
+]
+
+COMMENT_STYLES = [
+    '// 0x{o:04X}(0x{s:04X})(Edit, BlueprintVisible, NativeAccessSpecifierPublic)',
+    '// 0x{o:04X} (0x{s:04X})',
+    '// 0x{o:04X}',
+    '// Offset: 0x{o:X}, Size: 0x{s:X}',
+]
+
+
+def build_class_body(member_count: int, seed: int = 1337) -> str:
+    """Synthetic class body with `member_count` member lines plus noise lines"""
+    rng = random.Random(seed)
+    lines = []
+    offset = 0x28
+    for i in range(member_count):
+        if i % 50 == 0:
+            lines.append(rng.choice(['public:', 'protected:', 'private:']))
+        if i % 25 == 0:
+            lines.append('// Function Engine.Actor.K2_GetActorLocation')
+        size = rng.choice([1, 2, 4, 8, 0x10, 0x18])
+        if i % 40 == 39:
+            name = f'Pad_{offset:X}'
+            member_type = f'uint8 {name}[0x{size:X}]'
+            lines.append(f'\t{member_type}; // 0x{offset:04X}(0x{size:04X})(Fixing Size After Last Property)')
+        else:
+            style = rng.choice(COMMENT_STYLES)
+            member_type = rng.choice(MEMBER_TYPES)
+            lines.append(f'\t{member_type} Member{i}; ' + style.format(o=offset, s=size))
+        offset += size
+    return '\n'.join(lines)
+
+
+def parse_members_cascade(converter: FortniteSDKConverter, class_body: str):
+    """The original implementation: four uncompiled regexes tried per line"""
+    members = []
+    for line in class_body.split('\n'):
+        line = line.strip()
+        if not line:
+            continue
+        if line in ['public:', 'private:', 'protected:'] or line.startswith('//'):
+            continue
+
+        member_patterns = [
+            r'^([A-Za-z0-9_:<>,\s\*\[\]&]+)\s+([A-Za-z0-9_]+);\s*//\s*0x([0-9A-Fa-f]+)\(0x([0-9A-Fa-f]+)\)',
+            r'^([A-Za-z0-9_:<>,\s\*\[\]&]+)\s+([A-Za-z0-9_]+);\s*//\s*0x([0-9A-Fa-f]+)\s*\(0x([0-9A-Fa-f]+)\)',
+            r'^([A-Za-z0-9_:<>,\s\*\[\]&]+)\s+([A-Za-z0-9_]+);\s*//\s*0x([0-9A-Fa-f]+)',
+            r'^([A-Za-z0-9_:<>,\s\*\[\]&]+)\s+([A-Za-z0-9_]+);\s*//\s*Offset:\s*0x([0-9A-Fa-f]+)(?:,\s*Size:\s*0x([0-9A-Fa-f]+))?',
+        ]
+
+        for pattern in member_patterns:
+            match = re.match(pattern, line)
+            if match:
+                member_type = clean_type_name_legacy(match.group(1))
+                member_name = match.group(2).strip()
+                offset = match.group(3).strip()
+                if len(match.groups()) >= 4 and match.group(4):
+                    size = match.group(4).strip()
+                else:
+                    size = converter.guess_type_size(member_type)
+                if converter.should_skip_member(member_name):
+                    continue
+                members.append({
+                    "N": member_name,
+                    "T": member_type,
+                    "O": f"0x{offset.upper()}",
+                    "S": f"0x{size.upper()}" if isinstance(size, str) else f"0x{size:X}"
+                })
+                break
+
+    members.sort(key=lambda x: int(x["O"], 16))
+    return members
+
+
+def clean_type_name_legacy(type_name: str) -> str:
+    """The original clean_type_name: two re.sub calls and seven replaces, uncached"""
+    type_name = re.sub(r'\s+', ' ', type_name.strip())
+    type_name = re.sub(r'\b(class|struct|enum)\s+', '', type_name)
+    replacements = {
+        'unsigned char': 'uint8',
+        'unsigned short': 'uint16',
+        'unsigned int': 'uint32',
+        'unsigned long long': 'uint64',
+        'signed char': 'int8',
+        'short': 'int16',
+        'long long': 'int64',
+    }
+    for old, new in replacements.items():
+        type_name = type_name.replace(old, new)
+    return type_name.strip()
+
+
+def best_time(func, repeat: int) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark Dumper-7 member parsing')
+    parser.add_argument('--members', type=int, default=50000, help='Member lines in the synthetic class body')
+    parser.add_argument('--repeat', type=int, default=5, help='Timed runs per implementation (best is reported)')
+    args = parser.parse_args()
+
+    converter = FortniteSDKConverter()
+    body = build_class_body(args.members)
+
+    expected = parse_members_cascade(converter, body)
+    actual = converter.parse_members_dumper7(body)
+    if [member.to_dict() for member in actual] != expected:
+        raise SystemExit("❌ Single-pass matcher output differs from the four-regex cascade")
+
+    member_count = len(actual)
+    cascade = best_time(lambda: parse_members_cascade(converter, body), args.repeat)
+    single = best_time(lambda: converter.parse_members_dumper7(body), args.repeat)
+
+    print(f"📦 {args.members:,} member lines, {member_count:,} members kept (outputs identical)")
+    print(f"🐢 Four-regex cascade:  {cascade * 1000:8.1f} ms  {member_count / cascade:12,.0f} members/sec")
+    print(f"🚀 Single-pass matcher: {single * 1000:8.1f} ms  {member_count / single:12,.0f} members/sec")
+    print(f"📊 Speedup: {cascade / single:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+Benchmark the trigram search index against a brute-force scan
+
+Uses a converted sdk_data.json when given, otherwise a synthetic dataset the
+size of a full Fortnite SDK (~15k classes, ~250k members).
+
+Usage:
+    python bench_search.py [--sdk ../Latest/Data/sdk_data.json] [--classes 15000] [--members 250000]
+"""
+
+import argparse
+import json
+import random
+import time
+
+from sdk_schema import load_classes
+from sdk_search import SearchIndex, brute_force_search, build_search_index
+
+
+WORDS = [
+    'Fort', 'Player', 'Pawn', 'Weapon', 'Vehicle', 'Mesh', 'Component', 'Actor', 'Camera',
+    'Manager', 'State', 'Controller', 'Ability', 'Inventory', 'Item', 'Pickup', 'Building',
+    'Projectile', 'Health', 'Shield', 'Ammo', 'Reload', 'Target', 'Team', 'Score', 'Anim',
+    'Movement', 'Skeletal', 'Scene', 'Widget', 'Athena', 'Habanero', 'Gameplay', 'Effect',
+    'Cue', 'Damage', 'Location', 'Rotation', 'Velocity', 'Bone', 'Socket', 'Data', 'Asset',
+]
+
+QUERIES = [
+    'fortpawn', 'currentweapon', 'mesh', 'component', 'health', '0x1b0', '0x990',
+    'skeletal', 'playerstate', 'projectilespeed', 'habanero', 'zzqx', 'bone', 'ammo',
+]
+
+
+def synthetic_classes(class_count: int, member_count: int, seed: int = 7):
+    rng = random.Random(seed)
+    per_class = max(1, member_count // class_count)
+    classes = []
+    for i in range(class_count):
+        name = rng.choice('AUF') + ''.join(rng.sample(WORDS, 3)) + str(i)
+        members = []
+        offset = 0x28
+        for j in range(rng.randint(0, per_class * 2)):
+            size = rng.choice([1, 4, 8, 0x10, 0x18])
+            members.append({"N": ''.join(rng.sample(WORDS, 2)) + str(j), "T": "int32",
+                            "O": f"0x{offset:X}", "S": f"0x{size:X}"})
+            offset += size
+        classes.append({"N": name, "P": "", "S": offset, "T": "class", "M": members})
+    return classes
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark trigram search vs brute-force scan')
+    parser.add_argument('--sdk', help='Converted sdk_data.json to use instead of synthetic data')
+    parser.add_argument('--classes', type=int, default=15000)
+    parser.add_argument('--members', type=int, default=250000)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--limit', type=int, default=30,
+                        help='Results per query, like the viewer dropdown (0 = all)')
+    args = parser.parse_args()
+
+    if args.sdk:
+        classes = load_classes(args.sdk)
+    else:
+        classes = synthetic_classes(args.classes, args.members)
+    total_members = sum(len(c["M"]) for c in classes)
+    print(f"📦 {len(classes):,} classes, {total_members:,} members")
+
+    start = time.perf_counter()
+    data = build_search_index(classes)
+    build_time = time.perf_counter() - start
+    index_bytes = len(json.dumps(data, separators=(',', ':')))
+    index = SearchIndex(data)
+    print(f"🔨 Built index in {build_time:.2f}s ({index_bytes / 1024 / 1024:.2f} MB, {len(data['postings']):,} trigrams)")
+
+    limit = args.limit or None
+    brute_total = 0.0
+    index_total = 0.0
+    for query in QUERIES:
+        expected = brute_force_search(classes, query, limit)
+        actual = index.search(query, limit)
+        if actual != expected:
+            raise SystemExit(f"❌ Results differ for {query!r}")
+
+        brute = min(_timed(lambda: brute_force_search(classes, query, limit)) for _ in range(args.repeat))
+        indexed = min(_timed(lambda: index.search(query, limit)) for _ in range(args.repeat))
+        brute_total += brute
+        index_total += indexed
+        print(f"  {query:18} {len(actual):7,} hits  scan {brute * 1000:8.2f} ms  index {indexed * 1000:8.2f} ms  "
+              f"{brute / indexed if indexed else float('inf'):7.1f}x")
+
+    print(f"📊 Limit {limit or 'none'} - total: scan {brute_total * 1000:.1f} ms, index {index_total * 1000:.1f} ms "
+          f"({brute_total / index_total:.1f}x faster, results identical)")
+
+
+def _timed(func) -> float:
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    main()
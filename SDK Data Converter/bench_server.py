@@ -0,0 +1,220 @@
+"""
+Load test for sdk_server.py
+
+Starts the server on a converted sdk_data.json in a child process (or targets a
+running one with --url), then hammers it from keep-alive client threads with a
+mix of /class, /search, /offset and If-None-Match revalidations. Reports
+requests/sec overall and per endpoint with p50/p99 latency. --lookups also
+times SDKStore lookups in this process, without HTTP in the way.
+
+Usage:
+    python bench_server.py --sdk ../Latest/Data/sdk_data.json [--threads 4] [--duration 5]
+    python bench_server.py --url http://127.0.0.1:8000
+"""
+
+import argparse
+import http.client
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+from urllib.parse import quote, urlsplit
+
+from bench_search import QUERIES
+from sdk_writer import write_json_atomic
+
+
+SCRIPT_DIR = Path(__file__).parent
+STARTUP_TIMEOUT = 300
+ENDPOINTS = ("class", "search", "offset", "revalidate")
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def start_server(sdk_file: str) -> Tuple[subprocess.Popen, str]:
+    """Run sdk_server.py on a free port and wait until it answers"""
+    port = _free_port()
+    process = subprocess.Popen([sys.executable, str(SCRIPT_DIR / "sdk_server.py"), sdk_file, "--port", str(port)],
+                               cwd=str(SCRIPT_DIR), stdout=subprocess.DEVNULL)
+    url = f"http://127.0.0.1:{port}"
+    deadline = time.monotonic() + STARTUP_TIMEOUT
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"sdk_server.py exited with code {process.returncode}")
+        try:
+            connection = http.client.HTTPConnection("127.0.0.1", port, timeout=5)
+            connection.request("GET", "/classes")
+            if connection.getresponse().status == 200:
+                connection.close()
+                return process, url
+        except OSError:
+            time.sleep(0.2)
+    process.kill()
+    raise RuntimeError("sdk_server.py did not start in time")
+
+
+def build_targets(url: str, count: int, seed: int) -> Tuple[List[Tuple[str, str]], str]:
+    """(endpoint, path) requests drawn from the server's own class list, plus the server's ETag"""
+    parts = urlsplit(url)
+    connection = http.client.HTTPConnection(parts.hostname, parts.port)
+    connection.request("GET", "/classes")
+    response = connection.getresponse()
+    etag = response.getheader("ETag")
+    classes = json.loads(response.read())["classes"]
+
+    rng = random.Random(seed)
+    sample = rng.sample(classes, min(len(classes), count))
+    targets = []
+    for name, _, _, members in sample:
+        path = f"/class/{quote(name)}"
+        targets.append(("class", path))
+        targets.append(("revalidate", path))
+        if members:
+            connection.request("GET", path)
+            record = json.loads(connection.getresponse().read())
+            member = rng.choice(record["M"])
+            targets.append(("offset", f"/offset/{quote(name)}/{member['O']}"))
+    for query in QUERIES:
+        targets.append(("search", f"/search?q={quote(query)}"))
+    connection.close()
+    return targets, etag
+
+
+def _client(url: str, targets: List[Tuple[str, str]], etag: str, stop: threading.Event, seed: int,
+            latencies: Dict[str, List[float]], errors: List[str]):
+    parts = urlsplit(url)
+    connection = http.client.HTTPConnection(parts.hostname, parts.port, timeout=30)
+    rng = random.Random(seed)
+    plain = {"Accept-Encoding": "gzip"}
+    conditional = {"Accept-Encoding": "gzip", "If-None-Match": etag}
+    while not stop.is_set():
+        endpoint, path = rng.choice(targets)
+        start = time.perf_counter()
+        try:
+            connection.request("GET", path, headers=conditional if endpoint == "revalidate" else plain)
+            response = connection.getresponse()
+            response.read()
+        except (OSError, http.client.HTTPException) as e:
+            errors.append(f"{path}: {e}")
+            connection.close()
+            connection = http.client.HTTPConnection(parts.hostname, parts.port, timeout=30)
+            continue
+        latencies[endpoint].append(time.perf_counter() - start)
+        if response.status not in (200, 304, 404):
+            errors.append(f"{path}: HTTP {response.status}")
+    connection.close()
+
+
+def _percentile(values: List[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))] if ordered else 0.0
+
+
+def run_load(url: str, targets: List[Tuple[str, str]], etag: str, threads: int, duration: float,
+             seed: int) -> Dict:
+    latencies = [{endpoint: [] for endpoint in ENDPOINTS} for _ in range(threads)]
+    errors: List[str] = []
+    stop = threading.Event()
+    workers = [threading.Thread(target=_client, args=(url, targets, etag, stop, seed + i, latencies[i], errors))
+               for i in range(threads)]
+    start = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    time.sleep(duration)
+    stop.set()
+    for worker in workers:
+        worker.join()
+    elapsed = time.perf_counter() - start
+
+    merged = {endpoint: [value for per_thread in latencies for value in per_thread[endpoint]] for endpoint in ENDPOINTS}
+    total = sum(len(values) for values in merged.values())
+    return {
+        "threads": threads,
+        "seconds": elapsed,
+        "requests": total,
+        "requests_per_sec": total / elapsed,
+        "errors": len(errors),
+        "endpoints": {
+            endpoint: {"requests": len(values), "requests_per_sec": len(values) / elapsed,
+                       "p50_ms": _percentile(values, 0.5) * 1000, "p99_ms": _percentile(values, 0.99) * 1000}
+            for endpoint, values in merged.items()
+        },
+    }
+
+
+def time_lookups(sdk_file: str, targets: List[Tuple[str, str]]) -> Dict[str, Dict[str, float]]:
+    """Microseconds per SDKStore.response() call, first (rendered) and repeated (cached)"""
+    from sdk_server import SDKStore
+
+    store = SDKStore(sdk_file)
+    results = {}
+    for endpoint in ("class", "search", "offset"):
+        paths = [path for name, path in targets if name == endpoint]
+        start = time.perf_counter()
+        for path in paths:
+            store.response(path)
+        first = (time.perf_counter() - start) / len(paths)
+        start = time.perf_counter()
+        for path in paths:
+            store.response(path)
+        cached = (time.perf_counter() - start) / len(paths)
+        results[endpoint] = {"first_us": first * 1e6, "cached_us": cached * 1e6}
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Load-test sdk_server.py and report requests/sec')
+    parser.add_argument('--sdk', default=str(SCRIPT_DIR / '..' / 'Latest' / 'Data' / 'sdk_data.json'),
+                        help='sdk_data.json to serve (default: %(default)s)')
+    parser.add_argument('--url', help='Benchmark an already running server instead of starting one')
+    parser.add_argument('-t', '--threads', type=int, default=4, help='Client threads (default: %(default)s)')
+    parser.add_argument('-d', '--duration', type=float, default=5.0, help='Seconds of load (default: %(default)s)')
+    parser.add_argument('--targets', type=int, default=500, help='Classes sampled for the request mix (default: %(default)s)')
+    parser.add_argument('--seed', type=int, default=7)
+    parser.add_argument('--lookups', action='store_true', help='Also time SDKStore lookups in-process')
+    parser.add_argument('-o', '--output', help='Write the results as JSON')
+    args = parser.parse_args()
+
+    process = None
+    url = args.url
+    if url is None:
+        print(f"🚀 Starting sdk_server.py on {args.sdk}...")
+        process, url = start_server(args.sdk)
+    try:
+        targets, etag = build_targets(url, args.targets, args.seed)
+        print(f"⏱️  {args.threads} threads x {args.duration:.0f}s against {url} ({len(targets):,} distinct requests)")
+        report = run_load(url, targets, etag, args.threads, args.duration, args.seed)
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait()
+
+    print(f"  total      {report['requests_per_sec']:9,.0f} req/s  ({report['requests']:,} requests, "
+          f"{report['errors']} errors)")
+    for endpoint, stats in report["endpoints"].items():
+        print(f"  {endpoint:10} {stats['requests_per_sec']:9,.0f} req/s  p50 {stats['p50_ms']:6.2f} ms  "
+              f"p99 {stats['p99_ms']:6.2f} ms")
+
+    if args.lookups and os.path.exists(args.sdk):
+        report["lookups"] = time_lookups(args.sdk, targets)
+        print("🔬 In-process lookups:")
+        for endpoint, stats in report["lookups"].items():
+            print(f"  {endpoint:10} first {stats['first_us']:8.1f} µs  cached {stats['cached_us']:6.1f} µs")
+
+    if args.output:
+        write_json_atomic(args.output, report)
+        print(f"💾 Wrote {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,98 +3,658 @@
 
 import os 
 import re 
+import sys 
 import json 
+import hashlib 
+import queue 
+import threading 
+import time 
+from collections import deque 
+from operator import attrgetter 
 from pathlib import Path 
-from typing import List ,Dict ,Any 
+from typing import List ,Dict ,Any ,Optional ,Tuple 
+from concurrent .futures import ProcessPoolExecutor ,as_completed 
+
+from sdk_writer import StreamingJSONWriter ,write_json_atomic 
+from sdk_schema import SCHEMA_V1 ,add_schema_argument ,load_classes ,open_sdk_writer 
+from sdk_outputs import add_output_arguments ,remove_stale_outputs ,wants_extra_outputs ,write_extra_outputs 
+from sdk_shards import package_from_filename 
+from sdk_metrics import Metrics ,add_profile_argument ,run_profiled ,wants_breakdown 
+from sdk_records import UPPER_HEX_FORMATS ,ClassRecord ,MemberRecord ,to_dicts 
+
+# Batches handed to each worker process; more batches balance better but cost more IPC
+PARALLEL_BATCHES_PER_JOB =8 
+
+# Files buffered between the reader, parser and writer stages of convert_sdk_streaming;
+# together with the files in flight in the pool this bounds the pipeline's memory
+PIPELINE_QUEUE_SIZE =16 
+
+# Seconds between polls of the SDK directory in --watch mode
+WATCH_INTERVAL =0.25 
+
+# Incremental cache kept next to the output; bump CACHE_VERSION when the entry layout changes
+# (version 2 stores classes as sdk_records rows instead of sdk_data.json dicts)
+CACHE_FILE ="sdk_cache.json"
+CACHE_VERSION =2 
+
+# One matcher for every Dumper-7 member comment style:
+#   Type Name; // 0x0010(0x0008)     Type Name; // 0x0010 (0x0008)
+#   Type Name; // 0x0010             Type Name; // Offset: 0x10, Size: 0x8
+MEMBER_PATTERN =re .compile (
+r'^([A-Za-z0-9_:<>,\s\*\[\]&]+)\s+([A-Za-z0-9_]+);\s*//\s*'
+r'(?:0x([0-9A-Fa-f]+)(?:\s*\(0x([0-9A-Fa-f]+)\))?'
+r'|Offset:\s*0x([0-9A-Fa-f]+)(?:,\s*Size:\s*0x([0-9A-Fa-f]+))?)'
+)
+
+# Class size sources, see FortniteSDKConverter.build_size_index
+SIZE_COMMENT_PATTERN =re .compile (r'//\s*0x([0-9A-Fa-f]+)\s*\(0x[0-9A-Fa-f]+\)',re .IGNORECASE )
+HEX_COMMENT_PATTERN =re .compile (r'//\s*0x([0-9A-Fa-f]+)',re .IGNORECASE )
+SIZEOF_PATTERN =re .compile (r'sizeof\s*\(\s*([A-Za-z0-9_]+)\s*\)\s*==\s*0x([0-9A-Fa-f]+)',re .IGNORECASE )
+IDENTIFIER_PATTERN =re .compile (r'[A-Za-z0-9_]+')
+
+ACCESS_SPECIFIERS =frozenset (['public:','private:','protected:'])
+
+WHITESPACE_PATTERN =re .compile (r'\s+')
+ELABORATED_TYPE_PATTERN =re .compile (r'\b(class|struct|enum)\s+')
+
+# Applied in order; 'unsigned long long' must be rewritten before 'long long'
+TYPE_REPLACEMENTS =(
+('unsigned char','uint8'),
+('unsigned short','uint16'),
+('unsigned int','uint32'),
+('unsigned long long','uint64'),
+('signed char','int8'),
+('short','int16'),
+('long long','int64'),
+)
+
+_MEMBER_OFFSET =attrgetter ("offset")
+
+# Raw type spelling -> cleaned name; dumps reuse a few thousand spellings across all members
+_CLEAN_TYPE_CACHE :Dict [str ,str ]={}
 
 class FortniteSDKConverter :
     def __init__ (self ):
         self .classes =[]
+        # Header path relative to the SDK directory -> its classes, in conversion order
+        self .file_classes :Dict [str ,List [ClassRecord ]]={}
+        # --incremental cache entries of the last conversion, kept up to date by --watch
+        self .cache_entries :Dict [str ,Dict ]={}
+        self .class_packages ={}
         self .globals_data ={"bases":{},"offsets":{}}
+        self .metrics =Metrics ()
 
-    def convert_sdk_directory (self ,sdk_path :str )->None :
-
+    def find_header_files (self ,sdk_path :str )->List [Path ]:
+        """All .h files below sdk_path, in the order they are converted (empty if there are none)"""
         sdk_dir =Path (sdk_path )
 
         if not sdk_dir .exists ():
             print (f"❌ SDK directory not found: {sdk_path }")
-            return 
+            return []
 
 
         h_files =list (sdk_dir .rglob ("*.h"))
 
         if not h_files :
             print (f"❌ No .h files found in {sdk_path }")
-            return 
+            return []
 
         print (f"📦 Found {len (h_files )} .h files")
+        return h_files 
+
+    def convert_sdk_directory (self ,sdk_path :str ,jobs :int =1 ,cache_path :Optional [str ]=None )->None :
+
+        sdk_dir =Path (sdk_path )
+        h_files =self .find_header_files (sdk_path )
+        if not h_files :
+            return 
+
+        cache_entries ={}
+        cached ={}
+        hashes ={}
+        if cache_path :
+            with self .metrics .phase ("cache"):
+                cache_entries =self .load_cache (cache_path )
+                for i ,h_file in enumerate (h_files ):
+                    entry ,hashes [i ]=self .lookup_cache (cache_entries ,h_file .relative_to (sdk_dir ).as_posix (),h_file )
+                    if entry is not None :
+                        cached [i ]=entry 
+            self .metrics .count ("files_cached",len (cached ))
+            print (f"♻️  Reusing {len (cached )} unchanged files from cache, reparsing {len (h_files )-len (cached )}")
+
         print (f"🔄 Processing SDK files...")
 
         processed =0 
         classes_found =0 
         members_found =0 
 
-        for h_file in h_files :
+        to_parse =[i for i in range (len (h_files ))if i not in cached ]
+        parse_files =[h_files [i ]for i in to_parse ]
+
+        if jobs >1 and len (parse_files )>1 :
+            parsed =self .parse_files_parallel (parse_files ,jobs )
+        else :
+            parsed =(self .parse_header_batch ([(i ,str (h_file ))])[0 ]for i ,h_file in enumerate (parse_files ))
+
+        new_entries ={}
+        for index ,h_file in enumerate (h_files ):
+            if index in cached :
+                entry =cached [index ]
+                file_classes ,error =[ClassRecord .from_row (row )for row in entry ["classes"]],None 
+            else :
+                _ ,file_classes ,error =next (parsed )
+                entry ={"classes":[c .to_row ()for c in file_classes ]}if cache_path else None 
+
+            if error is not None :
+                print (f"❌ Error processing {h_file .name }: {error }")
+                self .metrics .count ("files_failed")
+                continue 
+
+            if cache_path :
+                stat =h_file .stat ()
+                entry ["size"]=stat .st_size 
+                entry ["mtime"]=stat .st_mtime_ns 
+                entry ["hash"]=hashes .get (index )or self .hash_file (h_file )
+                new_entries [h_file .relative_to (sdk_dir ).as_posix ()]=entry 
+
+            self .file_classes [h_file .relative_to (sdk_dir ).as_posix ()]=file_classes 
+            if file_classes :
+                self .classes .extend (file_classes )
+                package =package_from_filename (h_file .name )
+                for c in file_classes :
+                    self .class_packages [c .name ]=package 
+                classes_found +=len (file_classes )
+                members_found +=sum (len (c .members )for c in file_classes )
+
+            processed +=1 
+
+            if processed %1000 ==0 :
+                print (f"  📄 Processed {processed } files, found {classes_found } classes with {members_found } members...")
+
+        print (f"✅ Processed {processed } files")
+        print (f"🎯 Found {len (self .classes )} classes with {members_found } total members")
+
+        self .metrics .count ("classes",len (self .classes ))
+        self .metrics .count ("members",members_found )
+
+        if cache_path :
+            self .cache_entries =new_entries 
+            with self .metrics .phase ("cache"):
+                self .save_cache (cache_path ,new_entries )
+            print (f"💾 Saved cache for {len (new_entries )} files to {cache_path }")
+
+    def convert_sdk_streaming (self ,sdk_path :str ,output_dir :str ="Data",jobs :int =1 ,
+    cache_path :Optional [str ]=None ,compact :bool =False ,schema :int =SCHEMA_V1 )->bool :
+        """Convert and write sdk_data.json in one pass, without keeping the classes in memory
+
+        A reader thread loads headers (or their cache entries), the calling thread
+        parses them (handing them to a process pool when jobs > 1) and a writer
+        thread serializes each class as soon as its file is parsed. The stages are
+        connected by queues of PIPELINE_QUEUE_SIZE files, so memory is bounded by
+        the files in flight rather than the size of the SDK. Output is byte-identical
+        to convert_sdk_directory followed by save_to_json; self.classes stays empty.
+
+        Returns:
+            True if sdk_data.json was written
+        """
+        sdk_dir =Path (sdk_path )
+        h_files =self .find_header_files (sdk_path )
+        if not h_files :
+            return False 
+
+        cache_entries ={}
+        if cache_path :
+            with self .metrics .phase ("cache"):
+                cache_entries =self .load_cache (cache_path )
+
+        print (f"🔄 Streaming SDK files through the pipeline...")
+
+        sdk_file =os .path .join (output_dir ,"sdk_data.json")
+        writer =open_sdk_writer (sdk_file ,schema ,indent =None if compact else 2 )
+        read_queue =queue .Queue (maxsize =PIPELINE_QUEUE_SIZE )
+        write_queue =queue .Queue (maxsize =PIPELINE_QUEUE_SIZE )
+        stop =threading .Event ()
+        failures =[]
+        new_entries ={}if cache_path else None 
+        totals ={"processed":0 ,"classes":0 ,"members":0 ,"first_output":None }
+
+        def run_stage (stage ,*args ):
             try :
-                with open (h_file ,'r',encoding ='utf-8',errors ='ignore')as f :
-                    content =f .read ()
+                stage (*args )
+            except BaseException as e :
+                failures .append (e )
+                stop .set ()
+
+        stages =[
+        threading .Thread (target =run_stage ,args =(self ._pipeline_read ,h_files ,sdk_dir ,cache_entries ,read_queue ,stop ),daemon =True ),
+        threading .Thread (target =run_stage ,args =(self ._pipeline_write ,h_files ,sdk_dir ,writer ,write_queue ,stop ,new_entries ,totals ),daemon =True ),
+        ]
+        for stage in stages :
+            stage .start ()
+        run_stage (self ._pipeline_parse ,h_files ,read_queue ,write_queue ,stop ,jobs )
+        for stage in stages :
+            stage .join ()
+
+        if failures :
+            writer .abort ()
+            raise failures [0 ]
+
+        with self .metrics .phase ("serialize"):
+            writer .close ()
+        self .metrics .count ("classes",totals ["classes"])
+        self .metrics .count ("members",totals ["members"])
+        self .metrics .count ("output_bytes",writer .bytes_written )
+
+        print (f"✅ Processed {totals ['processed']} files")
+        print (f"✅ Saved {totals ['classes']} classes with {totals ['members']} total members to {sdk_file }")
+        if totals ["first_output"]is not None :
+            print (f"⚡ First class written after {totals ['first_output']:.2f}s")
+        print (f"💾 Wrote {writer .summary ()}")
+
+        if cache_path :
+            with self .metrics .phase ("cache"):
+                self .save_cache (cache_path ,new_entries )
+            print (f"💾 Saved cache for {len (new_entries )} files to {cache_path }")
+
+        self .save_globals (output_dir )
+        return True 
+
+    def _pipeline_read (self ,h_files :List [Path ],sdk_dir :Path ,cache_entries :Dict [str ,Dict ],
+    read_queue :queue .Queue ,stop :threading .Event )->None :
+        """Reader stage: queue (index, content, cache entry, content hash, error) per file, in order"""
+        metrics =self .metrics 
+        for index ,h_file in enumerate (h_files ):
+            start =time .perf_counter ()
+            content ,entry ,content_hash ,error =None ,None ,None ,None 
+            if cache_entries :
+                entry ,content_hash =self .lookup_cache (cache_entries ,h_file .relative_to (sdk_dir ).as_posix (),h_file )
+            if entry is not None :
+                metrics .count ("files_cached")
+            else :
+                try :
+                    with open (h_file ,'r',encoding ='utf-8',errors ='ignore')as f :
+                        content =f .read ()
+                    metrics .count ("files")
+                    metrics .count ("chars_read",len (content ))
+                except Exception as e :
+                    error =str (e )
+            metrics .add_time ("read",time .perf_counter ()-start )
+            if not _pipeline_put (read_queue ,(index ,content ,entry ,content_hash ,error ),stop ):
+                return 
+        _pipeline_put (read_queue ,None ,stop )
+
+    def _pipeline_parse (self ,h_files :List [Path ],read_queue :queue .Queue ,write_queue :queue .Queue ,stop :threading .Event ,jobs :int )->None :
+        """Parser stage: turn read items into (index, classes, cache entry, content hash, error), keeping file order"""
+        if jobs <=1 :
+            while True :
+                item =_pipeline_get (read_queue ,stop )
+                if item is None :
+                    break 
+                index ,content ,entry ,content_hash ,error =item 
+                file_classes =[ClassRecord .from_row (row )for row in entry ["classes"]]if entry is not None else []
+                if content is not None :
+                    file_classes ,error =self .parse_header_content (content ,h_files [item [0 ]].name )
+                if not _pipeline_put (write_queue ,(index ,file_classes ,entry ,content_hash ,error ),stop ):
+                    return 
+            _pipeline_put (write_queue ,None ,stop )
+            return 
 
+        print (f"⚙️  Parsing with {jobs } worker processes")
+        # Results are collected strictly in submission order, so at most 2 * jobs files are in flight
+        in_flight =deque ()
+        with ProcessPoolExecutor (max_workers =jobs )as executor :
+            done =False 
+            while not done or in_flight :
+                while not done and len (in_flight )<jobs *2 :
+                    item =_pipeline_get (read_queue ,stop )
+                    if item is None :
+                        done =True 
+                        break 
+                    future =None 
+                    if item [1 ]is not None :
+                        future =executor .submit (_parse_header_content ,item [1 ],h_files [item [0 ]].name )
+                    in_flight .append ((item ,future ))
+                if not in_flight :
+                    break 
 
-                file_classes =self .parse_dumper7_format (content ,h_file .name )
+                (index ,_ ,entry ,content_hash ,error ),future =in_flight .popleft ()
+                file_classes =[ClassRecord .from_row (row )for row in entry ["classes"]]if entry is not None else []
+                if future is not None :
+                    try :
+                        file_classes ,error ,worker_metrics =future .result ()
+                        self .metrics .merge (worker_metrics )
+                    except Exception as e :
+                        file_classes ,error =[],str (e )
+                if not _pipeline_put (write_queue ,(index ,file_classes ,entry ,content_hash ,error ),stop ):
+                    executor .shutdown (cancel_futures =True )
+                    return 
+        _pipeline_put (write_queue ,None ,stop )
+
+    def _pipeline_write (self ,h_files :List [Path ],sdk_dir :Path ,writer :StreamingJSONWriter ,write_queue :queue .Queue ,
+    stop :threading .Event ,new_entries :Optional [Dict [str ,Dict ]],totals :Dict [str ,Any ])->None :
+        """Writer stage: serialize each parsed class, then record the file's package and cache entry"""
+        started =time .perf_counter ()
+        while True :
+            item =_pipeline_get (write_queue ,stop )
+            if item is None :
+                return 
+            index ,file_classes ,entry ,content_hash ,error =item 
+            h_file =h_files [index ]
+
+            if error is not None :
+                print (f"❌ Error processing {h_file .name }: {error }")
+                self .metrics .count ("files_failed")
+                continue 
 
-                if file_classes :
-                    self .classes .extend (file_classes )
-                    classes_found +=len (file_classes )
-                    members_found +=sum (len (c ["M"])for c in file_classes )
+            write_start =time .perf_counter ()
+            if file_classes :
+                package =package_from_filename (h_file .name )
+                for c in file_classes :
+                    writer .write (c .to_dict ())
+                    self .class_packages [c .name ]=package 
+                    totals ["members"]+=len (c .members )
+                totals ["classes"]+=len (file_classes )
+                if totals ["first_output"]is None :
+                    totals ["first_output"]=time .perf_counter ()-started 
+
+            if new_entries is not None :
+                entry =entry if entry is not None else {"classes":[c .to_row ()for c in file_classes ]}
+                stat =h_file .stat ()
+                entry ["size"]=stat .st_size 
+                entry ["mtime"]=stat .st_mtime_ns 
+                entry ["hash"]=content_hash or self .hash_file (h_file )
+                new_entries [h_file .relative_to (sdk_dir ).as_posix ()]=entry 
+            self .metrics .add_time ("serialize",time .perf_counter ()-write_start )
+
+            totals ["processed"]+=1 
+            if totals ["processed"]%1000 ==0 :
+                print (f"  📄 Processed {totals ['processed']} files, found {totals ['classes']} classes with {totals ['members']} members...")
+
+    def watch_sdk_directory (self ,sdk_path :str ,output_dir :str ="Data",jobs :int =1 ,cache_path :Optional [str ]=None ,
+    compact :bool =False ,schema :int =SCHEMA_V1 ,interval :float =WATCH_INTERVAL ,
+    max_updates :Optional [int ]=None )->None :
+        """Convert once, then keep sdk_data.json in sync with the headers until interrupted
+
+        The SDK directory is polled every interval seconds by size and mtime (no
+        file contents are read). Only added or changed headers are reparsed and
+        their classes replace the old ones in self.file_classes. The serialized
+        text of every other header is reused, so a rewrite is mostly one
+        sequential write of the new file, renamed into place like any other run.
+        With a cache_path, the cache is rewritten after every update as well.
+        """
+        sdk_dir =Path (sdk_path )
+        # Taken before converting, so a header saved during the initial run is seen as changed
+        snapshot =self ._scan_headers (sdk_dir )
+        self .convert_sdk_directory (sdk_path ,jobs =jobs ,cache_path =cache_path )
+        if not self .file_classes :
+            return 
 
-                processed +=1 
+        os .makedirs (output_dir ,exist_ok =True )
+        sdk_file =os .path .join (output_dir ,"sdk_data.json")
+        texts :Dict [str ,str ]={}
+        tables =None 
+        with self .metrics .phase ("serialize"):
+            tables =self ._write_watched (sdk_file ,texts ,compact ,schema ,tables )
+        self .save_globals (output_dir )
+
+        updates =0 
+        print (f"👀 Watching {sdk_path } for header changes (Ctrl+C to stop)...")
+        try :
+            while max_updates is None or updates <max_updates :
+                time .sleep (interval )
+                current =self ._scan_headers (sdk_dir )
+                changed =[rel for rel ,stat in current .items ()if snapshot .get (rel )!=stat ]
+                removed =[rel for rel in snapshot if rel not in current ]
+                snapshot =current 
+                if not changed and not removed :
+                    continue 
 
-                if processed %1000 ==0 :
-                    print (f"  📄 Processed {processed } files, found {classes_found } classes with {members_found } members...")
+                start =time .perf_counter ()
+                for rel in removed :
+                    self .file_classes .pop (rel ,None )
+                    self .cache_entries .pop (rel ,None )
+                    texts .pop (rel ,None )
+
+                changed_files =[sdk_dir /rel for rel in changed ]
+                if jobs >1 and len (changed_files )>1 :
+                    parsed =self .parse_files_parallel (changed_files ,jobs )
+                else :
+                    parsed =self .parse_header_batch ([(i ,str (h_file ))for i ,h_file in enumerate (changed_files )])
+                for index ,file_classes ,error in parsed :
+                    rel =changed [index ]
+                    if error is not None :
+                        print (f"❌ Error processing {rel }: {error }")
+                        file_classes =[]
+                        self .cache_entries .pop (rel ,None )
+                    elif cache_path :
+                        size ,mtime =current [rel ]
+                        self .cache_entries [rel ]={"classes":[c .to_row ()for c in file_classes ],"size":size ,
+                        "mtime":mtime ,"hash":self .hash_file (changed_files [index ])}
+                    self .file_classes [rel ]=file_classes 
+                    texts .pop (rel ,None )
+                    package =package_from_filename (changed_files [index ].name )
+                    for c in file_classes :
+                        self .class_packages [c .name ]=package 
+
+                # Same header order as a fresh run, so the output matches one
+                self .file_classes ={rel :self .file_classes [rel ]for rel in current if rel in self .file_classes }
+                self .classes =[c for file_classes in self .file_classes .values ()for c in file_classes ]
+                with self .metrics .phase ("serialize"):
+                    tables =self ._write_watched (sdk_file ,texts ,compact ,schema ,tables )
+
+                updates +=1 
+                self .metrics .count ("watch_updates")
+                print (f"🔁 {len (changed )} changed, {len (removed )} removed -> {len (self .classes )} classes "
+                f"written in {(time .perf_counter ()-start )*1000 :.0f} ms")
+                if cache_path :
+                    # After the JSON, so the rewrite isn't delayed by it
+                    with self .metrics .phase ("cache"):
+                        self .cache_entries ={rel :self .cache_entries [rel ]for rel in current if rel in self .cache_entries }
+                        self .save_cache (cache_path ,self .cache_entries )
+        except KeyboardInterrupt :
+            print ("\n🛑 Stopped watching")
+
+    def _scan_headers (self ,sdk_dir :Path )->Dict [str ,Tuple [int ,int ]]:
+        """Relative path -> (size, mtime) of every header, in find_header_files order"""
+        snapshot ={}
+        for h_file in sdk_dir .rglob ("*.h"):
+            try :
+                stat =h_file .stat ()
+            except OSError :
+                continue 
+            snapshot [h_file .relative_to (sdk_dir ).as_posix ()]=(stat .st_size ,stat .st_mtime_ns )
+        return snapshot 
+
+    def _write_watched (self ,sdk_file :str ,texts :Dict [str ,str ],compact :bool ,schema :int ,tables ):
+        """Rewrite sdk_data.json from self.file_classes, serializing only headers missing from texts
+
+        Returns:
+            The v2 string tables the texts refer to (None for v1), for the next rewrite
+        """
+        with open_sdk_writer (sdk_file ,schema ,indent =None if compact else 2 ,tables =tables )as writer :
+            for rel ,file_classes in self .file_classes .items ():
+                if not file_classes :
+                    continue 
+                text =texts .get (rel )
+                if text is None :
+                    text =texts [rel ]=writer .serialize_all (c .to_dict ()for c in file_classes )
+                writer .write_serialized (text ,len (file_classes ))
+        self .metrics .count ("output_bytes",writer .bytes_written )
+        return getattr (writer ,"tables",None )
+
+    def hash_file (self ,h_file :Path )->str :
+        """Content hash used to detect headers whose mtime changed but content didn't"""
+        with open (h_file ,'rb')as f :
+            return hashlib .sha1 (f .read ()).hexdigest ()
+
+    def lookup_cache (self ,entries :Dict [str ,Dict ],key :str ,h_file :Path )->Tuple [Optional [Dict ],Optional [str ]]:
+        """Return (cached entry or None, content hash if one was computed)"""
+        entry =entries .get (key )
+        if entry is None :
+            return None ,None 
+
+        try :
+            stat =h_file .stat ()
+        except OSError :
+            return None ,None 
+
+        if stat .st_size !=entry .get ("size"):
+            return None ,None 
+        if stat .st_mtime_ns ==entry .get ("mtime"):
+            return entry ,entry .get ("hash")
+
+
+        content_hash =self .hash_file (h_file )
+        if content_hash ==entry .get ("hash"):
+            return entry ,content_hash 
+        return None ,content_hash 
+
+    def load_cache (self ,cache_path :str )->Dict [str ,Dict ]:
+        """Load per-header cache entries, discarding caches written by a different parser"""
+        if not os .path .exists (cache_path ):
+            return {}
+
+        try :
+            with open (cache_path ,'r',encoding ='utf-8')as f :
+                data =json .load (f )
+        except Exception as e :
+            print (f"⚠️  Ignoring unreadable cache {cache_path }: {e }")
+            return {}
+
+        if data .get ("version")!=CACHE_VERSION or data .get ("parser")!=_parser_fingerprint ():
+            print (f"⚠️  Cache {cache_path } was written by a different converter version, rebuilding")
+            return {}
+
+        return data .get ("files",{})
+
+    def save_cache (self ,cache_path :str ,entries :Dict [str ,Dict ])->None :
+        """Atomically write the per-header cache"""
+        write_json_atomic (cache_path ,{
+        "version":CACHE_VERSION ,
+        "parser":_parser_fingerprint (),
+        "files":entries 
+        },indent =None )
+
+    def parse_header_batch (self ,batch :List [Tuple [int ,str ]])->List [Tuple [int ,List [ClassRecord ],Optional [str ]]]:
+        """Read and parse a batch of (index, path) header files, capturing per-file errors"""
+        results =[]
+        metrics =self .metrics 
+        for index ,h_path in batch :
+            start =time .perf_counter ()
+            try :
+                with open (h_path ,'r',encoding ='utf-8',errors ='ignore')as f :
+                    content =f .read ()
+                metrics .add_time ("read",time .perf_counter ()-start )
+                metrics .count ("files")
+                metrics .count ("chars_read",len (content ))
 
+                results .append ((index ,self .parse_dumper7_format (content ,os .path .basename (h_path )),None ))
             except Exception as e :
-                print (f"❌ Error processing {h_file .name }: {e }")
-                continue 
+                results .append ((index ,[],str (e )))
+            metrics .record ("files",h_path ,time .perf_counter ()-start )
+        return results 
+
+    def parse_header_content (self ,content :str ,filename :str )->Tuple [List [ClassRecord ],Optional [str ]]:
+        """Parse one header already read into memory, returning (classes, error)"""
+        start =time .perf_counter ()
+        try :
+            file_classes ,error =self .parse_dumper7_format (content ,filename ),None 
+        except Exception as e :
+            file_classes ,error =[],str (e )
+        self .metrics .record ("files",filename ,time .perf_counter ()-start )
+        return file_classes ,error 
+
+    def parse_files_parallel (self ,h_files :List [Path ],jobs :int ):
+        """Parse header files across a process pool, yielding results in input order
+
+        Files are sorted largest-first and packed into batches of roughly equal byte
+        size so one huge Engine header doesn't leave the other workers idle at the end.
+        Results are buffered and released in the original file order, which keeps the
+        merged class list identical to a serial run.
+        """
+        sizes =[]
+        for h_file in h_files :
+            try :
+                sizes .append (h_file .stat ().st_size )
+            except OSError :
+                sizes .append (0 )
+
+        order =sorted (range (len (h_files )),key =lambda i :sizes [i ],reverse =True )
+        target =max (1 ,sum (sizes )//(jobs *PARALLEL_BATCHES_PER_JOB ))
+
+        batches =[]
+        batch =[]
+        batch_bytes =0 
+        for i in order :
+            batch .append ((i ,str (h_files [i ])))
+            batch_bytes +=sizes [i ]
+            if batch_bytes >=target :
+                batches .append (batch )
+                batch =[]
+                batch_bytes =0 
+        if batch :
+            batches .append (batch )
+
+        print (f"⚙️  Parsing with {jobs } worker processes ({len (batches )} batches)")
+
+        pending ={}
+        next_index =0 
+        with ProcessPoolExecutor (max_workers =jobs )as executor :
+            futures ={executor .submit (_parse_header_batch ,b ):b for b in batches }
+            for future in as_completed (futures ):
+                try :
+                    batch_results ,worker_metrics =future .result ()
+                    self .metrics .merge (worker_metrics )
+                except Exception as e :
+                    batch_results =[(i ,[],str (e ))for i ,_ in futures [future ]]
 
-        print (f"✅ Processed {processed } files")
-        print (f"🎯 Found {len (self .classes )} classes with {members_found } total members")
+                for index ,file_classes ,error in batch_results :
+                    pending [index ]=(index ,file_classes ,error )
+
+                while next_index in pending :
+                    yield pending .pop (next_index )
+                    next_index +=1 
 
-    def parse_dumper7_format (self ,content :str ,filename :str )->List [Dict [str ,Any ]]:
+    def parse_dumper7_format (self ,content :str ,filename :str )->List [ClassRecord ]:
         
         classes =[]
+        metrics =self .metrics 
+        perf_counter =time .perf_counter 
 
 
 
         class_pattern =r'(?:class|struct)\s+([A-Z][A-Za-z0-9_]*)\s+(?:final\s+)?(?::\s*public\s+([A-Za-z0-9_:]+))?\s*\n\s*\{\s*\n(.*?)\n\s*\};'
 
-        matches =re .finditer (class_pattern ,content ,re .MULTILINE |re .DOTALL )
+        start =perf_counter ()
+        matches =[m for m in re .finditer (class_pattern ,content ,re .MULTILINE |re .DOTALL )if self .is_valid_class_name (m .group (1 ))]
+        matched =perf_counter ()
+        metrics .add_time ("match",matched -start )
+
+
+        size_index =self .build_size_index (content ,[m .group (1 )for m in matches ])
+        metrics .add_time ("size_index",perf_counter ()-matched )
 
         for match in matches :
             class_name =match .group (1 )
             parent_class =match .group (2 )if match .group (2 )else ""
             class_body =match .group (3 )if match .group (3 )else ""
 
-
-            if not self .is_valid_class_name (class_name ):
-                continue 
-
-
+            class_start =perf_counter ()
             members =self .parse_members_dumper7 (class_body )
+            members_done =perf_counter ()
 
 
-            class_size =self .calculate_class_size (content ,class_name ,members )
+            class_size =self .calculate_class_size (content ,class_name ,members ,size_index )
+            class_done =perf_counter ()
+            metrics .add_time ("members",members_done -class_start )
+            metrics .add_time ("class_size",class_done -members_done )
+            metrics .record ("classes",f"{class_name } ({filename })",class_done -class_start )
 
-            classes .append ({
-            "N":class_name ,
-            "P":self .clean_parent_name (parent_class ),
-            "S":class_size ,
-            "T":"class",
-            "M":members 
-            })
+            classes .append (ClassRecord (class_name ,self .clean_parent_name (parent_class ),class_size ,"class",members ))
 
         return classes 
 
-    def parse_members_dumper7 (self ,class_body :str )->List [Dict [str ,str ]]:
+    def parse_members_dumper7 (self ,class_body :str )->List [MemberRecord ]:
         """Parse member variables from class body - Dumper-7 format"""
         members =[]
 
@@ -107,52 +667,40 @@ class FortniteSDKConverter :
                 continue 
 
 
-            if line in ['public:','private:','protected:']or line .startswith ('//'):
+            if '//'not in line or line in ACCESS_SPECIFIERS or line .startswith ('//'):
                 continue 
 
 
 
 
+            match =MEMBER_PATTERN .match (line )
+            if not match :
+                continue 
 
-            member_patterns =[
-
-            r'^([A-Za-z0-9_:<>,\s\*\[\]&]+)\s+([A-Za-z0-9_]+);\s*//\s*0x([0-9A-Fa-f]+)\(0x([0-9A-Fa-f]+)\)',
-
-            r'^([A-Za-z0-9_:<>,\s\*\[\]&]+)\s+([A-Za-z0-9_]+);\s*//\s*0x([0-9A-Fa-f]+)\s*\(0x([0-9A-Fa-f]+)\)',
-
-            r'^([A-Za-z0-9_:<>,\s\*\[\]&]+)\s+([A-Za-z0-9_]+);\s*//\s*0x([0-9A-Fa-f]+)',
-
-            r'^([A-Za-z0-9_:<>,\s\*\[\]&]+)\s+([A-Za-z0-9_]+);\s*//\s*Offset:\s*0x([0-9A-Fa-f]+)(?:,\s*Size:\s*0x([0-9A-Fa-f]+))?',
-            ]
-
-            for pattern_index ,pattern in enumerate (member_patterns ):
-                match =re .match (pattern ,line )
-                if match :
-                    member_type =self .clean_type_name (match .group (1 ))
-                    member_name =match .group (2 ).strip ()
-                    offset =match .group (3 ).strip ()
-
-
-                    if len (match .groups ())>=4 and match .group (4 ):
-                        size =match .group (4 ).strip ()
-                    else :
+            member_name =match .group (2 )
+            if self .should_skip_member (member_name ):
+                continue 
 
-                        size =self .guess_type_size (member_type )
+            offset =match .group (3 )or match .group (5 )
+            size =match .group (4 )or match .group (6 )
+            member_type =self .clean_type_name (match .group (1 ))
 
+            if not size :
 
-                    if self .should_skip_member (member_name ):
-                        continue 
+                size =self .guess_type_size (member_type )
 
-                    members .append ({
-                    "N":member_name ,
-                    "T":member_type ,
-                    "O":f"0x{offset .upper ()}",
-                    "S":f"0x{size .upper ()}"if isinstance (size ,str )else f"0x{size :X}"
-                    })
-                    break 
+            # Hex digits are uppercased on output, keeping the dump's zero padding
+            members .append (MemberRecord (
+            member_name ,
+            member_type ,
+            int (offset ,16 ),
+            int (size ,16 ),
+            UPPER_HEX_FORMATS [len (offset )],
+            UPPER_HEX_FORMATS [len (size )]
+            ))
 
 
-        members .sort (key =lambda x :int (x ["O"],16 ))
+        members .sort (key =_MEMBER_OFFSET )
         return members 
 
     def guess_type_size (self ,type_name :str )->str :
@@ -194,20 +742,65 @@ class FortniteSDKConverter :
 
         return '04'
 
-    def calculate_class_size (self ,content :str ,class_name :str ,members :List [Dict ])->int :
+    def build_size_index (self ,content :str ,class_names :List [str ])->Dict [str ,int ]:
+        """Index declared sizes for class_names in one pass over content
+
+        Sources are checked in priority order, and within each source the first
+        occurrence in the file wins:
+          1. a '// 0xSIZE (0x..)' comment followed by the class name on the same line
+          2. the class name followed by a '// 0xSIZE' comment (the last one on the line)
+          3. a 'sizeof(ClassName) == 0xSIZE' assert
+        Keys are lowercased class names; names are matched as whole identifiers.
+        """
+        wanted ={name .lower ()for name in class_names }
+        if not wanted :
+            return {}
+
+        after_comment ={}
+        before_comment ={}
+        for line in content .split ('\n'):
+            if '//'not in line :
+                continue 
+
+            match =SIZE_COMMENT_PATTERN .search (line )
+            if match :
+                size =int (match .group (1 ),16 )
+                for token in IDENTIFIER_PATTERN .findall (line ,match .end ()):
+                    key =token .lower ()
+                    if key in wanted and key not in after_comment :
+                        after_comment [key ]=size 
+
+            last =None 
+            for last in HEX_COMMENT_PATTERN .finditer (line ):
+                pass 
+            if last :
+                size =int (last .group (1 ),16 )
+                for token in IDENTIFIER_PATTERN .findall (line ,0 ,last .start ()):
+                    key =token .lower ()
+                    if key in wanted and key not in before_comment :
+                        before_comment [key ]=size 
+
+        size_index ={}
+        if 'sizeof'in content :
+            for match in SIZEOF_PATTERN .finditer (content ):
+                key =match .group (1 ).lower ()
+                if key in wanted and key not in size_index :
+                    size_index [key ]=int (match .group (2 ),16 )
+
+        size_index .update (before_comment )
+        size_index .update (after_comment )
+        return size_index 
+
+    def calculate_class_size (self ,content :str ,class_name :str ,members :List [MemberRecord ],size_index :Optional [Dict [str ,int ]]=None )->int :
         """Calculate class size from members or find size comments"""
 
 
-        size_patterns =[
-        rf'//\s*0x([0-9A-Fa-f]+)\s*\(0x[0-9A-Fa-f]+\).*{re .escape (class_name )}',
-        rf'{re .escape (class_name )}.*//\s*0x([0-9A-Fa-f]+)',
-        rf'sizeof\s*\(\s*{re .escape (class_name )}\s*\)\s*==\s*0x([0-9A-Fa-f]+)',
-        ]
+        if size_index is None :
+            size_index =self .build_size_index (content ,[class_name ])
 
-        for pattern in size_patterns :
-            match =re .search (pattern ,content ,re .IGNORECASE )
-            if match :
-                return int (match .group (1 ),16 )
+        size =size_index .get (class_name .lower ())
+        if size is not None :
+            return size 
 
 
         if members :
@@ -215,15 +808,11 @@ class FortniteSDKConverter :
             max_size =0 
 
             for member in members :
-                try :
-                    offset =int (member ["O"],16 )
-                    size =int (member ["S"],16 )
-                    end_offset =offset +size 
-                    if end_offset >max_offset +max_size :
-                        max_offset =offset 
-                        max_size =size 
-                except :
-                    continue 
+                offset =member .offset 
+                size =member .size 
+                if offset +size >max_offset +max_size :
+                    max_offset =offset 
+                    max_size =size 
 
             return max_offset +max_size 
 
@@ -262,42 +851,40 @@ class FortniteSDKConverter :
 
     def clean_type_name (self ,type_name :str )->str :
         """Clean up C++ type names"""
+        cleaned =_CLEAN_TYPE_CACHE .get (type_name )
+        if cleaned is not None :
+            return cleaned 
 
-        type_name =re .sub (r'\s+',' ',type_name .strip ())
 
+        cleaned =WHITESPACE_PATTERN .sub (' ',type_name .strip ())
 
-        type_name =re .sub (r'\b(class|struct|enum)\s+','',type_name )
 
+        cleaned =ELABORATED_TYPE_PATTERN .sub ('',cleaned )
 
-        replacements ={
-        'unsigned char':'uint8',
-        'unsigned short':'uint16',
-        'unsigned int':'uint32',
-        'unsigned long long':'uint64',
-        'signed char':'int8',
-        'short':'int16',
-        'long long':'int64',
-        }
 
-        for old ,new in replacements .items ():
-            type_name =type_name .replace (old ,new )
+        for old ,new in TYPE_REPLACEMENTS :
+            cleaned =cleaned .replace (old ,new )
 
-        return type_name .strip ()
+        cleaned =sys .intern (cleaned .strip ())
+        _CLEAN_TYPE_CACHE [type_name ]=cleaned 
+        return cleaned 
 
-    def save_to_json (self ,output_dir :str ="Data")->None :
-        """Save converted data to JSON files"""
+    def save_to_json (self ,output_dir :str ="Data",compact :bool =False ,schema :int =SCHEMA_V1 )->None :
+        """Save converted data to JSON files (schema 2: columnar layout from sdk_schema.py)"""
         os .makedirs (output_dir ,exist_ok =True )
 
 
         sdk_file =os .path .join (output_dir ,"sdk_data.json")
-        with open (sdk_file ,'w')as f :
-            json .dump (self .classes ,f ,indent =2 )
+        with self .metrics .phase ("serialize"),open_sdk_writer (sdk_file ,schema ,indent =None if compact else 2 )as writer :
+            writer .write_all (c .to_dict ()for c in self .classes )
+        self .metrics .count ("output_bytes",writer .bytes_written )
 
         print (f"✅ Saved {len (self .classes )} classes to {sdk_file }")
+        print (f"💾 Wrote {writer .summary ()}")
 
 
-        classes_with_members =[c for c in self .classes if c ["M"]]
-        total_members =sum (len (c ["M"])for c in self .classes )
+        classes_with_members =[c for c in self .classes if c .members ]
+        total_members =sum (len (c .members )for c in self .classes )
 
         print (f"📊 Classes with members: {len (classes_with_members )}")
         print (f"📊 Total members found: {total_members }")
@@ -307,33 +894,107 @@ class FortniteSDKConverter :
             print (f"📊 Average members per class: {avg_members :.1f}")
 
 
+        self .save_globals (output_dir )
+
+    def save_globals (self ,output_dir :str )->None :
+        """Write the placeholder globals.json next to sdk_data.json"""
         globals_file =os .path .join (output_dir ,"globals.json")
-        with open (globals_file ,'w')as f :
-            json .dump ({
+        with self .metrics .phase ("globals"):
+            write_json_atomic (globals_file ,{
             "bases":{
             "GWorld":"0x0",
             "GNames":"0x0",
             "GObjects":"0x0"
             },
             "offsets":{}
-            },f ,indent =2 )
+            })
 
         print (f"✅ Saved globals to {globals_file }")
 
+def _parser_fingerprint ()->str :
+    """Hash of this module's source, so parser edits invalidate cached classes"""
+    with open (__file__ ,'rb')as f :
+        return hashlib .sha1 (f .read ()).hexdigest ()
+
+def _parse_header_batch (batch :List [Tuple [int ,str ]])->Tuple [List [Tuple [int ,List [ClassRecord ],Optional [str ]]],Dict [str ,Any ]]:
+    """Process-pool entry point for FortniteSDKConverter.parse_header_batch, plus the worker's metrics"""
+    converter =FortniteSDKConverter ()
+    return converter .parse_header_batch (batch ),converter .metrics .snapshot ()
+
+def _parse_header_content (content :str ,filename :str )->Tuple [List [ClassRecord ],Optional [str ],Dict [str ,Any ]]:
+    """Process-pool entry point for FortniteSDKConverter.parse_header_content, plus the worker's metrics"""
+    converter =FortniteSDKConverter ()
+    file_classes ,error =converter .parse_header_content (content ,filename )
+    return file_classes ,error ,converter .metrics .snapshot ()
+
+def _pipeline_put (q :queue .Queue ,item :Any ,stop :threading .Event )->bool :
+    """Blocking put that gives up once another pipeline stage has failed"""
+    while not stop .is_set ():
+        try :
+            q .put (item ,timeout =0.1 )
+            return True 
+        except queue .Full :
+            pass 
+    return False 
+
+def _pipeline_get (q :queue .Queue ,stop :threading .Event )->Any :
+    """Blocking get that returns None (end of stream) once another pipeline stage has failed"""
+    while not stop .is_set ():
+        try :
+            return q .get (timeout =0.1 )
+        except queue .Empty :
+            pass 
+    return None 
+
 def main ():
     import argparse 
 
     parser =argparse .ArgumentParser (description ='Convert Fortnite Dumper-7 SDK to JSON')
     parser .add_argument ('sdk_path',help ='Path to SDK directory containing .h files')
     parser .add_argument ('-o','--output',default ='Data',help ='Output directory')
+    parser .add_argument ('-j','--jobs',type =int ,default =1 ,help ='Number of worker processes used to parse headers (0 = all cores)')
+    parser .add_argument ('--compact',action ='store_true',help ='Write sdk_data.json without indentation')
+    parser .add_argument ('--stream',action ='store_true',help ='Write each class as soon as its header is parsed instead of collecting the whole SDK in memory first')
+    parser .add_argument ('--watch',action ='store_true',help ='After converting, keep polling for changed headers and rewrite sdk_data.json with just those reparsed')
+    parser .add_argument ('--incremental',action ='store_true',help =f'Only reparse headers that changed since the last run (cache: <output>/{CACHE_FILE })')
+
+    add_schema_argument (parser )
+    add_output_arguments (parser ,packages_available =True )
+    add_profile_argument (parser ,'convert_sdk_profile')
 
     args =parser .parse_args ()
+    if args .watch and (args .stream or wants_extra_outputs (args )):
+        parser .error ("--watch only keeps sdk_data.json up to date; it can't be combined with --stream or extra outputs")
+
+    jobs =args .jobs if args .jobs >0 else (os .cpu_count ()or 1 )
 
     converter =FortniteSDKConverter ()
 
-    print (f"🚀 Converting Fortnite SDK from: {args .sdk_path }")
-    converter .convert_sdk_directory (args .sdk_path )
-    converter .save_to_json (args .output )
+    def run ():
+        print (f"🚀 Converting Fortnite SDK from: {args .sdk_path }")
+        cache_path =os .path .join (args .output ,CACHE_FILE )if args .incremental else None 
+        remove_stale_outputs (args .output ,args )
+        if args .watch :
+            converter .watch_sdk_directory (args .sdk_path ,args .output ,jobs =jobs ,cache_path =cache_path ,
+            compact =args .compact ,schema =args .schema )
+            return 
+        if args .stream :
+            if not converter .convert_sdk_streaming (args .sdk_path ,args .output ,jobs =jobs ,cache_path =cache_path ,compact =args .compact ,schema =args .schema ):
+                return 
+            classes =None 
+            if wants_extra_outputs (args ):
+                # Streaming kept nothing in memory; read back what was just written
+                classes =load_classes (os .path .join (args .output ,"sdk_data.json"))
+        else :
+            converter .convert_sdk_directory (args .sdk_path ,jobs =jobs ,cache_path =cache_path )
+            converter .save_to_json (args .output ,compact =args .compact ,schema =args .schema )
+            classes =to_dicts (converter .classes )if wants_extra_outputs (args )else None 
+        if classes is not None :
+            with converter .metrics .phase ("extra_outputs"):
+                write_extra_outputs (classes ,args .output ,args ,packages =converter .class_packages )
+
+    run_profiled (run ,args .profile ,converter .metrics )
+    converter .metrics .log_summary (detailed =wants_breakdown (args ))
 
     print (f"\n🎉 Conversion complete!")
 
@@ -3,128 +3,141 @@
 
 import json 
 import os 
+from datetime import date 
+from typing import Any ,Dict ,Iterable ,List ,Optional ,Tuple 
+
+from sdk_binary import BINARY_FILE ,SDKBinaryReader 
+from sdk_metrics import Metrics ,add_profile_argument ,run_profiled ,wants_breakdown 
+from sdk_schema import ROW_MEMBER_NAMES ,ROW_NAME ,ROW_OFFSETS ,ROW_PARENT ,SCHEMA_V2 ,detect_schema 
+from sdk_writer import write_json_atomic 
+
+# Phase timers and counters for this run, reported by main()
+METRICS =Metrics ()
+
+GLOBALS_FILE ="Data/globals.json"
+
+# Runtime addresses; these can't be derived from an SDK dump
+GLOBAL_BASES ={
+"UWorld":"0x173BDD18",
+"GNames":"0x167B6600"
+}
+
+# Hand-maintained offsets, and the names --from-sdk looks up in the converted SDK
+ENGINE_OFFSETS ={
+"UWorld":{
+"OwningGameInstance":"0x248",
+"GameState":"0x1D0",
+"PersistentLevel":"0x40"
+},
+"UGameInstance":{
+"LocalPlayers":"0x38"
+},
+"ULocalPlayer":{
+"PlayerController":"0x30"
+},
+"APlayerController":{
+"PlayerCameraManager":"0x360",
+"AcknowledgedPawn":"0x358",
+"PlayerState":"0x2D0"
+},
+"APlayerState":{
+"TeamIndex":"0x11A9",
+"Platform":"0x440",
+"KillScore":"0x11A8",
+"PlayerName":"0xA00",
+"RankedProgress":"0xD8"
+},
+"APawn":{
+"RootComponent":"0x1B0",
+"PawnPrivate":"0x328"
+},
+"AActor":{
+"RootComponent":"0x1B0"
+},
+"AFortPawn":{
+"Mesh":"0x330",
+"CurrentWeapon":"0x990",
+"CurrentVehicle":"0x2C18",
+"IsDying":"0x728",
+"IsDBNO":"0x841",
+"TargetedFortPawn":"0x1900",
+"PlayerAim":"0x2BC0",
+"HabaneroComponent":"0x940"
+},
+"USkeletalMeshComponent":{
+"BoneArray":"0x5E8",
+"BoneCache":"0x5F8",
+"ComponentToWorld":"0x1E0",
+"ComponentVelocity":"0x188"
+},
+"USceneComponent":{
+"RelativeLocation":"0x140",
+"ComponentToWorld":"0x1E0"
+},
+"APlayerCameraManager":{
+"CameraLocation":"0x180",
+"CameraRotation":"0x190",
+"CameraFOV":"0x3B4"
+},
+"AFortWeapon":{
+"WeaponData":"0x5A0",
+"AmmoCount":"0x14D4"
+},
+"UFortItemDefinition":{
+"ItemName":"0x40",
+"ItemRarity":"0xAA",
+"Tier":"0xA2"
+},
+"AFortPickup":{
+"PrimaryPickupItemEntry":"0x3A8",
+"bAlreadySearched":"0xD52"
+},
+"UFortProjectileAthena":{
+"ProjectileSpeed":"0x2488",
+"ProjectileGravity":"0x21D8"
+},
+"AGameStateBase":{
+"PlayerArray":"0x2C8"
+},
+"ULevel":{
+"AActor":"0x128",
+"Levels":"0x1E8"
+}
+}
+
+COMMON_OFFSETS ={
+"UObject":{
+"Class":"0x10",
+"Name":"0x18",
+"Outer":"0x20"
+},
+"UClass":{
+"DefaultObject":"0x110"
+},
+"FName":{
+"Index":"0x0",
+"Number":"0x4"
+},
+"FString":{
+"Data":"0x0",
+"Length":"0x10",
+"MaxLength":"0x14"
+},
+"TArray":{
+"Data":"0x0",
+"Count":"0x8",
+"Max":"0xC"
+}
+}
 
 def create_globals_json ():
 
 
 
-    global_bases ={
-    "UWorld":"0x173BDD18",
-    "GNames":"0x167B6600"
-    }
-
-
-
-    engine_offsets ={
-    "UWorld":{
-    "OwningGameInstance":"0x248",
-    "GameState":"0x1D0",
-    "PersistentLevel":"0x40"
-    },
-    "UGameInstance":{
-    "LocalPlayers":"0x38"
-    },
-    "ULocalPlayer":{
-    "PlayerController":"0x30"
-    },
-    "APlayerController":{
-    "PlayerCameraManager":"0x360",
-    "AcknowledgedPawn":"0x358",
-    "PlayerState":"0x2D0"
-    },
-    "APlayerState":{
-    "TeamIndex":"0x11A9",
-    "Platform":"0x440",
-    "KillScore":"0x11A8",
-    "PlayerName":"0xA00",
-    "RankedProgress":"0xD8"
-    },
-    "APawn":{
-    "RootComponent":"0x1B0",
-    "PawnPrivate":"0x328"
-    },
-    "AActor":{
-    "RootComponent":"0x1B0"
-    },
-    "AFortPawn":{
-    "Mesh":"0x330",
-    "CurrentWeapon":"0x990",
-    "CurrentVehicle":"0x2C18",
-    "IsDying":"0x728",
-    "IsDBNO":"0x841",
-    "TargetedFortPawn":"0x1900",
-    "PlayerAim":"0x2BC0",
-    "HabaneroComponent":"0x940"
-    },
-    "USkeletalMeshComponent":{
-    "BoneArray":"0x5E8",
-    "BoneCache":"0x5F8",
-    "ComponentToWorld":"0x1E0",
-    "ComponentVelocity":"0x188"
-    },
-    "USceneComponent":{
-    "RelativeLocation":"0x140",
-    "ComponentToWorld":"0x1E0"
-    },
-    "APlayerCameraManager":{
-    "CameraLocation":"0x180",
-    "CameraRotation":"0x190",
-    "CameraFOV":"0x3B4"
-    },
-    "AFortWeapon":{
-    "WeaponData":"0x5A0",
-    "AmmoCount":"0x14D4"
-    },
-    "UFortItemDefinition":{
-    "ItemName":"0x40",
-    "ItemRarity":"0xAA",
-    "Tier":"0xA2"
-    },
-    "AFortPickup":{
-    "PrimaryPickupItemEntry":"0x3A8",
-    "bAlreadySearched":"0xD52"
-    },
-    "UFortProjectileAthena":{
-    "ProjectileSpeed":"0x2488",
-    "ProjectileGravity":"0x21D8"
-    },
-    "AGameStateBase":{
-    "PlayerArray":"0x2C8"
-    },
-    "ULevel":{
-    "AActor":"0x128",
-    "Levels":"0x1E8"
-    }
-    }
-
-
-    common_offsets ={
-    "UObject":{
-    "Class":"0x10",
-    "Name":"0x18",
-    "Outer":"0x20"
-    },
-    "UClass":{
-    "DefaultObject":"0x110"
-    },
-    "FName":{
-    "Index":"0x0",
-    "Number":"0x4"
-    },
-    "FString":{
-    "Data":"0x0",
-    "Length":"0x10",
-    "MaxLength":"0x14"
-    },
-    "TArray":{
-    "Data":"0x0",
-    "Count":"0x8",
-    "Max":"0xC"
-    }
-    }
-
-
-    all_offsets ={**engine_offsets ,**common_offsets }
+    global_bases =dict (GLOBAL_BASES )
+    all_offsets ={class_name :dict (offsets )for class_name ,offsets in {**ENGINE_OFFSETS ,**COMMON_OFFSETS }.items ()}
+    METRICS .count ("classes",len (all_offsets ))
+    METRICS .count ("offsets",sum (len (members )for members in all_offsets .values ()))
 
 
     globals_data ={
@@ -140,7 +153,7 @@ def create_globals_json ():
 
 
     globals_file ="Data/globals.json"
-    with open (globals_file ,'w')as f :
+    with METRICS .phase ("write"),open (globals_file ,'w')as f :
         json .dump (globals_data ,f ,indent =2 )
 
     print (f"Created {globals_file } with:")
@@ -160,7 +173,7 @@ def update_existing_globals ():
         print (f"Updating existing {globals_file }...")
 
         try :
-            with open (globals_file ,'r')as f :
+            with METRICS .phase ("read"),open (globals_file ,'r')as f :
                 existing_data =json .load (f )
         except :
             print ("Error reading existing file, creating new one...")
@@ -190,7 +203,7 @@ def update_existing_globals ():
         existing_data ['last_updated']=new_data ['last_updated']
 
 
-        with open (globals_file ,'w')as f :
+        with METRICS .phase ("write"),open (globals_file ,'w')as f :
             json .dump (existing_data ,f ,indent =2 )
 
         print (f"Updated {globals_file }")
@@ -200,11 +213,180 @@ def update_existing_globals ():
         print (f"Creating new {globals_file }...")
         return create_globals_json ()
 
-if __name__ =="__main__":
+def find_sdk_file (sdk_path :str )->str :
+    """sdk_path itself, or the sdk_data.bin (preferred, it's mmapped) or sdk_data.json in a Data directory"""
+    if not os .path .isdir (sdk_path ):
+        return sdk_path 
+    for name in (BINARY_FILE ,"sdk_data.json"):
+        candidate =os .path .join (sdk_path ,name )
+        if os .path .exists (candidate ):
+            return candidate 
+    raise FileNotFoundError (f"No {BINARY_FILE } or sdk_data.json in {sdk_path }")
+
+class OffsetIndex :
+    """Member offsets keyed by (class, member) plus each class's parent, for batch lookups"""
+
+    def __init__ (self ):
+        self .offsets :Dict [Tuple [str ,str ],int ]={}
+        self .parents :Dict [str ,str ]={}
+
+    def add_class (self ,name :str ,parent :str ,members :Iterable [Tuple [str ,int ]])->None :
+        # Dumps can repeat a class name; the first one wins, as in the viewer
+        if name in self .parents :
+            return 
+        self .parents [name ]=parent 
+        offsets =self .offsets 
+        for member ,offset in members :
+            offsets .setdefault ((name ,member ),offset )
+
+    @classmethod 
+    def load (cls ,sdk_file :str ,class_names :Iterable [str ])->'OffsetIndex':
+        """Index class_names and their parent chains from an sdk_data.json (either schema) or sdk_data.bin
+
+        Only the classes on those chains get their members indexed, so the
+        cost is loading the file; a binary isn't even decoded beyond them.
+        """
+        index =cls ()
+        if sdk_file .endswith (".bin"):
+            with SDKBinaryReader (sdk_file )as reader :
+                index ._add_chains (class_names ,reader .find_class )
+            return index 
+
+        with open (sdk_file ,'r',encoding ='utf-8')as f :
+            data =json .load (f )
+        records ={}
+        if detect_schema (data )==SCHEMA_V2 :
+            names =data ["names"]
+            for row in data ["classes"]:
+                records .setdefault (row [ROW_NAME ],row )
+
+            def find_class (name :str )->Optional [Dict [str ,Any ]]:
+                row =records .get (name )
+                if row is None :
+                    return None 
+                return {"P":row [ROW_PARENT ],"M":[{"N":names [name_id ],"O":offset }
+                for name_id ,offset in zip (row [ROW_MEMBER_NAMES ],row [ROW_OFFSETS ])]}
+        else :
+            for record in data :
+                records .setdefault (record ["N"],record )
+            find_class =records .get 
+        index ._add_chains (class_names ,find_class )
+        return index 
+
+    def _add_chains (self ,class_names :Iterable [str ],find_class )->None :
+        pending =list (class_names )
+        while pending :
+            name =pending .pop ()
+            if name in self .parents :
+                continue 
+            record =find_class (name )
+            if record is None :
+                continue 
+            self .add_class (name ,record ["P"],((m ["N"],m ["O"]if isinstance (m ["O"],int )else int (m ["O"],16 ))
+            for m in record ["M"]))
+            METRICS .count ("indexed_classes")
+            if record ["P"]:
+                pending .append (record ["P"])
+
+    def resolve (self ,class_name :str ,member :str )->Optional [Tuple [int ,str ]]:
+        """Offset of member and the class declaring it, searching class_name and then its parents"""
+        seen =set ()
+        while class_name and class_name not in seen :
+            offset =self .offsets .get ((class_name ,member ))
+            if offset is not None :
+                return offset ,class_name 
+            seen .add (class_name )
+            class_name =self .parents .get (class_name )
+        return None 
+
+def resolve_offsets (index :OffsetIndex ,requested :Dict [str ,List [str ]])->Tuple [Dict [str ,Dict [str ,str ]],List [str ]]:
+    """Resolve every requested class member in one pass
+
+    Returns:
+        class -> member -> "0x..." for everything found, and "Class.Member" for everything that wasn't
+    """
+    resolved ={}
+    missing =[]
+    for class_name ,members in requested .items ():
+        for member in members :
+            found =index .resolve (class_name ,member )
+            if found is None :
+                missing .append (f"{class_name }.{member }")
+                continue 
+            offset ,owner =found 
+            resolved .setdefault (class_name ,{})[member ]=f"0x{offset :X}"
+            if owner !=class_name :
+                METRICS .count ("inherited")
+    METRICS .count ("resolved",sum (len (members )for members in resolved .values ()))
+    METRICS .count ("missing",len (missing ))
+    return resolved ,missing 
+
+def regenerate_from_sdk (sdk_path :str ,globals_file :str =GLOBALS_FILE )->Dict [str ,Any ]:
+    """Rewrite globals.json with every known offset looked up in a freshly converted SDK
+
+    The names come from ENGINE_OFFSETS/COMMON_OFFSETS plus whatever globals_file
+    already lists. Names the SDK doesn't have (engine templates such as TArray,
+    or members that were renamed) keep their previous value and are reported.
+    """
+    existing ={}
+    if os .path .exists (globals_file ):
+        with METRICS .phase ("read"),open (globals_file ,'r',encoding ='utf-8')as f :
+            existing =json .load (f )
+
+    previous ={class_name :dict (offsets )for class_name ,offsets in {**ENGINE_OFFSETS ,**COMMON_OFFSETS }.items ()}
+    for class_name ,offsets in existing .get ("offsets",{}).items ():
+        previous .setdefault (class_name ,{}).update (offsets )
+    requested ={class_name :list (offsets )for class_name ,offsets in previous .items ()}
+
+    sdk_file =find_sdk_file (sdk_path )
+    print (f"🔍 Resolving {sum (len (members )for members in requested .values ())} offsets from {sdk_file }...")
+    with METRICS .phase ("index"):
+        index =OffsetIndex .load (sdk_file ,requested )
+    with METRICS .phase ("resolve"):
+        resolved ,missing =resolve_offsets (index ,requested )
+
+    offsets ={
+    class_name :{member :resolved .get (class_name ,{}).get (member ,previous [class_name ][member ])for member in members }
+    for class_name ,members in requested .items ()
+    }
+    bases =existing .get ("bases",{})
+    bases .update (GLOBAL_BASES )
+
+    globals_data =dict (existing ,bases =bases ,offsets =offsets ,
+    notes =f"Offsets resolved from {os .path .basename (sdk_file )} by create_globals.py --from-sdk",
+    last_updated =date .today ().isoformat ())
+
+    with METRICS .phase ("write"):
+        write_json_atomic (globals_file ,globals_data )
+
+    found =sum (len (members )for members in resolved .values ())
+    print (f"✅ Wrote {globals_file }: {found } offsets from the SDK, {len (missing )} not found")
+    if missing :
+        print ("⚠️  Not in the SDK (kept previous value):")
+        for name in missing :
+            print (f"    {name }")
+    return globals_data 
+
+def main ():
+    import argparse 
+
+    parser =argparse .ArgumentParser (description ='Create or update Data/globals.json with known offsets')
+    parser .add_argument ('--from-sdk',metavar ='SDK',help ='Look every offset up in a converted sdk_data.json / sdk_data.bin '
+    '(or the Data directory holding them) and regenerate globals.json')
+    parser .add_argument ('-o','--output',default =GLOBALS_FILE ,help ='globals.json written by --from-sdk (default: %(default)s)')
+    add_profile_argument (parser ,'create_globals_profile')
+    args =parser .parse_args ()
+
+    if args .from_sdk :
+        run_profiled (lambda :regenerate_from_sdk (args .from_sdk ,args .output ),args .profile ,METRICS )
+        print ()
+        METRICS .log_summary (detailed =wants_breakdown (args ))
+        return 
+
     print ("Creating Fortnite globals.json from offsets...")
 
 
-    globals_data =update_existing_globals ()
+    globals_data =run_profiled (update_existing_globals ,args .profile ,METRICS )
 
     print ("\nGlobals.json structure:")
     print ("- bases: Global memory addresses")
@@ -221,4 +403,10 @@ if __name__ =="__main__":
     for class_name ,offsets in list (globals_data ['offsets'].items ())[:2 ]:
         print (f"  {class_name }:")
         for offset_name ,offset_value in list (offsets .items ())[:3 ]:
-            print (f"    {offset_name }: {offset_value }")
\ No newline at end of file
+            print (f"    {offset_name }: {offset_value }")
+
+    print ()
+    METRICS .log_summary (detailed =wants_breakdown (args ))
+
+if __name__ =="__main__":
+    main ()
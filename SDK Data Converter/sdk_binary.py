@@ -0,0 +1,277 @@
+"""
+Compact binary SDK format (sdk_data.bin)
+
+A versioned, little-endian alternative to sdk_data.json with a deduplicated
+string table and fixed-width class and member records, so any class can be
+read by index straight out of an mmap without parsing the rest of the file.
+
+Layout:
+    header          HEADER
+    string index    STRING_ENTRY * string_count     (offset, length) into string data
+    string data     UTF-8 bytes of every unique name/type, concatenated
+    class table     CLASS_RECORD * class_count
+    member table    MEMBER_RECORD * member_count    members of class i are contiguous
+
+Offsets and sizes are stored as integers. The number of hex digits and the
+letter case of the original "0x..." strings are kept per member, so reading
+the file back reproduces the JSON records exactly.
+
+Usage:
+    python sdk_binary.py convert sdk_data.json sdk_data.bin
+    python sdk_binary.py verify sdk_data.json sdk_data.bin
+"""
+
+import mmap
+import os
+import struct
+import time
+from typing import Dict, Iterator, List, Optional
+
+from sdk_schema import load_classes
+from sdk_writer import write_bytes_atomic
+
+
+BINARY_FILE = "sdk_data.bin"
+MAGIC = b'NSDK'
+FORMAT_VERSION = 1
+
+# magic, version, reserved, string_count, class_count, member_count, reserved,
+# string_index_offset, string_data_offset, class_table_offset, member_table_offset
+HEADER = struct.Struct('<4sHHIIIIQQQQ')
+# offset into string data, byte length
+STRING_ENTRY = struct.Struct('<II')
+# name, parent, kind (string ids), size, first member index, member count
+CLASS_RECORD = struct.Struct('<IIIIII')
+# name, type (string ids), offset, size, offset hex digits, size hex digits, lowercase flags, reserved
+MEMBER_RECORD = struct.Struct('<IIIIBBBB')
+
+LOWER_OFFSET = 0x1
+LOWER_SIZE = 0x2
+
+
+def _parse_hex(text: str):
+    """'0x01B0' -> (0x1B0, 4 digits, lowercase?)"""
+    if not text.startswith('0x') or len(text) < 3:
+        raise ValueError(f"Cannot encode non-hex value {text!r}")
+    digits = text[2:]
+    lower = digits != digits.upper()
+    if lower and digits != digits.lower():
+        raise ValueError(f"Cannot encode mixed-case hex value {text!r}")
+    return int(digits, 16), len(digits), lower
+
+
+def _format_hex(value: int, digits: int, lower: int) -> str:
+    return f"0x{value:0{digits}x}" if lower else f"0x{value:0{digits}X}"
+
+
+def encode_sdk(classes: List[Dict]) -> bytes:
+    """Encode classes in sdk_data.json format into the binary format"""
+    string_ids: Dict[str, int] = {}
+    strings: List[bytes] = []
+
+    def intern(text: str) -> int:
+        string_id = string_ids.get(text)
+        if string_id is None:
+            string_id = string_ids[text] = len(strings)
+            strings.append(text.encode('utf-8'))
+        return string_id
+
+    class_records = []
+    member_records = []
+    for record in classes:
+        first_member = len(member_records)
+        for member in record["M"]:
+            offset, offset_digits, offset_lower = _parse_hex(member["O"])
+            size, size_digits, size_lower = _parse_hex(member["S"])
+            flags = (LOWER_OFFSET if offset_lower else 0) | (LOWER_SIZE if size_lower else 0)
+            member_records.append(MEMBER_RECORD.pack(
+                intern(member["N"]), intern(member["T"]), offset, size,
+                offset_digits, size_digits, flags, 0
+            ))
+        class_records.append(CLASS_RECORD.pack(
+            intern(record["N"]), intern(record["P"]), intern(record["T"]),
+            record["S"], first_member, len(record["M"])
+        ))
+
+    string_index = []
+    position = 0
+    for data in strings:
+        string_index.append(STRING_ENTRY.pack(position, len(data)))
+        position += len(data)
+
+    string_index_offset = HEADER.size
+    string_data_offset = string_index_offset + STRING_ENTRY.size * len(strings)
+    class_table_offset = string_data_offset + position
+    member_table_offset = class_table_offset + CLASS_RECORD.size * len(class_records)
+
+    header = HEADER.pack(
+        MAGIC, FORMAT_VERSION, 0, len(strings), len(class_records), len(member_records), 0,
+        string_index_offset, string_data_offset, class_table_offset, member_table_offset
+    )
+    return b''.join([header, *string_index, *strings, *class_records, *member_records])
+
+
+def write_binary(classes: List[Dict], path: str) -> int:
+    """Encode and atomically write classes; returns the file size in bytes"""
+    return write_bytes_atomic(path, encode_sdk(classes))
+
+
+class SDKBinaryReader:
+    """
+    Random-access reader over an mmapped sdk_data.bin
+
+    Records are decoded on demand; only the strings that are actually touched
+    get decoded (and cached).
+    """
+
+    def __init__(self, path: str):
+        self._file = open(path, 'rb')
+        try:
+            self._data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError(f"{path} is empty, not an SDK binary")
+
+        if len(self._data) < HEADER.size:
+            self.close()
+            raise ValueError(f"{path} is too small to be an SDK binary")
+
+        (magic, version, _, self.string_count, self.class_count, self.member_count, _,
+         self._string_index, self._string_data, self._class_table, self._member_table) = HEADER.unpack_from(self._data, 0)
+        if magic != MAGIC:
+            self.close()
+            raise ValueError(f"{path} is not an SDK binary (bad magic {magic!r})")
+        if version != FORMAT_VERSION:
+            self.close()
+            raise ValueError(f"{path} has unsupported format version {version}")
+
+        self._strings: Dict[int, str] = {}
+        self._names: Optional[Dict[str, int]] = None
+
+    def __enter__(self) -> 'SDKBinaryReader':
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+    def __len__(self) -> int:
+        return self.class_count
+
+    def close(self):
+        if self._data is not None:
+            self._data.close()
+            self._data = None
+        self._file.close()
+
+    def string(self, string_id: int) -> str:
+        text = self._strings.get(string_id)
+        if text is None:
+            offset, length = STRING_ENTRY.unpack_from(self._data, self._string_index + STRING_ENTRY.size * string_id)
+            start = self._string_data + offset
+            text = self._strings[string_id] = self._data[start:start + length].decode('utf-8')
+        return text
+
+    def class_name(self, index: int) -> str:
+        name_id = struct.unpack_from('<I', self._data, self._class_table + CLASS_RECORD.size * index)[0]
+        return self.string(name_id)
+
+    def get_class(self, index: int) -> Dict:
+        """Decode class number index into an sdk_data.json record"""
+        if not 0 <= index < self.class_count:
+            raise IndexError(f"class index {index} out of range")
+
+        name, parent, kind, size, first_member, member_count = CLASS_RECORD.unpack_from(
+            self._data, self._class_table + CLASS_RECORD.size * index
+        )
+        start = self._member_table + MEMBER_RECORD.size * first_member
+        block = self._data[start:start + MEMBER_RECORD.size * member_count]
+        string = self.string
+        members = [
+            {
+                "N": string(member_name),
+                "T": string(member_type),
+                "O": _format_hex(offset, offset_digits, flags & LOWER_OFFSET),
+                "S": _format_hex(member_size, size_digits, flags & LOWER_SIZE),
+            }
+            for (member_name, member_type, offset, member_size,
+                 offset_digits, size_digits, flags, _) in MEMBER_RECORD.iter_unpack(block)
+        ]
+
+        return {
+            "N": self.string(name),
+            "P": self.string(parent),
+            "S": size,
+            "T": self.string(kind),
+            "M": members,
+        }
+
+    def find_class(self, name: str) -> Optional[Dict]:
+        """Look a class up by name (the name table is built on first use)"""
+        if self._names is None:
+            self._names = {}
+            for index in range(self.class_count):
+                self._names.setdefault(self.class_name(index), index)
+        index = self._names.get(name)
+        return self.get_class(index) if index is not None else None
+
+    def iter_classes(self) -> Iterator[Dict]:
+        for index in range(self.class_count):
+            yield self.get_class(index)
+
+
+def verify(json_path: str, binary_path: str) -> bool:
+    """Round-trip check of a binary file against its JSON source, with size and load-time comparison"""
+    start = time.perf_counter()
+    classes = load_classes(json_path)
+    json_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    with SDKBinaryReader(binary_path) as reader:
+        open_time = time.perf_counter() - start
+        middle = reader.class_count // 2
+        start = time.perf_counter()
+        if reader.class_count:
+            reader.get_class(middle)
+        random_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        decoded = list(reader.iter_classes())
+        full_time = time.perf_counter() - start
+
+    ok = decoded == classes
+    json_size = os.path.getsize(json_path)
+    binary_size = os.path.getsize(binary_path)
+    print(f"{'✅ Round trip identical' if ok else '❌ Round trip MISMATCH'}: {len(classes):,} classes, "
+          f"{sum(len(c['M']) for c in classes):,} members")
+    print(f"📦 JSON   {json_size:>14,} bytes   load_classes    {json_time * 1000:9.1f} ms")
+    print(f"📦 Binary {binary_size:>14,} bytes   open + 1 class  {(open_time + random_time) * 1000:9.3f} ms   "
+          f"decode all {full_time * 1000:9.1f} ms")
+    if json_size:
+        print(f"📊 Binary is {binary_size / json_size * 100:.1f}% of the JSON size")
+    return ok
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Convert or verify the binary SDK format')
+    commands = parser.add_subparsers(dest='command', required=True)
+    convert = commands.add_parser('convert', help='Encode an sdk_data.json into the binary format')
+    convert.add_argument('json_file')
+    convert.add_argument('binary_file')
+    check = commands.add_parser('verify', help='Round-trip a binary file against its JSON source')
+    check.add_argument('json_file')
+    check.add_argument('binary_file')
+    args = parser.parse_args()
+
+    if args.command == 'convert':
+        classes = load_classes(args.json_file)
+        size = write_binary(classes, args.binary_file)
+        print(f"✅ Wrote {len(classes):,} classes to {args.binary_file} ({size:,} bytes)")
+        return 0
+    return 0 if verify(args.json_file, args.binary_file) else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,279 @@
+"""
+Deterministic synthetic SDK dumps for testing and benchmarking the converters
+
+Two layouts are generated from a seed, so the same arguments always produce
+byte-identical files:
+
+  dumper7   A Dumper-7 style header folder (<Package>_structs.h / _classes.h)
+            with all four member comment styles, padding and bitfield members,
+            StaticClass() bodies (nested braces), enums and sizeof/alignof
+            asserts. Input for convert_sdk.py.
+  hpp       A single offset dump of 'static const uint32_t Name = 0x..; // (0x..)'
+            lines, with comments and nested structs. Input for single-hpp-to-json.py.
+
+Usage:
+    python sdk_corpus.py dumper7 corpus/SDK --classes 15000 --members 16
+    python sdk_corpus.py hpp corpus/dump.hpp --classes 15000 --members 16
+"""
+
+import os
+import random
+from typing import Dict, List, Tuple
+
+
+DEFAULT_SEED = 1
+
+PACKAGES = [
+    'CoreUObject', 'Engine', 'FortniteGame', 'FortniteUI', 'GameplayAbilities', 'GameplayTags',
+    'UMG', 'AIModule', 'PhysicsCore', 'Niagara', 'MovieScene', 'AnimGraphRuntime', 'EnhancedInput',
+]
+
+WORDS = [
+    'Fort', 'Player', 'Pawn', 'Weapon', 'Vehicle', 'Mesh', 'Component', 'Actor', 'Camera',
+    'Manager', 'State', 'Controller', 'Ability', 'Inventory', 'Item', 'Pickup', 'Building',
+    'Projectile', 'Health', 'Shield', 'Ammo', 'Reload', 'Target', 'Team', 'Score', 'Anim',
+    'Movement', 'Skeletal', 'Scene', 'Widget', 'Athena', 'Gameplay', 'Effect', 'Cue', 'Damage',
+]
+
+# (Dumper-7 spelling, size, alignment)
+MEMBER_TYPES = [
+    ('bool', 0x1, 1), ('uint8', 0x1, 1), ('int32', 0x4, 4), ('uint32', 0x4, 4), ('float', 0x4, 4),
+    ('double', 0x8, 8), ('int64', 0x8, 8), ('class FName', 0x8, 4), ('class FString', 0x10, 8),
+    ('class AActor*', 0x8, 8), ('class UObject*', 0x8, 8), ('class USceneComponent*', 0x8, 8),
+    ('class USkeletalMeshComponent*', 0x8, 8), ('struct FVector', 0x18, 8), ('struct FRotator', 0x18, 8),
+    ('struct FGameplayTag', 0x8, 4), ('TArray<class UObject*>', 0x10, 8), ('TArray<struct FVector>', 0x10, 8),
+    ('TWeakObjectPtr<class APawn>', 0x8, 4), ('TSubclassOf<class AActor>', 0x8, 8),
+    ('TMap<class FName, struct FVector>', 0x50, 8), ('unsigned char', 0x1, 1), ('long long', 0x8, 8),
+]
+
+# The four member comment styles convert_sdk.py understands, most common first
+COMMENT_STYLES = (
+    '// 0x{offset:04X}(0x{size:04X})({flags})',
+    '// 0x{offset:04X} (0x{size:04X})',
+    '// 0x{offset:04X}',
+    '// Offset: 0x{offset:X}, Size: 0x{size:X}',
+)
+COMMENT_WEIGHTS = (70, 10, 10, 10)
+
+FLAGS = ['Edit, BlueprintVisible, ZeroConstructor, IsPlainOldData, NoDestructor',
+         'Net, ZeroConstructor, IsPlainOldData, RepNotify', 'ExportObject, ZeroConstructor, InstancedReference',
+         'Transient, ZeroConstructor, NativeAccessSpecifierPrivate']
+
+HPP_NAMES = ['bIsThing', 'FloatValue', 'OwnerComponent', 'PlayerName', 'Count', 'ActorPtr', 'Mesh', 'Health']
+HPP_SIZES = [0x1, 0x2, 0x4, 0x8, 0xC, 0x10, 0x18, 0x20]
+
+
+def _align(value: int, alignment: int) -> int:
+    return (value + alignment - 1) // alignment * alignment
+
+
+def _class_name(rng: random.Random, prefix: str, index: int) -> str:
+    return prefix + ''.join(rng.sample(WORDS, 2)) + str(index)
+
+
+def _member_name(rng: random.Random, index: int) -> str:
+    return ''.join(rng.sample(WORDS, 2)) + str(index)
+
+
+def _dumper7_class(rng: random.Random, package: str, name: str, parent: str, parent_size: int,
+                   member_count: int, is_struct: bool, counts: Dict[str, int]) -> Tuple[List[str], int]:
+    """Lines for one class plus its total size"""
+    keyword = 'struct' if is_struct else 'class'
+    lines = []
+    offset = parent_size
+    body = []
+    for i in range(member_count):
+        kind = rng.random()
+        if kind < 0.08:
+            # Padding between properties, skipped by the converter
+            size = rng.choice([0x1, 0x3, 0x4, 0x8, 0x10])
+            body.append(f"\tuint8                                         Pad_{offset:X}[0x{size:X}];"
+                        f"                                      // 0x{offset:04X}(0x{size:04X})(Fixing Size After Last Property [ Dumper-7 ])")
+            offset += size
+            counts["padding"] += 1
+            continue
+        if kind < 0.12:
+            # Bitfields aren't 'Type Name;' declarations, the converter skips them
+            body.append(f"\tuint8                                         b{_member_name(rng, i)} : 1;"
+                        f"                                 // 0x{offset:04X}(0x0001)(BitIndex: 0x00, PropSize: 0x0001 (Edit))")
+            offset += 1
+            counts["bitfields"] += 1
+            continue
+
+        type_name, size, alignment = rng.choice(MEMBER_TYPES)
+        offset = _align(offset, alignment)
+        style = rng.choices(range(len(COMMENT_STYLES)), COMMENT_WEIGHTS)[0]
+        comment = COMMENT_STYLES[style].format(offset=offset, size=size, flags=rng.choice(FLAGS))
+        body.append(f"\t{type_name:<45} {_member_name(rng, i) + ';':<50} {comment}")
+        offset += size
+        counts["members"] += 1
+        counts[f"style_{style + 1}"] += 1
+
+    size = _align(offset, 8) if body else max(parent_size, 0x8)
+    base = f" : public {parent}" if parent else ""
+    lines.append(f"// {'ScriptStruct' if is_struct else 'Class'} {package}.{name[1:]}")
+    lines.append(f"// 0x{size - parent_size:04X} (0x{size:04X} - 0x{parent_size:04X})")
+    lines.append(f"{keyword} {name}{' final' if rng.random() < 0.3 else ''}{base}")
+    lines.append("{")
+    lines.append("public:")
+    lines.extend(body)
+    if not is_struct:
+        # Function bodies give the class nested braces
+        lines.append("")
+        lines.append("public:")
+        lines.append("\tstatic class UClass* StaticClass()")
+        lines.append("\t{")
+        lines.append(f"\t\treturn StaticClassImpl<\"{name[1:]}\">();")
+        lines.append("\t}")
+        lines.append(f"\tstatic class {name}* GetDefaultObj()")
+        lines.append("\t{")
+        lines.append(f"\t\treturn GetDefaultObjImpl<{name}>();")
+        lines.append("\t}")
+    lines.append("};")
+    if rng.random() < 0.6:
+        lines.append(f"static_assert(alignof({name}) == 0x000008, \"Wrong alignment on {name}\");")
+        lines.append(f"static_assert(sizeof({name}) == 0x{size:06X}, \"Wrong size on {name}\");")
+        counts["sizeof_asserts"] += 1
+    lines.append("")
+    return lines, size
+
+
+def generate_dumper7(output_dir: str, classes: int = 15000, members: int = 16, files: int = 0,
+                     seed: int = DEFAULT_SEED) -> Dict[str, int]:
+    """
+    Write a Dumper-7 style header folder
+
+    Args:
+        classes: Total number of classes and structs
+        members: Average declared members per class (padding and bitfields included)
+        files: Number of packages to spread them over (0 = about 40 classes per package)
+
+    Like a real dump, some classes and structs have no base; convert_sdk.py's
+    class pattern only picks up declarations with one, so it reports fewer.
+
+    Returns:
+        Counts of what was generated
+    """
+    rng = random.Random(seed)
+    os.makedirs(output_dir, exist_ok=True)
+    file_count = files or max(1, classes // 40)
+    counts = {"files": 0, "classes": 0, "members": 0, "padding": 0, "bitfields": 0, "sizeof_asserts": 0,
+              "enums": 0, "bytes": 0, "style_1": 0, "style_2": 0, "style_3": 0, "style_4": 0}
+
+    # Earlier classes become parents of later ones, like a real hierarchy
+    known: List[Tuple[str, int]] = [("UObject", 0x28)]
+    known_structs: List[Tuple[str, int]] = [("FTableRowBase", 0x8), ("FFastArraySerializerItem", 0xC)]
+    per_file = [classes // file_count + (1 if i < classes % file_count else 0) for i in range(file_count)]
+    class_index = 0
+
+    for file_index, class_total in enumerate(per_file):
+        package = PACKAGES[file_index] if file_index < len(PACKAGES) else f"{rng.choice(PACKAGES)}Plugin{file_index}"
+        struct_total = class_total // 3
+        sections = (("structs", struct_total, True), ("classes", class_total - struct_total, False))
+
+        for suffix, count, is_struct in sections:
+            lines = ["#pragma once", "", "// Dumped with Dumper-7!", "", "", "namespace SDK", "{", ""]
+            if is_struct and count:
+                for e in range(rng.randint(1, 3)):
+                    lines.append(f"// Enum {package}.E{''.join(rng.sample(WORDS, 2))}{file_index}_{e}")
+                    lines.append("// NumValues: 0x0003")
+                    lines.append(f"enum class E{''.join(rng.sample(WORDS, 2))}{file_index}_{e} : uint8")
+                    lines.append("{")
+                    lines.extend(f"\tValue{v}                                   = {v}," for v in range(3))
+                    lines.append("};")
+                    lines.append("")
+                    counts["enums"] += 1
+
+            for _ in range(count):
+                bases = known_structs if is_struct else known
+                name = _class_name(rng, 'F' if is_struct else rng.choice('AU'), class_index)
+                parent, parent_size = bases[rng.randrange(len(bases))] if rng.random() < (0.5 if is_struct else 0.9) else ("", 0x0)
+                member_count = rng.randint(0, members * 2)
+                class_lines, size = _dumper7_class(rng, package, name, parent, parent_size,
+                                                   member_count, is_struct, counts)
+                lines.extend(class_lines)
+                bases.append((name, size))
+                class_index += 1
+                counts["classes"] += 1
+
+            lines.append("}")
+            lines.append("")
+            path = os.path.join(output_dir, f"{package}_{suffix}.h")
+            data = '\n'.join(lines).encode('utf-8')
+            with open(path, 'wb') as f:
+                f.write(data)
+            counts["files"] += 1
+            counts["bytes"] += len(data)
+
+    return counts
+
+
+def generate_hpp(output_path: str, classes: int = 15000, members: int = 16,
+                 seed: int = DEFAULT_SEED) -> Dict[str, int]:
+    """
+    Write a single .hpp offset dump
+
+    Returns:
+        Counts of what was generated
+    """
+    rng = random.Random(seed)
+    directory = os.path.dirname(os.path.abspath(output_path))
+    os.makedirs(directory, exist_ok=True)
+    counts = {"files": 1, "classes": 0, "members": 0, "nested": 0, "bytes": 0}
+    names = ["UObject"]
+
+    lines = ["#pragma once", "// Generated offset dump", "", "namespace Offsets {", ""]
+    for index in range(classes):
+        keyword = rng.choice(['class', 'struct'])
+        name = _class_name(rng, 'A' if keyword == 'class' else 'F', index)
+        parent = rng.choice(names) if rng.random() < 0.8 else ""
+        lines.append(f"// {keyword} {name}")
+        lines.append(f"{keyword} {name}{' : public ' + parent if parent else ''} {{")
+
+        offset = 0x28
+        for i in range(rng.randint(0, members * 2)):
+            size = rng.choice(HPP_SIZES)
+            lines.append(f"    static const uint32_t {rng.choice(HPP_NAMES)}{i} = 0x{offset:X}; // (0x{size:X})")
+            offset += size
+            counts["members"] += 1
+        if rng.random() < 0.15:
+            lines.append("    struct Inner {")
+            lines.append("        int x; // nested braces")
+            lines.append("    };")
+            counts["nested"] += 1
+        lines.append("};")
+        lines.append("")
+        names.append(name)
+        counts["classes"] += 1
+
+    lines.append("}")
+    lines.append("")
+    data = '\n'.join(lines).encode('utf-8')
+    with open(output_path, 'wb') as f:
+        f.write(data)
+    counts["bytes"] = len(data)
+    return counts
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Generate a deterministic synthetic SDK dump')
+    parser.add_argument('layout', choices=['dumper7', 'hpp'], help='Header folder or single .hpp dump')
+    parser.add_argument('output', help='Output folder (dumper7) or .hpp file (hpp)')
+    parser.add_argument('--classes', type=int, default=15000, help='Number of classes (default: %(default)s)')
+    parser.add_argument('--members', type=int, default=16, help='Average members per class (default: %(default)s)')
+    parser.add_argument('--files', type=int, default=0, help='Packages to spread a dumper7 dump over (0 = auto)')
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED)
+    args = parser.parse_args()
+
+    if args.layout == 'dumper7':
+        counts = generate_dumper7(args.output, args.classes, args.members, args.files, args.seed)
+    else:
+        counts = generate_hpp(args.output, args.classes, args.members, args.seed)
+
+    print(f"🧪 Wrote {args.output}: " + ', '.join(f"{key} {value:,}" for key, value in counts.items()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+"""
+Diff two sdk_data.json versions
+
+Both versions are indexed by class name, and each matched class by member
+name, so the whole diff is a single linear pass. Changes are written to the
+delta file as they are found instead of being collected first.
+
+Delta layout (a JSON array, in new-dump order, removed classes last):
+    {"change": "class_added", "class": "AFoo", "parent": "AActor", "size": 48, "members": 3}
+    {"change": "class_removed", "class": "ABar", ...same fields as class_added}
+    {"change": "class_resized", "class": "AFoo", "old": 40, "new": 48}
+    {"change": "class_reparented", "class": "AFoo", "old": "AInfo", "new": "AActor"}
+    {"change": "member_added", "class": "AFoo", "member": "Mesh", "type": "USkeletalMeshComponent*", "offset": "0x28", "size": "0x8"}
+    {"change": "member_removed", ...same fields as member_added}
+    {"change": "member_moved", "class": "AFoo", "member": "Mesh", "old": "0x28", "new": "0x30"}
+    {"change": "member_resized", "class": "AFoo", "member": "Mesh", "old": "0x8", "new": "0x10"}
+    {"change": "member_retyped", "class": "AFoo", "member": "Mesh", "old": "UMeshComponent*", "new": "USkeletalMeshComponent*"}
+Offsets and sizes are compared numerically, so "0x01B0" and "0x1B0" are equal.
+
+Usage:
+    python sdk_diff.py old/sdk_data.json new/sdk_data.json -o sdk_delta.json
+"""
+
+import time
+from typing import Dict, Iterator, List, Tuple
+
+from sdk_schema import load_classes
+from sdk_writer import StreamingJSONWriter
+
+
+DELTA_FILE = "sdk_delta.json"
+
+
+def index_classes(classes: List[Dict]) -> Dict[str, Dict]:
+    """Class name -> record (the first one wins if a name repeats)"""
+    index = {}
+    for record in classes:
+        index.setdefault(record["N"], record)
+    return index
+
+
+def keyed_items(records: List[Dict]) -> Iterator[Tuple[str, Dict]]:
+    """(key, record) pairs for classes or members; repeated names get a '#n' suffix so every key is unique"""
+    seen: Dict[str, int] = {}
+    for record in records:
+        name = record["N"]
+        count = seen.get(name, 0)
+        seen[name] = count + 1
+        yield (f"{name}#{count}" if count else name), record
+
+
+def _class_info(change: str, record: Dict) -> Dict:
+    return {"change": change, "class": record["N"], "parent": record["P"],
+            "size": record["S"], "members": len(record["M"])}
+
+
+def _member_info(change: str, class_name: str, member: Dict) -> Dict:
+    return {"change": change, "class": class_name, "member": member["N"],
+            "type": member["T"], "offset": member["O"], "size": member["S"]}
+
+
+def _diff_members(class_name: str, old_members: List[Dict], new_members: List[Dict]) -> Iterator[Dict]:
+    old_index = dict(keyed_items(old_members))
+    for key, member in keyed_items(new_members):
+        previous = old_index.pop(key, None)
+        if previous is None:
+            yield _member_info("member_added", class_name, member)
+            continue
+        name = member["N"]
+        if int(previous["O"], 16) != int(member["O"], 16):
+            yield {"change": "member_moved", "class": class_name, "member": name,
+                   "old": previous["O"], "new": member["O"]}
+        if int(previous["S"], 16) != int(member["S"], 16):
+            yield {"change": "member_resized", "class": class_name, "member": name,
+                   "old": previous["S"], "new": member["S"]}
+        if previous["T"] != member["T"]:
+            yield {"change": "member_retyped", "class": class_name, "member": name,
+                   "old": previous["T"], "new": member["T"]}
+
+    # Whatever is left in the old index no longer exists
+    for member in old_index.values():
+        yield _member_info("member_removed", class_name, member)
+
+
+def diff_sdk(old_classes: List[Dict], new_classes: List[Dict]) -> Iterator[Dict]:
+    """Yield change records from old_classes to new_classes in O(classes + members)"""
+    old_index = index_classes(old_classes)
+    matched = set()
+
+    for record in new_classes:
+        name = record["N"]
+        if name in matched:
+            continue
+        matched.add(name)
+
+        previous = old_index.get(name)
+        if previous is None:
+            yield _class_info("class_added", record)
+            continue
+        if previous["S"] != record["S"]:
+            yield {"change": "class_resized", "class": name, "old": previous["S"], "new": record["S"]}
+        if previous["P"] != record["P"]:
+            yield {"change": "class_reparented", "class": name, "old": previous["P"], "new": record["P"]}
+        yield from _diff_members(name, previous["M"], record["M"])
+
+    for name, record in old_index.items():
+        if name not in matched:
+            yield _class_info("class_removed", record)
+
+
+def write_delta(old_classes: List[Dict], new_classes: List[Dict], path: str,
+                compact: bool = False) -> Dict[str, int]:
+    """
+    Stream the diff into path
+
+    Returns:
+        Count of records per change kind
+    """
+    counts: Dict[str, int] = {}
+    with StreamingJSONWriter(path, indent=None if compact else 2) as writer:
+        for change in diff_sdk(old_classes, new_classes):
+            writer.write(change)
+            counts[change["change"]] = counts.get(change["change"], 0) + 1
+    return counts
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Diff two sdk_data.json files')
+    parser.add_argument('old', help='Previous sdk_data.json (either schema)')
+    parser.add_argument('new', help='New sdk_data.json (either schema)')
+    parser.add_argument('-o', '--output', default=DELTA_FILE, help='Delta JSON to write (default: %(default)s)')
+    parser.add_argument('--compact', action='store_true', help='Write the delta without indentation')
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    old_classes = load_classes(args.old)
+    new_classes = load_classes(args.new)
+    load_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    counts = write_delta(old_classes, new_classes, args.output, compact=args.compact)
+    diff_time = time.perf_counter() - start
+
+    print(f"📦 {len(old_classes):,} -> {len(new_classes):,} classes (loaded in {load_time:.2f}s)")
+    if not counts:
+        print("✅ No differences")
+    for change, count in sorted(counts.items()):
+        print(f"  {change:18} {count:,}")
+    print(f"💾 Wrote {args.output} ({sum(counts.values()):,} changes, diffed in {diff_time:.2f}s)")
+
+
+if __name__ == "__main__":
+    main()
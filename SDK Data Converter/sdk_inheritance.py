@@ -0,0 +1,208 @@
+"""
+Inheritance resolution over the converted SDK
+
+Resolves every class's "P" once, so consumers don't walk parents by name on
+each query. Builds the parent/child adjacency, a topological order (every
+class after its parent), and reports cycles and parents missing from the dump.
+Resolution is a single O(classes + members) pass; flattened member lists are
+optional because their total size grows with the depth of the hierarchy.
+
+Index layout (inheritance.json):
+    {
+      "version": 1,
+      "classes": ["UObject", "AActor", ...],   topological order, then unresolved classes
+      "ordered": 15000,                        how many leading entries are in topological order
+      "parents": [-1, 0, ...],                 index of each class's parent, -1 for roots
+      "children": [[1, ...], [], ...],         indices of each class's direct children
+      "missing_parents": {"UFoo": ["UBar", ...]},
+      "cycles": [["A", "B"], ...],
+      "flattened": {"AActor": [{"N": ..., "T": ..., "O": ..., "S": ..., "D": "UObject"}, ...]}   with --flatten
+    }
+Classes whose parent is missing count as roots. Classes on a cycle, and
+classes that inherit from one, are listed after the ordered ones.
+
+Usage:
+    python sdk_inheritance.py ../Latest/Data/sdk_data.json [--flatten] [--class AFortPawn]
+"""
+
+import json
+import time
+from typing import Dict, Iterator, List, Optional
+
+from sdk_diff import index_classes
+from sdk_schema import load_classes
+from sdk_writer import write_json_atomic
+
+
+INHERITANCE_FILE = "inheritance.json"
+INHERITANCE_VERSION = 1
+
+
+def build_inheritance(classes: List[Dict], flatten: bool = False) -> Dict:
+    """Resolve the hierarchy of classes in sdk_data.json format"""
+    records = index_classes(classes)
+
+    children: Dict[str, List[str]] = {name: [] for name in records}
+    missing: Dict[str, List[str]] = {}
+    roots = []
+    for name, record in records.items():
+        parent = record["P"]
+        if parent in records:
+            children[parent].append(name)
+        else:
+            if parent:
+                missing.setdefault(parent, []).append(name)
+            roots.append(name)
+
+    # Depth-first from the roots, so each subtree follows its base class
+    order = []
+    position: Dict[str, int] = {}
+    stack = list(reversed(roots))
+    while stack:
+        name = stack.pop()
+        position[name] = len(order)
+        order.append(name)
+        stack.extend(reversed(children[name]))
+    ordered = len(order)
+
+    # Anything not reached sits on a cycle or below one; walk up to find the cycles
+    cycles = []
+    walk_of: Dict[str, int] = {}
+    for walk, start in enumerate(records):
+        if start in position or start in walk_of:
+            continue
+        name = start
+        path = []
+        while name not in position and name not in walk_of:
+            walk_of[name] = walk
+            path.append(name)
+            name = records[name]["P"]
+        if walk_of.get(name) == walk and name not in position:
+            cycles.append(path[path.index(name):])
+
+    for name in records:
+        if name not in position:
+            position[name] = len(order)
+            order.append(name)
+
+    index = {
+        "version": INHERITANCE_VERSION,
+        "classes": order,
+        "ordered": ordered,
+        "parents": [position.get(records[name]["P"], -1) for name in order],
+        "children": [[position[child] for child in children[name]] for name in order],
+        "missing_parents": missing,
+        "cycles": cycles,
+    }
+    if flatten:
+        index["flattened"] = flatten_members(records, order[:ordered])
+    return index
+
+
+def flatten_members(records: Dict[str, Dict], order: List[str]) -> Dict[str, List[Dict]]:
+    """
+    Inherited plus own members for each class, each tagged with its declaring class in "D"
+
+    order must list parents before children, so every parent's list already exists.
+    """
+    flattened: Dict[str, List[Dict]] = {}
+    for name in order:
+        record = records[name]
+        inherited = flattened.get(record["P"], [])
+        flattened[name] = inherited + [dict(member, D=name) for member in record["M"]]
+    return flattened
+
+
+def write_inheritance(classes: List[Dict], path: str, flatten: bool = False) -> int:
+    """Build and atomically write the index; returns the file size in bytes"""
+    return write_json_atomic(path, build_inheritance(classes, flatten=flatten), indent=None)
+
+
+class InheritanceIndex:
+    """Query side of inheritance.json"""
+
+    def __init__(self, data: Dict):
+        if data.get("version") != INHERITANCE_VERSION:
+            raise ValueError(f"Unsupported inheritance index version {data.get('version')}")
+        self.classes = data["classes"]
+        self.parents = data["parents"]
+        self.children = data["children"]
+        self.missing_parents = data["missing_parents"]
+        self.cycles = data["cycles"]
+        self.flattened = data.get("flattened")
+        self._positions = {name: i for i, name in enumerate(self.classes)}
+
+    @classmethod
+    def load(cls, path: str) -> 'InheritanceIndex':
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls(json.load(f))
+
+    def parent(self, name: str) -> Optional[str]:
+        position = self._positions.get(name)
+        if position is None or self.parents[position] < 0:
+            return None
+        return self.classes[self.parents[position]]
+
+    def ancestors(self, name: str) -> List[str]:
+        """Parent first, root last (stops early on a cycle)"""
+        chain = []
+        seen = {name}
+        parent = self.parent(name)
+        while parent is not None and parent not in seen:
+            chain.append(parent)
+            seen.add(parent)
+            parent = self.parent(parent)
+        return chain
+
+    def descendants(self, name: str) -> Iterator[str]:
+        position = self._positions.get(name)
+        if position is None:
+            return
+        seen = {position}
+        stack = list(reversed(self.children[position]))
+        while stack:
+            child = stack.pop()
+            if child in seen:
+                continue
+            seen.add(child)
+            yield self.classes[child]
+            stack.extend(reversed(self.children[child]))
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Resolve the class hierarchy of an sdk_data.json')
+    parser.add_argument('sdk_file', help='Converted sdk_data.json (either schema)')
+    parser.add_argument('-o', '--output', help=f'Write the index here (e.g. {INHERITANCE_FILE})')
+    parser.add_argument('--flatten', action='store_true', help='Include flattened member lists')
+    parser.add_argument('--class', dest='class_name', help='Print the parent chain and flattened layout of one class')
+    args = parser.parse_args()
+
+    classes = load_classes(args.sdk_file)
+
+    start = time.perf_counter()
+    data = build_inheritance(classes, flatten=args.flatten or bool(args.class_name))
+    elapsed = time.perf_counter() - start
+
+    print(f"🌳 {len(data['classes']):,} classes resolved in {elapsed * 1000:.1f} ms: "
+          f"{sum(1 for p in data['parents'] if p < 0):,} roots, {len(data['missing_parents']):,} missing parents, "
+          f"{len(data['cycles']):,} cycles")
+    for cycle in data["cycles"]:
+        print(f"  ⚠️  cycle: {' -> '.join(cycle)}")
+
+    if args.class_name:
+        index = InheritanceIndex(data)
+        print(' -> '.join([args.class_name] + index.ancestors(args.class_name)))
+        for member in (index.flattened or {}).get(args.class_name, []):
+            print(f"  {member['O']:>8}  {member['S']:>6}  {member['T']} {member['N']}  ({member['D']})")
+
+    if args.output:
+        if not args.flatten:
+            data.pop("flattened", None)
+        size = write_json_atomic(args.output, data, indent=None)
+        print(f"💾 Wrote {args.output} ({size:,} bytes)")
+
+
+if __name__ == "__main__":
+    main()
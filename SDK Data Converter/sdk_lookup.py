@@ -0,0 +1,328 @@
+"""
+Persistent lookup index (sdk_lookup.idx) and a command-line lookup tool
+
+Answers "where is AFortPawn.CurrentWeapon" and "what is at AFortPawn + 0x330"
+straight out of an mmap: nothing is parsed at startup, each lookup is a few
+binary searches over fixed-width entries, so a fresh process answers in
+milliseconds however large the dump is.
+
+Layout (little-endian):
+    header          HEADER
+    class table     CLASS_ENTRY * class_count      sorted by UTF-8 name; first class wins on duplicate names
+    member table    MEMBER_ENTRY * member_count    each class's members contiguous, sorted by name
+    offset order    uint32 * member_count          member table indices, each class's run sorted by offset
+    string data     UTF-8 bytes of every unique name and type
+
+Entries refer to strings by (offset, length) into the string data, and to
+their parent by class table index, so member lookups walk up the parents the
+same way sdk_server's /offset route and create_globals --from-sdk do.
+
+Usage:
+    python sdk_lookup.py AFortPawn.CurrentWeapon [APlayerState.TeamIndex ...]
+    python sdk_lookup.py --offset AFortPawn 0x330
+    python sdk_lookup.py AFortPawn --index ../Latest/Data/sdk_lookup.idx --json
+    python sdk_lookup.py --build ../Latest/Data/sdk_data.json
+"""
+
+import mmap
+import os
+import struct
+import sys
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+
+LOOKUP_FILE = "sdk_lookup.idx"
+MAGIC = b'NSLK'
+FORMAT_VERSION = 1
+
+# magic, version, reserved, class_count, member_count,
+# class_table_offset, member_table_offset, offset_order_offset, string_data_offset
+HEADER = struct.Struct('<4sHHIIQQQQ')
+# name (offset, length), parent name (offset, length), parent index (-1 if not in the dump),
+# size, first member, member count
+CLASS_ENTRY = struct.Struct('<IIIIiIII')
+# name (offset, length), type (offset, length), offset, size
+MEMBER_ENTRY = struct.Struct('<IIIIII')
+OFFSET_ENTRY = struct.Struct('<I')
+NO_PARENT = -1
+
+
+def encode_lookup(classes: List[Dict]) -> bytes:
+    """Encode classes in sdk_data.json format into the lookup index format"""
+    string_offsets: Dict[str, Tuple[int, int]] = {}
+    strings: List[bytes] = []
+    position = 0
+
+    def intern(text: str) -> Tuple[int, int]:
+        nonlocal position
+        entry = string_offsets.get(text)
+        if entry is None:
+            data = text.encode('utf-8')
+            entry = string_offsets[text] = (position, len(data))
+            strings.append(data)
+            position += len(data)
+        return entry
+
+    first: Dict[str, Dict] = {}
+    for record in classes:
+        first.setdefault(record["N"], record)
+    ordered = sorted(first, key=lambda name: name.encode('utf-8'))
+    index_of = {name: index for index, name in enumerate(ordered)}
+
+    class_entries = []
+    member_entries = []
+    offset_order = []
+    for name in ordered:
+        record = first[name]
+        members = sorted(((m["N"], m["T"], int(m["O"], 16), int(m["S"], 16)) for m in record["M"]),
+                         key=lambda member: member[0].encode('utf-8'))
+        first_member = len(member_entries)
+        for member_name, member_type, offset, size in members:
+            member_entries.append(MEMBER_ENTRY.pack(*intern(member_name), *intern(member_type), offset, size))
+        by_offset = sorted(range(len(members)), key=lambda i: members[i][2])
+        offset_order.extend(OFFSET_ENTRY.pack(first_member + i) for i in by_offset)
+        class_entries.append(CLASS_ENTRY.pack(*intern(name), *intern(record["P"]),
+                                              index_of.get(record["P"], NO_PARENT),
+                                              record["S"], first_member, len(members)))
+
+    class_table_offset = HEADER.size
+    member_table_offset = class_table_offset + CLASS_ENTRY.size * len(class_entries)
+    offset_order_offset = member_table_offset + MEMBER_ENTRY.size * len(member_entries)
+    string_data_offset = offset_order_offset + OFFSET_ENTRY.size * len(offset_order)
+    header = HEADER.pack(MAGIC, FORMAT_VERSION, 0, len(class_entries), len(member_entries),
+                         class_table_offset, member_table_offset, offset_order_offset, string_data_offset)
+    return b''.join([header, *class_entries, *member_entries, *offset_order, *strings])
+
+
+def write_lookup_index(classes: List[Dict], path: str) -> int:
+    """Encode and atomically write the lookup index; returns the file size in bytes"""
+    # Imported here so the lookup CLI only loads what a lookup needs
+    from sdk_writer import write_bytes_atomic
+
+    return write_bytes_atomic(path, encode_lookup(classes))
+
+
+class LookupIndex:
+    """Binary-search lookups over an mmapped sdk_lookup.idx"""
+
+    def __init__(self, path: str):
+        self._file = open(path, 'rb')
+        try:
+            self._data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError(f"{path} is empty, not a lookup index")
+
+        if len(self._data) < HEADER.size:
+            self.close()
+            raise ValueError(f"{path} is too small to be a lookup index")
+        (magic, version, _, self.class_count, self.member_count, self._class_table,
+         self._member_table, self._offset_order, self._string_data) = HEADER.unpack_from(self._data, 0)
+        if magic != MAGIC:
+            self.close()
+            raise ValueError(f"{path} is not a lookup index (bad magic {magic!r})")
+        if version != FORMAT_VERSION:
+            self.close()
+            raise ValueError(f"{path} has unsupported format version {version}")
+
+    def __enter__(self) -> 'LookupIndex':
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+    def __len__(self) -> int:
+        return self.class_count
+
+    def close(self):
+        if self._data is not None:
+            self._data.close()
+            self._data = None
+        self._file.close()
+
+    def _bytes(self, offset: int, length: int) -> bytes:
+        start = self._string_data + offset
+        return self._data[start:start + length]
+
+    def _class(self, index: int) -> Tuple[int, ...]:
+        return CLASS_ENTRY.unpack_from(self._data, self._class_table + CLASS_ENTRY.size * index)
+
+    def _member(self, index: int) -> Tuple[int, ...]:
+        return MEMBER_ENTRY.unpack_from(self._data, self._member_table + MEMBER_ENTRY.size * index)
+
+    def find_class(self, name: str) -> Optional[int]:
+        """Class table index of name, or None"""
+        key = name.encode('utf-8')
+        low, high = 0, self.class_count
+        while low < high:
+            middle = (low + high) // 2
+            entry = self._class(middle)
+            if self._bytes(entry[0], entry[1]) < key:
+                low = middle + 1
+            else:
+                high = middle
+        if low < self.class_count:
+            entry = self._class(low)
+            if self._bytes(entry[0], entry[1]) == key:
+                return low
+        return None
+
+    def _ancestry(self, index: int) -> Iterator[Tuple[int, Tuple[int, ...]]]:
+        """(index, entry) for the class and each parent in the dump, nearest first"""
+        seen = set()
+        while index != NO_PARENT and index not in seen:
+            seen.add(index)
+            entry = self._class(index)
+            yield index, entry
+            index = entry[4]
+
+    def _member_result(self, class_name: str, owner: Tuple[int, ...], member_index: int) -> Dict[str, Any]:
+        name_offset, name_length, type_offset, type_length, offset, size = self._member(member_index)
+        return {
+            "class": class_name,
+            "declared_in": self._bytes(owner[0], owner[1]).decode('utf-8'),
+            "name": self._bytes(name_offset, name_length).decode('utf-8'),
+            "type": self._bytes(type_offset, type_length).decode('utf-8'),
+            "offset": offset,
+            "size": size,
+        }
+
+    def class_info(self, name: str) -> Optional[Dict[str, Any]]:
+        """Name, parent, size and member count of a class"""
+        index = self.find_class(name)
+        if index is None:
+            return None
+        _, _, parent_offset, parent_length, _, size, _, member_count = self._class(index)
+        return {"class": name, "parent": self._bytes(parent_offset, parent_length).decode('utf-8'),
+                "size": size, "members": member_count}
+
+    def find_member(self, class_name: str, member_name: str) -> Optional[Dict[str, Any]]:
+        """class_name.member_name, declared by the class itself or its nearest parent that has it"""
+        index = self.find_class(class_name)
+        if index is None:
+            return None
+        key = member_name.encode('utf-8')
+        for _, entry in self._ancestry(index):
+            first, count = entry[6], entry[7]
+            low, high = first, first + count
+            while low < high:
+                middle = (low + high) // 2
+                member = self._member(middle)
+                if self._bytes(member[0], member[1]) < key:
+                    low = middle + 1
+                else:
+                    high = middle
+            if low < first + count:
+                member = self._member(low)
+                if self._bytes(member[0], member[1]) == key:
+                    return self._member_result(class_name, entry, low)
+        return None
+
+    def member_at(self, class_name: str, offset: int) -> Optional[Dict[str, Any]]:
+        """The member whose [offset, offset + size) covers offset, in class_name or its nearest parent"""
+        index = self.find_class(class_name)
+        if index is None:
+            return None
+        for _, entry in self._ancestry(index):
+            first, count = entry[6], entry[7]
+            # Rightmost member starting at or before offset, like bisect_right() - 1
+            low, high = 0, count
+            while low < high:
+                middle = (low + high) // 2
+                if self._member(self._order(first + middle))[4] <= offset:
+                    low = middle + 1
+                else:
+                    high = middle
+            if low:
+                member_index = self._order(first + low - 1)
+                _, _, _, _, start, size = self._member(member_index)
+                if offset < start + max(size, 1):
+                    result = self._member_result(class_name, entry, member_index)
+                    result["delta"] = offset - start
+                    return result
+        return None
+
+    def _order(self, position: int) -> int:
+        return OFFSET_ENTRY.unpack_from(self._data, self._offset_order + OFFSET_ENTRY.size * position)[0]
+
+
+def _format_member(result: Dict[str, Any]) -> str:
+    inherited = f"  (from {result['declared_in']})" if result["declared_in"] != result["class"] else ""
+    delta = f" + 0x{result['delta']:X}" if result.get("delta") else ""
+    return (f"{result['class']}.{result['name']}{delta}  {result['type']}  "
+            f"offset 0x{result['offset']:X}  size 0x{result['size']:X}{inherited}")
+
+
+def _stale_warning(index_path: str) -> Optional[str]:
+    """The index is only as fresh as the conversion that wrote it"""
+    data_path = os.path.join(os.path.dirname(os.path.abspath(index_path)), "sdk_data.json")
+    if os.path.exists(data_path) and os.path.getmtime(data_path) > os.path.getmtime(index_path):
+        return f"⚠️  {data_path} is newer than {index_path}; rebuild it with --build or the converter's --lookup-index"
+    return None
+
+
+def main():
+    import argparse
+
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    parser = argparse.ArgumentParser(description='Look up classes, members and offsets in the mmapped lookup index')
+    parser.add_argument('names', nargs='*', metavar='CLASS[.MEMBER]',
+                        help='Classes or Class.Member pairs; members are searched in parent classes too')
+    parser.add_argument('--offset', nargs=2, action='append', default=[], metavar=('CLASS', 'OFFSET'),
+                        help='Member covering OFFSET (hex, 0x optional) in CLASS or a parent; repeatable')
+    parser.add_argument('--index', default=os.path.join(script_dir, '..', 'Latest', 'Data', LOOKUP_FILE),
+                        help=f'Lookup index to read (default: ../Latest/Data/{LOOKUP_FILE})')
+    parser.add_argument('--build', metavar='SDK_FILE',
+                        help='Write the index from sdk_data.json (either schema) first')
+    parser.add_argument('--json', action='store_true', help='Print results as JSON')
+    args = parser.parse_args()
+
+    if args.build:
+        from sdk_schema import load_classes
+
+        classes = load_classes(args.build)
+        size = write_lookup_index(classes, args.index)
+        print(f"🗂️  Wrote {args.index}: {len(classes):,} classes ({size / 1024 / 1024:.2f} MB)", file=sys.stderr)
+    if not args.names and not args.offset:
+        if not args.build:
+            parser.error("Nothing to look up")
+        return 0
+
+    if not os.path.exists(args.index):
+        parser.error(f"{args.index} not found; convert with --lookup-index or pass --build sdk_data.json")
+    warning = _stale_warning(args.index)
+    if warning:
+        print(warning, file=sys.stderr)
+
+    results = []
+    with LookupIndex(args.index) as index:
+        for name in args.names:
+            class_name, _, member_name = name.partition('.')
+            result = index.find_member(class_name, member_name) if member_name else index.class_info(class_name)
+            results.append((name, result))
+        for class_name, text in args.offset:
+            try:
+                offset = int(text, 16)
+            except ValueError:
+                parser.error(f"Not an offset: {text!r}")
+            results.append((f"{class_name}+0x{offset:X}", index.member_at(class_name, offset)))
+
+    if args.json:
+        import json
+
+        print(json.dumps({query: result for query, result in results}, indent=2))
+    else:
+        for query, result in results:
+            if result is None:
+                print(f"❌ {query} not found")
+            elif "members" in result:
+                print(f"{result['class']} : {result['parent'] or '-'}  size 0x{result['size']:X}  "
+                      f"{result['members']} members")
+            else:
+                print(_format_member(result))
+    return 1 if any(result is None for _, result in results) else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
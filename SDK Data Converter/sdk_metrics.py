@@ -0,0 +1,215 @@
+"""
+Process metrics and instrumentation shared by the SDK converters
+
+Metrics collects named phase timers, counters and the slowest files/classes;
+run_profiled() wraps a run in cProfile when --profile is given and writes a
+.pstats file next to a JSON metrics report.
+"""
+
+import argparse
+import contextlib
+import cProfile
+import heapq
+import io
+import pstats
+import sys
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+DEFAULT_TOP_N = 10
+PROFILE_FUNCTIONS = 30
+
+
+def get_peak_rss() -> Optional[int]:
+    """
+    Peak resident set size of the current process in bytes
+
+    Returns:
+        Peak RSS in bytes, or None if the platform doesn't expose it
+    """
+    if sys.platform == 'win32':
+        try:
+            import ctypes
+            from ctypes import wintypes
+
+            class PROCESS_MEMORY_COUNTERS(ctypes.Structure):
+                _fields_ = [
+                    ('cb', wintypes.DWORD),
+                    ('PageFaultCount', wintypes.DWORD),
+                    ('PeakWorkingSetSize', ctypes.c_size_t),
+                    ('WorkingSetSize', ctypes.c_size_t),
+                    ('QuotaPeakPagedPoolUsage', ctypes.c_size_t),
+                    ('QuotaPagedPoolUsage', ctypes.c_size_t),
+                    ('QuotaPeakNonPagedPoolUsage', ctypes.c_size_t),
+                    ('QuotaNonPagedPoolUsage', ctypes.c_size_t),
+                    ('PagefileUsage', ctypes.c_size_t),
+                    ('PeakPagefileUsage', ctypes.c_size_t),
+                ]
+
+            counters = PROCESS_MEMORY_COUNTERS()
+            counters.cb = ctypes.sizeof(counters)
+            process = ctypes.windll.kernel32.GetCurrentProcess()
+            if ctypes.windll.psapi.GetProcessMemoryInfo(process, ctypes.byref(counters), counters.cb):
+                return int(counters.PeakWorkingSetSize)
+        except Exception:
+            pass
+        return None
+
+    try:
+        import resource
+    except ImportError:
+        return None
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS and in kilobytes everywhere else
+    return int(peak) if sys.platform == 'darwin' else int(peak) * 1024
+
+
+def format_bytes(size: Optional[int]) -> str:
+    """Human readable byte count, 'n/a' when unknown"""
+    if size is None:
+        return 'n/a'
+    return f"{size:,} bytes ({size / 1024 / 1024:.2f} MB)"
+
+
+class Metrics:
+    """
+    Named phase timers, counters and top-N slowest items
+
+    Phase times accumulate, so hot paths can add many small measurements to
+    one phase with add_time(). Snapshots from worker processes are folded in
+    with merge().
+    """
+
+    def __init__(self, top_n: int = DEFAULT_TOP_N):
+        self.top_n = top_n
+        self.started = time.perf_counter()
+        self.phases: Dict[str, float] = {}
+        self.counters: Dict[str, int] = {}
+        # category -> min-heap of (seconds, name) holding the slowest top_n
+        self._slowest: Dict[str, List[Tuple[float, str]]] = {}
+
+    @contextlib.contextmanager
+    def phase(self, name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_time(name, time.perf_counter() - start)
+
+    def add_time(self, name: str, seconds: float):
+        self.phases[name] = self.phases.get(name, 0.0) + seconds
+
+    def count(self, name: str, amount: int = 1):
+        self.counters[name] = self.counters.get(name, 0) + amount
+
+    def record(self, category: str, name: str, seconds: float):
+        """Offer an item (file, class, ...) for the category's slowest list"""
+        heap = self._slowest.setdefault(category, [])
+        if len(heap) < self.top_n:
+            heapq.heappush(heap, (seconds, name))
+        elif seconds > heap[0][0]:
+            heapq.heapreplace(heap, (seconds, name))
+
+    def slowest(self, category: str) -> List[Tuple[float, str]]:
+        return sorted(self._slowest.get(category, ()), reverse=True)
+
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Picklable state for merge() in another process"""
+        return {"phases": self.phases, "counters": self.counters, "slowest": self._slowest}
+
+    def merge(self, snapshot: Dict[str, Any]):
+        for name, seconds in snapshot["phases"].items():
+            self.add_time(name, seconds)
+        for name, amount in snapshot["counters"].items():
+            self.count(name, amount)
+        for category, items in snapshot["slowest"].items():
+            for seconds, name in items:
+                self.record(category, name, seconds)
+
+    def report(self) -> Dict[str, Any]:
+        """JSON-serializable summary of everything collected"""
+        return {
+            "elapsed_seconds": self.elapsed(),
+            "peak_rss": get_peak_rss(),
+            "phases": dict(self.phases),
+            "counters": dict(self.counters),
+            "slowest": {
+                category: [{"name": name, "seconds": seconds} for seconds, name in self.slowest(category)]
+                for category in self._slowest
+            },
+        }
+
+    def log_summary(self, log: Callable[[str], None] = print, detailed: bool = False):
+        """One line of totals, or with detailed the phases, counters and slowest items"""
+        elapsed = self.elapsed()
+        if not detailed:
+            peak = get_peak_rss()
+            memory = f", peak memory {peak / 1024 / 1024:.0f} MB" if peak else ""
+            log(f"⏱️  {elapsed:.2f}s total{memory} (-v for the phase breakdown)")
+            return
+        if self.phases:
+            log("⏱️  Phases:")
+            for name, seconds in self.phases.items():
+                share = seconds / elapsed * 100 if elapsed > 0 else 0
+                log(f"    {name:<14} {seconds:9.3f}s  {share:5.1f}%")
+        if self.counters:
+            log("🔢 Counters: " + ', '.join(f"{name} {value:,}" for name, value in self.counters.items()))
+        for category in self._slowest:
+            log(f"🐢 Slowest {category}:")
+            for seconds, name in self.slowest(category):
+                log(f"    {seconds * 1000:9.2f} ms  {name}")
+
+
+def add_profile_argument(parser: argparse.ArgumentParser, default_prefix: str):
+    """Register --profile [PREFIX] and -v/--verbose on a converter's argument parser"""
+    parser.add_argument('--profile', nargs='?', const=default_prefix, metavar='PREFIX',
+                        help=f'Run under cProfile and write PREFIX.pstats plus PREFIX_metrics.json '
+                             f'(default prefix: {default_prefix}); implies --verbose')
+    parser.add_argument('-v', '--verbose', action='store_true',
+                        help='End with the phase breakdown, counters and slowest files/classes')
+
+
+def wants_breakdown(args: argparse.Namespace) -> bool:
+    """Whether the run should end with the detailed metrics (--profile or --verbose)"""
+    return bool(args.profile or args.verbose)
+
+
+def _top_functions(profile: cProfile.Profile, limit: int = PROFILE_FUNCTIONS) -> List[Dict[str, Any]]:
+    stats = pstats.Stats(profile, stream=io.StringIO())
+    rows = []
+    for (filename, line, function), (_, calls, tottime, cumtime, _) in stats.stats.items():
+        rows.append({"function": f"{filename}:{line}({function})", "calls": calls,
+                     "tottime": tottime, "cumtime": cumtime})
+    rows.sort(key=lambda row: row["cumtime"], reverse=True)
+    return rows[:limit]
+
+
+def run_profiled(func: Callable[[], Any], prefix: Optional[str], metrics: Metrics,
+                 log: Callable[[str], None] = print) -> Any:
+    """
+    Call func, under cProfile if prefix is set
+
+    With a prefix, PREFIX.pstats (for pstats/snakeviz) and PREFIX_metrics.json
+    (metrics.report() plus the most expensive functions) are written even if
+    func raises.
+    """
+    if not prefix:
+        return func()
+
+    from sdk_writer import write_json_atomic
+
+    profile = cProfile.Profile()
+    try:
+        return profile.runcall(func)
+    finally:
+        stats_path = f"{prefix}.pstats"
+        report_path = f"{prefix}_metrics.json"
+        profile.dump_stats(stats_path)
+        report = metrics.report()
+        report["profile"] = {"pstats": stats_path, "top_functions": _top_functions(profile)}
+        write_json_atomic(report_path, report)
+        log(f"🔬 Wrote profile {stats_path} and metrics {report_path}")
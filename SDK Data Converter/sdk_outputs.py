@@ -0,0 +1,129 @@
+"""
+Optional output artifacts shared by convert_sdk.py and single-hpp-to-json.py
+
+Each converter registers these arguments on its parser, calls
+remove_stale_outputs() on every run and write_extra_outputs() once
+sdk_data.json has been written.
+"""
+
+import argparse
+import os
+from typing import Callable, Dict, List, Optional
+
+import sdk_binary
+import sdk_inheritance
+import sdk_lookup
+import sdk_patch
+import sdk_publish
+import sdk_schema
+import sdk_search
+import sdk_shards
+import sdk_sqlite
+import sdk_typerefs
+
+
+def add_output_arguments(parser: argparse.ArgumentParser, packages_available: bool = False):
+    """Register the optional output flags on a converter's argument parser"""
+    group = parser.add_argument_group('extra outputs')
+    group.add_argument('--shards', action='store_true',
+                       help=f'Also write size-balanced shards plus {sdk_shards.MANIFEST_FILE} for on-demand loading')
+    group.add_argument('--shard-size', type=int, default=sdk_shards.DEFAULT_SHARD_KB, metavar='KB',
+                       help='Target size of each shard in KB (default: %(default)s)')
+    group.add_argument('--shard-by', choices=['prefix', 'package'] if packages_available else ['prefix'],
+                       default='prefix', help='Group shards by class name prefix or by source package')
+    group.add_argument('--binary', action='store_true',
+                       help=f'Also write the compact binary format ({sdk_binary.BINARY_FILE})')
+    group.add_argument('--lookup-index', action='store_true',
+                       help=f'Also write {sdk_lookup.LOOKUP_FILE}: sorted fixed-width class/member entries for sdk_lookup.py')
+    group.add_argument('--search-index', action='store_true',
+                       help=f'Also write a trigram {sdk_search.SEARCH_INDEX_FILE} over class/member names and offsets')
+    group.add_argument('--type-refs', action='store_true',
+                       help=f'Also write {sdk_typerefs.TYPE_REFS_FILE}: every type name -> the members that use it')
+    group.add_argument('--inheritance', action='store_true',
+                       help=f'Also write {sdk_inheritance.INHERITANCE_FILE}: resolved parents, children and topological order')
+    group.add_argument('--flatten', action='store_true',
+                       help='Include flattened member lists (inherited members tagged with their class) in the inheritance index')
+    group.add_argument('--sqlite', action='store_true',
+                       help=f'Also write {sdk_sqlite.SQLITE_FILE} with indexed classes, members, inheritance and FTS5 search')
+    group.add_argument('--patch-from', metavar='OLD_JSON',
+                       help=f'Also write {sdk_patch.PATCH_DIR}/<hash>.json taking this previous sdk_data.json to the new one')
+    group.add_argument('--publish', action='store_true',
+                       help=f'Write content-hashed, gzip/brotli-compressed copies plus {sdk_publish.DATA_MANIFEST_FILE}')
+
+
+def wants_extra_outputs(args: argparse.Namespace) -> bool:
+    return bool(args.shards or args.binary or args.lookup_index or args.search_index or args.type_refs or args.inheritance or args.flatten
+                or args.sqlite or args.patch_from or args.publish)
+
+
+def remove_stale_outputs(output_dir: str, args: argparse.Namespace, log: Callable[[str], None] = print):
+    """Delete artifacts of an earlier run that this run won't rewrite and the viewer would still prefer"""
+    if not getattr(args, 'shards', False) and sdk_shards.remove_shards(output_dir):
+        log(f"🧹 Removed {sdk_shards.MANIFEST_FILE} and {sdk_shards.SHARD_DIR}/ from an earlier --shards run")
+
+
+def write_extra_outputs(classes: List[Dict], output_dir: str, args: argparse.Namespace,
+                        packages: Optional[Dict[str, str]] = None,
+                        log: Callable[[str], None] = print,
+                        data_path: Optional[str] = None):
+    """
+    Write every optional artifact requested on the command line
+
+    data_path is the sdk_data.json that was just written (default: output_dir/sdk_data.json).
+    """
+    data_path = data_path or os.path.join(output_dir, "sdk_data.json")
+    if args.shards:
+        with open(data_path, 'rb') as f:
+            data_hash = sdk_publish.content_hash(f.read())
+        sdk_shards.write_shards(classes, output_dir, target_kb=args.shard_size, group_by=args.shard_by,
+                                packages=packages, data_hash=data_hash, log=log)
+
+    if args.binary:
+        path = os.path.join(output_dir, sdk_binary.BINARY_FILE)
+        size = sdk_binary.write_binary(classes, path)
+        log(f"🧱 Wrote binary SDK {path} ({size / 1024 / 1024:.2f} MB)")
+
+    if args.lookup_index:
+        path = os.path.join(output_dir, sdk_lookup.LOOKUP_FILE)
+        size = sdk_lookup.write_lookup_index(classes, path)
+        log(f"🗂️  Wrote lookup index {path} ({size / 1024 / 1024:.2f} MB)")
+
+    if args.search_index:
+        path = os.path.join(output_dir, sdk_search.SEARCH_INDEX_FILE)
+        size = sdk_search.write_search_index(classes, path)
+        log(f"🔎 Wrote search index {path} ({size / 1024 / 1024:.2f} MB)")
+
+    if args.type_refs:
+        path = os.path.join(output_dir, sdk_typerefs.TYPE_REFS_FILE)
+        size = sdk_typerefs.write_type_refs(classes, path)
+        log(f"🔗 Wrote type reference index {path} ({size / 1024 / 1024:.2f} MB)")
+
+    if args.inheritance or args.flatten:
+        path = os.path.join(output_dir, sdk_inheritance.INHERITANCE_FILE)
+        size = sdk_inheritance.write_inheritance(classes, path, flatten=args.flatten)
+        log(f"🌳 Wrote inheritance index {path} ({size / 1024 / 1024:.2f} MB)")
+
+    if args.sqlite:
+        path = os.path.join(output_dir, sdk_sqlite.SQLITE_FILE)
+        stats = sdk_sqlite.write_sqlite(classes, path)
+        log(f"🗄️  Wrote SQLite database {path} ({stats['bytes'] / 1024 / 1024:.2f} MB) in {stats['seconds']:.2f}s")
+
+    if args.patch_from and args.schema != sdk_schema.SCHEMA_V1:
+        log(f"🩹 Patches reproduce v1 files byte for byte; skipping --patch-from for schema v{args.schema}")
+    elif args.patch_from:
+        try:
+            result = sdk_patch.write_patch(args.patch_from, data_path,
+                                           os.path.join(output_dir, sdk_patch.PATCH_DIR))
+        except ValueError as e:
+            log(f"🩹 {e}; skipping --patch-from")
+            result = False
+        if result is None:
+            log("🩹 sdk_data.json is unchanged, no patch written")
+        elif result:
+            path, patch, size = result
+            log(f"🩹 Wrote patch {path} ({size:,} bytes): {len(patch['upserts']):,} upserts, "
+                f"{len(patch['deletes']):,} deletes")
+
+    # Last, so the manifest covers everything written above
+    if args.publish:
+        sdk_publish.publish_artifacts(output_dir, log=log)
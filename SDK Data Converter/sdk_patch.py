@@ -0,0 +1,226 @@
+"""
+Class-level patches between two sdk_data.json releases
+
+A client holding release N fetches patches/<hash of N>.json and applies it to
+get release N+1, instead of downloading the whole dataset again. Hashes are
+the same content hashes sdk_publish.py puts in data_manifest.json.
+
+Patch layout:
+    {
+      "version": 1,
+      "base": "<hash of the old sdk_data.json>",
+      "target": "<hash of the new sdk_data.json>",
+      "format": {"indent": 2, "ensure_ascii": true},
+      "classes": 15000,
+      "deletes": ["AOldClass", ...],
+      "upserts": [[index, record], [index, record, key], ...]
+    }
+Classes are keyed by name ("Name#n" for the n-th repeat of a name). Applying
+a patch drops the deleted and upserted keys from the old list, then fills the
+new list position by position: upserted records at their index, the remaining
+old records in their original order everywhere else. "format" records how
+the new file was serialized so apply_patch_bytes() can reproduce it byte for byte.
+
+Usage:
+    python sdk_patch.py make old/sdk_data.json new/sdk_data.json -o ../Latest/Data/patches
+    python sdk_patch.py apply old/sdk_data.json patches/<hash>.json -o sdk_data.json
+"""
+
+import json
+import os
+from typing import Dict, List, Optional, Tuple
+
+from sdk_diff import keyed_items
+from sdk_publish import content_hash
+from sdk_schema import SCHEMA_V1, detect_schema
+from sdk_writer import write_bytes_atomic, write_json_atomic
+
+
+PATCH_DIR = "patches"
+PATCH_VERSION = 1
+
+
+def detect_format(data: bytes) -> Dict:
+    """Serialization settings the converters would have used to produce data"""
+    return {"indent": 2 if data.startswith(b'[\n') else None, "ensure_ascii": data.isascii()}
+
+
+def serialize(classes: List[Dict], fmt: Dict) -> bytes:
+    """Serialize classes exactly like the converters' writers do"""
+    indent = fmt["indent"]
+    separators = (',', ':') if indent is None else None
+    return json.dumps(classes, indent=indent, separators=separators,
+                      ensure_ascii=fmt["ensure_ascii"]).encode('utf-8')
+
+
+def diff_classes(old_classes: List[Dict], new_classes: List[Dict]) -> Tuple[List[str], List[List]]:
+    """
+    Class-level deletes and upserts turning old_classes into new_classes
+
+    An old class is carried over untouched when it is identical and still in
+    the same relative order; everything else in the new list becomes an upsert.
+    Runs in one pass over both lists.
+    """
+    old_positions = {key: (position, record) for position, (key, record) in enumerate(keyed_items(old_classes))}
+    carried = set()
+    upserted = set()
+    upserts = []
+    last_position = -1
+
+    for index, (key, record) in enumerate(keyed_items(new_classes)):
+        previous = old_positions.get(key)
+        if previous is not None and previous[0] > last_position and previous[1] == record:
+            last_position = previous[0]
+            carried.add(key)
+            continue
+        upserted.add(key)
+        upserts.append([index, record] if key == record["N"] else [index, record, key])
+
+    deletes = [key for key in old_positions if key not in carried and key not in upserted]
+    return deletes, upserts
+
+
+def make_patch(old_data: bytes, new_data: bytes) -> Dict:
+    """
+    Build a patch from the raw bytes of two sdk_data.json files
+
+    Raises:
+        ValueError: If either file isn't a v1 class list (clients patch the exact
+        bytes they hold, so a v2 release can't be a base), or new_data was not
+        written by the converters' serializer, so applying a patch could not
+        reproduce it exactly
+    """
+    old_classes = json.loads(old_data)
+    new_classes = json.loads(new_data)
+    for label, parsed in (("Old", old_classes), ("New", new_classes)):
+        schema = detect_schema(parsed)
+        if schema != SCHEMA_V1:
+            raise ValueError(f"{label} sdk_data.json is schema v{schema}; patches only take v1 files")
+    fmt = detect_format(new_data)
+    if serialize(new_classes, fmt) != new_data:
+        raise ValueError("New sdk_data.json was not written by the converters; cannot reproduce it byte for byte")
+
+    deletes, upserts = diff_classes(old_classes, new_classes)
+    return {
+        "version": PATCH_VERSION,
+        "base": content_hash(old_data),
+        "target": content_hash(new_data),
+        "format": fmt,
+        "classes": len(new_classes),
+        "deletes": deletes,
+        "upserts": upserts,
+    }
+
+
+def apply_patch(old_classes: List[Dict], patch: Dict) -> List[Dict]:
+    """
+    Apply a patch to the parsed old class list
+
+    Raises:
+        ValueError: If the patch version is unknown or doesn't fit old_classes
+    """
+    if patch.get("version") != PATCH_VERSION:
+        raise ValueError(f"Unsupported patch version {patch.get('version')}")
+
+    dropped = set(patch["deletes"])
+    upserts = {}
+    for entry in patch["upserts"]:
+        index, record = entry[0], entry[1]
+        upserts[index] = record
+        dropped.add(entry[2] if len(entry) > 2 else record["N"])
+
+    remaining = iter([record for key, record in keyed_items(old_classes) if key not in dropped])
+    classes = []
+    try:
+        for index in range(patch["classes"]):
+            record = upserts.get(index)
+            classes.append(record if record is not None else next(remaining))
+    except StopIteration:
+        raise ValueError("Patch expects more classes than the old data has") from None
+    if next(remaining, None) is not None:
+        raise ValueError("Patch leaves old classes unplaced; it was made for different data")
+    return classes
+
+
+def apply_patch_bytes(old_data: bytes, patch: Dict) -> bytes:
+    """
+    Apply a patch to the raw old sdk_data.json and return the exact new file
+
+    Raises:
+        ValueError: If old_data isn't the patch's base or the result isn't its target
+    """
+    if content_hash(old_data) != patch.get("base"):
+        raise ValueError(f"Patch base {patch.get('base')} does not match the old data")
+    new_data = serialize(apply_patch(json.loads(old_data), patch), patch["format"])
+    if content_hash(new_data) != patch["target"]:
+        raise ValueError(f"Patched data does not hash to target {patch['target']}")
+    return new_data
+
+
+def write_patch(old_path: str, new_path: str, patch_dir: str) -> Optional[Tuple[str, Dict, int]]:
+    """
+    Write patches/<base hash>.json taking old_path to new_path
+
+    Returns:
+        (path, patch, size in bytes), or None if the files are identical
+    """
+    with open(old_path, 'rb') as f:
+        old_data = f.read()
+    with open(new_path, 'rb') as f:
+        new_data = f.read()
+
+    patch = make_patch(old_data, new_data)
+    if patch["base"] == patch["target"]:
+        return None
+
+    os.makedirs(patch_dir, exist_ok=True)
+    path = os.path.join(patch_dir, f"{patch['base']}.json")
+    size = write_json_atomic(path, patch, indent=None, ensure_ascii=patch["format"]["ensure_ascii"])
+    return path, patch, size
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Make or apply class-level sdk_data.json patches')
+    commands = parser.add_subparsers(dest='command', required=True)
+    make = commands.add_parser('make', help='Write a patch from an old to a new sdk_data.json')
+    make.add_argument('old_file')
+    make.add_argument('new_file')
+    make.add_argument('-o', '--output', default=PATCH_DIR, help='Patch directory (default: %(default)s)')
+    apply = commands.add_parser('apply', help='Apply a patch to an old sdk_data.json')
+    apply.add_argument('old_file')
+    apply.add_argument('patch_file')
+    apply.add_argument('-o', '--output', required=True, help='Where to write the patched sdk_data.json')
+    args = parser.parse_args()
+
+    if args.command == 'make':
+        try:
+            result = write_patch(args.old_file, args.new_file, args.output)
+        except ValueError as e:
+            print(f"❌ {e}")
+            return 1
+        if result is None:
+            print("✅ Files are identical, no patch needed")
+            return 0
+        path, patch, size = result
+        print(f"🩹 Wrote {path} ({size:,} bytes): {len(patch['upserts']):,} upserts, "
+              f"{len(patch['deletes']):,} deletes, {patch['base']} -> {patch['target']}")
+        return 0
+
+    with open(args.old_file, 'rb') as f:
+        old_data = f.read()
+    with open(args.patch_file, 'r', encoding='utf-8') as f:
+        patch = json.load(f)
+    try:
+        new_data = apply_patch_bytes(old_data, patch)
+    except ValueError as e:
+        print(f"❌ {e}")
+        return 1
+    write_bytes_atomic(args.output, new_data)
+    print(f"✅ Wrote {args.output} ({len(new_data):,} bytes, {patch['target']})")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,148 @@
+"""
+Content-hashed, precompressed copies of the viewer's data files
+
+For every artifact present in the data directory this writes
+    <stem>.<hash><suffix>        an immutable copy clients may cache forever
+    <stem>.<hash><suffix>.gz     gzip -9 copy (for gzip_static style servers)
+    <stem>.<hash><suffix>.br     brotli copy, when the optional 'brotli' package is installed
+and a tiny data_manifest.json with the current hashes. A client only has to
+fetch the manifest to know whether its cached copy is still current.
+
+Manifest layout:
+    {
+      "version": 1,
+      "files": {
+        "sdk_data.json": {"hash": "...", "path": "sdk_data.<hash>.json", "bytes": 123,
+                          "gzip": {"path": "....gz", "bytes": 45}, "br": {...}},
+        ...
+      }
+    }
+
+Usage:
+    python sdk_publish.py ../Latest/Data
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import re
+from typing import Callable, Dict, Iterable
+
+from sdk_writer import write_bytes_atomic, write_json_atomic
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+DATA_MANIFEST_FILE = "data_manifest.json"
+DATA_MANIFEST_VERSION = 1
+HASH_LENGTH = 16
+
+# Files the viewer (or tooling) downloads; any that exist get published
+ARTIFACTS = ("sdk_data.json", "globals.json", "sdk_manifest.json", "search_index.json", "inheritance.json",
+             "type_refs.json", "sdk_data.bin")
+
+
+def content_hash(data: bytes) -> str:
+    """Short content hash used in file names, the manifest and patch names"""
+    return hashlib.sha256(data).hexdigest()[:HASH_LENGTH]
+
+
+def _hashed_name(name: str, digest: str) -> str:
+    stem, suffix = os.path.splitext(name)
+    return f"{stem}.{digest}{suffix}"
+
+
+def _hashed_pattern(name: str):
+    stem, suffix = os.path.splitext(name)
+    return re.compile(rf'^{re.escape(stem)}\.([0-9a-f]{{{HASH_LENGTH}}}){re.escape(suffix)}(\.gz|\.br)?$')
+
+
+def _load_manifest(path: str) -> Dict:
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+        if manifest.get("version") == DATA_MANIFEST_VERSION:
+            return manifest
+    except (OSError, ValueError):
+        pass
+    return {"version": DATA_MANIFEST_VERSION, "files": {}}
+
+
+def publish_artifacts(data_dir: str, names: Iterable[str] = ARTIFACTS,
+                      log: Callable[[str], None] = print) -> Dict:
+    """
+    Write hashed and compressed copies of each artifact plus the manifest
+
+    Copies whose hash is unchanged are left alone. Hashed copies from older
+    runs are deleted, except the generation the previous manifest pointed at,
+    so clients that fetched that manifest moments ago can still finish.
+
+    Returns:
+        The manifest that was written
+    """
+    manifest_path = os.path.join(data_dir, DATA_MANIFEST_FILE)
+    previous = _load_manifest(manifest_path)
+    manifest = {"version": DATA_MANIFEST_VERSION, "files": {}}
+
+    for name in names:
+        source = os.path.join(data_dir, name)
+        if not os.path.isfile(source):
+            continue
+
+        with open(source, 'rb') as f:
+            data = f.read()
+        digest = content_hash(data)
+        hashed = _hashed_name(name, digest)
+        entry = {"hash": digest, "path": hashed, "bytes": len(data)}
+
+        hashed_path = os.path.join(data_dir, hashed)
+        if not os.path.exists(hashed_path):
+            write_bytes_atomic(hashed_path, data)
+
+        gzip_path = hashed_path + ".gz"
+        if not os.path.exists(gzip_path):
+            write_bytes_atomic(gzip_path, gzip.compress(data, compresslevel=9, mtime=0))
+        entry["gzip"] = {"path": hashed + ".gz", "bytes": os.path.getsize(gzip_path)}
+
+        if brotli is not None:
+            brotli_path = hashed_path + ".br"
+            if not os.path.exists(brotli_path):
+                write_bytes_atomic(brotli_path, brotli.compress(data, quality=11))
+            entry["br"] = {"path": hashed + ".br", "bytes": os.path.getsize(brotli_path)}
+
+        manifest["files"][name] = entry
+        sizes = ", ".join(f"{kind} {entry[kind]['bytes']:,}" for kind in ("gzip", "br") if kind in entry)
+        log(f"📮 {name} -> {hashed} ({len(data):,} bytes; {sizes})")
+
+    write_json_atomic(manifest_path, manifest, indent=2)
+
+    for name in names:
+        keep = {entry["hash"] for entry in (manifest["files"].get(name), previous["files"].get(name)) if entry}
+        pattern = _hashed_pattern(name)
+        for existing in os.listdir(data_dir):
+            match = pattern.match(existing)
+            if match and match.group(1) not in keep:
+                os.remove(os.path.join(data_dir, existing))
+
+    if brotli is None:
+        log("ℹ️  'brotli' not installed; skipped .br copies (pip install brotli)")
+    log(f"📮 Wrote {manifest_path}")
+    return manifest
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Publish content-hashed, compressed copies of the SDK data files')
+    parser.add_argument('data_dir', nargs='?', default='Data', help='Directory holding sdk_data.json/globals.json')
+    args = parser.parse_args()
+
+    publish_artifacts(args.data_dir)
+
+
+if __name__ == "__main__":
+    main()
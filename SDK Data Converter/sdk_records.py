@@ -0,0 +1,146 @@
+"""
+Compact in-memory class and member records shared by the SDK converters
+
+Members used to be dicts of four strings, with offsets and sizes kept as hex
+text and parsed back with int(x, 16) for every sort key and size calculation.
+These records hold integers in __slots__ and interned names. Hex text is
+produced only when a record is serialized with to_dict() or to_row().
+
+The original hex spelling (digit count and case, as in sdk_binary.py) is kept as
+one shared %-format string per spelling, so "0x0010" and "0x1b0" round-trip
+byte for byte. Digits with mixed case come back uppercase.
+
+Cache row layout (to_row / from_row):
+    [name, parent, size, kind, [[name, type, "0x0010", "0x08"], ...]]
+"""
+
+import sys
+from typing import Any, Dict, List, Tuple
+
+
+class _HexFormats(dict):
+    """digit count -> shared format, filled on first use"""
+
+    def __init__(self, lower: bool):
+        super().__init__()
+        self.lower = lower
+
+    def __missing__(self, digits: int) -> str:
+        fmt = self[digits] = f"0x%0{digits}{'x' if self.lower else 'X'}"
+        return fmt
+
+
+# Indexed directly in the parse loops, where a function call per member shows up
+UPPER_HEX_FORMATS = _HexFormats(lower=False)
+LOWER_HEX_FORMATS = _HexFormats(lower=True)
+
+
+def hex_format(digits: int, lower: bool = False) -> str:
+    """Shared format that renders a value as 0x + digits zero-padded hex digits"""
+    return (LOWER_HEX_FORMATS if lower else UPPER_HEX_FORMATS)[digits]
+
+
+def parse_hex(text: str) -> Tuple[int, str]:
+    """Value and spelling format of '0x1B0'-style text (the 0x prefix is optional)"""
+    digits = text[2:] if text[:2] in ('0x', '0X') else text
+    return int(digits, 16), hex_format(len(digits), digits.islower())
+
+
+class MemberRecord:
+    """
+    One member: interned name, integer offset and size
+
+    The type is expected to be shared already (both converters cache cleaned
+    type spellings), so only the alternate constructors intern it.
+    """
+
+    __slots__ = ('name', 'type', 'offset', 'size', 'offset_format', 'size_format')
+
+    def __init__(self, name: str, type_name: str, offset: int, size: int,
+                 offset_format: str = '0x%X', size_format: str = '0x%X'):
+        self.name = sys.intern(name)
+        self.type = type_name
+        self.offset = offset
+        self.size = size
+        self.offset_format = offset_format
+        self.size_format = size_format
+
+    @classmethod
+    def from_hex(cls, name: str, type_name: str, offset: str, size: str) -> 'MemberRecord':
+        offset_value, offset_format = parse_hex(offset)
+        size_value, size_format = parse_hex(size)
+        return cls(name, sys.intern(type_name), offset_value, size_value, offset_format, size_format)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, str]) -> 'MemberRecord':
+        return cls.from_hex(data["N"], data["T"], data["O"], data["S"])
+
+    @property
+    def end(self) -> int:
+        return self.offset + self.size
+
+    def to_dict(self) -> Dict[str, str]:
+        """sdk_data.json member"""
+        return {"N": self.name, "T": self.type,
+                "O": self.offset_format % self.offset, "S": self.size_format % self.size}
+
+    def to_row(self) -> List[str]:
+        return [self.name, self.type, self.offset_format % self.offset, self.size_format % self.size]
+
+    def __reduce__(self):
+        # A plain tuple pickles far smaller than the default slots state for the process pool
+        return (type(self), (self.name, self.type, self.offset, self.size, self.offset_format, self.size_format))
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, MemberRecord):
+            return NotImplemented
+        return self.to_row() == other.to_row()
+
+    def __repr__(self) -> str:
+        return f"MemberRecord({self.name!r}, {self.type!r}, {self.offset_format % self.offset}, {self.size_format % self.size})"
+
+
+class ClassRecord:
+    """One class or struct with its members in offset order"""
+
+    __slots__ = ('name', 'parent', 'size', 'kind', 'members')
+
+    def __init__(self, name: str, parent: str, size: int, kind: str, members: List[MemberRecord]):
+        self.name = sys.intern(name)
+        self.parent = sys.intern(parent)
+        self.size = size
+        self.kind = kind
+        self.members = members
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'ClassRecord':
+        return cls(data["N"], data["P"], data["S"], data["T"], [MemberRecord.from_dict(m) for m in data["M"]])
+
+    @classmethod
+    def from_row(cls, row: List[Any]) -> 'ClassRecord':
+        name, parent, size, kind, members = row
+        return cls(name, parent, size, kind, [MemberRecord.from_hex(*member) for member in members])
+
+    def to_dict(self) -> Dict[str, Any]:
+        """sdk_data.json class, keys in convert_sdk.py order"""
+        return {"N": self.name, "P": self.parent, "S": self.size, "T": self.kind,
+                "M": [member.to_dict() for member in self.members]}
+
+    def to_row(self) -> List[Any]:
+        return [self.name, self.parent, self.size, self.kind, [member.to_row() for member in self.members]]
+
+    def __reduce__(self):
+        return (type(self), (self.name, self.parent, self.size, self.kind, self.members))
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, ClassRecord):
+            return NotImplemented
+        return type(self) is type(other) and self.to_row() == other.to_row()
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.name!r}, {len(self.members)} members)"
+
+
+def to_dicts(records: List[ClassRecord]) -> List[Dict[str, Any]]:
+    """sdk_data.json classes for the tools that consume the JSON layout (shards, indexes, ...)"""
+    return [record.to_dict() for record in records]
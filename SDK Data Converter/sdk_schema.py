@@ -0,0 +1,342 @@
+"""
+Columnar "v2" sdk_data.json schema
+
+v1 (the default) is an array of classes whose members are {"N", "T", "O", "S"}
+dicts, so every type string is repeated thousands of times and every offset is
+a hex string. v2 stores each class's members as parallel arrays: indices into
+file-wide name and type tables plus integer offsets and sizes.
+
+Layout (always compact):
+    {
+      "schema": 2,
+      "classes": [[name, parent, size, kind, [name_id, ...], [type_id, ...], [offset, ...], [size, ...]], ...],
+      "names": ["RootComponent", ...],
+      "types": ["USceneComponent*", ...]
+    }
+The tables come after the classes so the file can be streamed class by class.
+Offsets and sizes decode to "0x1B0"-style hex without the dump's zero padding.
+
+Usage:
+    python sdk_schema.py validate ../Latest/Data/sdk_data.json
+    python sdk_schema.py convert sdk_data.json sdk_data_v2.json --to 2
+    python sdk_schema.py compare sdk_data.json
+"""
+
+import argparse
+import gzip
+import json
+import os
+import tempfile
+import time
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from sdk_writer import StreamingJSONWriter, write_json_atomic
+
+
+SCHEMA_V1 = 1
+SCHEMA_V2 = 2
+SCHEMAS = (SCHEMA_V1, SCHEMA_V2)
+
+# Positions within a v2 class row
+ROW_NAME, ROW_PARENT, ROW_SIZE, ROW_KIND, ROW_MEMBER_NAMES, ROW_MEMBER_TYPES, ROW_OFFSETS, ROW_SIZES = range(8)
+ROW_LENGTH = 8
+
+MAX_REPORTED_ERRORS = 50
+
+
+class _StringTable:
+    """Assigns each distinct string the next index"""
+
+    def __init__(self):
+        self.ids: Dict[str, int] = {}
+
+    def __call__(self, text: str) -> int:
+        string_id = self.ids.get(text)
+        if string_id is None:
+            string_id = self.ids[text] = len(self.ids)
+        return string_id
+
+    def values(self) -> List[str]:
+        return list(self.ids)
+
+
+def encode_class(record: Dict[str, Any], names: _StringTable, types: _StringTable) -> List[Any]:
+    """v2 row for one class in sdk_data.json (v1) format"""
+    members = record["M"]
+    return [
+        record["N"], record["P"], record["S"], record["T"],
+        [names(member["N"]) for member in members],
+        [types(member["T"]) for member in members],
+        [int(member["O"], 16) for member in members],
+        [int(member["S"], 16) for member in members],
+    ]
+
+
+def encode_v2(classes: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """v2 document for classes in v1 format"""
+    names = _StringTable()
+    types = _StringTable()
+    rows = [encode_class(record, names, types) for record in classes]
+    return {"schema": SCHEMA_V2, "classes": rows, "names": names.values(), "types": types.values()}
+
+
+class StreamingV2Writer(StreamingJSONWriter):
+    """
+    StreamingJSONWriter that writes a v2 document
+
+    Takes the same v1 class dicts as StreamingJSONWriter; the name and type
+    tables are written after the last class when the writer is closed.
+    Strings that are no longer used by any class are still written when
+    tables are reused, which only costs a little space.
+    """
+
+    def __init__(self, path: str, ensure_ascii: bool = True, tables: Optional[Tuple[_StringTable, _StringTable]] = None):
+        super().__init__(path, indent=None, ensure_ascii=ensure_ascii)
+        # Passing the tables of an earlier writer keeps the ids in its serialized rows valid
+        self.tables = tables or (_StringTable(), _StringTable())
+        self._names, self._types = self.tables
+        self._prefix = f'{{"schema":{SCHEMA_V2},"classes":['
+
+    def serialize(self, record: Dict[str, Any]) -> str:
+        return super().serialize(encode_class(record, self._names, self._types))
+
+    def close(self):
+        if self._file is not None:
+            dumps = lambda value: json.dumps(value, separators=(',', ':'), ensure_ascii=self.ensure_ascii)
+            self._suffix = f'],"names":{dumps(self._names.values())},"types":{dumps(self._types.values())}}}'
+            self._empty = self._prefix + self._suffix
+        super().close()
+
+
+def open_sdk_writer(path: str, schema: int = SCHEMA_V1, indent: Optional[int] = 2,
+                    ensure_ascii: bool = True, tables=None) -> StreamingJSONWriter:
+    """Streaming writer for sdk_data.json in the requested schema (v2 ignores indent, v1 ignores tables)"""
+    if schema == SCHEMA_V2:
+        return StreamingV2Writer(path, ensure_ascii=ensure_ascii, tables=tables)
+    return StreamingJSONWriter(path, indent=indent, ensure_ascii=ensure_ascii)
+
+
+def add_schema_argument(parser: argparse.ArgumentParser):
+    """Register --schema on a converter's argument parser"""
+    parser.add_argument('--schema', type=int, choices=SCHEMAS, default=SCHEMA_V1,
+                        help='sdk_data.json layout: 1 = array of class dicts (default), '
+                             '2 = columnar with shared name/type tables (always compact)')
+
+
+def detect_schema(data: Any) -> int:
+    """Schema of a parsed sdk_data.json document"""
+    if isinstance(data, list):
+        return SCHEMA_V1
+    if isinstance(data, dict) and "schema" in data:
+        return data["schema"]
+    raise ValueError("Not an sdk_data.json document")
+
+
+def validate_v2(data: Any) -> List[str]:
+    """
+    Structural check of a v2 document
+
+    Returns:
+        Problems found (at most MAX_REPORTED_ERRORS), empty if the document is valid
+    """
+    errors: List[str] = []
+
+    def fail(message: str) -> bool:
+        errors.append(message)
+        return len(errors) >= MAX_REPORTED_ERRORS
+
+    if not isinstance(data, dict):
+        return ["document is not an object"]
+    if data.get("schema") != SCHEMA_V2:
+        return [f"schema is {data.get('schema')!r}, expected {SCHEMA_V2}"]
+
+    tables = {}
+    for key in ("names", "types"):
+        table = data.get(key)
+        if not isinstance(table, list) or not all(isinstance(text, str) for text in table):
+            return [f'"{key}" must be a list of strings']
+        tables[key] = len(table)
+
+    classes = data.get("classes")
+    if not isinstance(classes, list):
+        return ['"classes" must be a list']
+
+    for index, row in enumerate(classes):
+        where = f"class {index}"
+        if not isinstance(row, list) or len(row) != ROW_LENGTH:
+            if fail(f"{where}: expected a list of {ROW_LENGTH} fields"):
+                break
+            continue
+        where = f"class {index} ({row[ROW_NAME]!r})"
+        if not isinstance(row[ROW_NAME], str) or not row[ROW_NAME]:
+            if fail(f"{where}: name must be a non-empty string"):
+                break
+        if not isinstance(row[ROW_PARENT], str) or not isinstance(row[ROW_KIND], str):
+            if fail(f"{where}: parent and kind must be strings"):
+                break
+        if not isinstance(row[ROW_SIZE], int) or row[ROW_SIZE] < 0:
+            if fail(f"{where}: size must be a non-negative integer"):
+                break
+
+        columns = row[ROW_MEMBER_NAMES:]
+        if not all(isinstance(column, list) for column in columns):
+            if fail(f"{where}: member columns must be lists"):
+                break
+            continue
+        if len({len(column) for column in columns}) != 1:
+            if fail(f"{where}: member columns have different lengths {[len(c) for c in columns]}"):
+                break
+            continue
+
+        checks = (
+            (row[ROW_MEMBER_NAMES], tables["names"], "name id"),
+            (row[ROW_MEMBER_TYPES], tables["types"], "type id"),
+            (row[ROW_OFFSETS], None, "offset"),
+            (row[ROW_SIZES], None, "member size"),
+        )
+        for column, limit, label in checks:
+            bad = next((value for value in column
+                        if not isinstance(value, int) or value < 0 or (limit is not None and value >= limit)), None)
+            if bad is not None and fail(f"{where}: invalid {label} {bad!r}"):
+                return errors
+
+    return errors
+
+
+class V2Reader:
+    """Read side of a v2 document: class lookup without expanding the whole file"""
+
+    def __init__(self, data: Dict[str, Any]):
+        if detect_schema(data) != SCHEMA_V2:
+            raise ValueError(f"Unsupported sdk_data schema {data.get('schema')!r}")
+        self.rows = data["classes"]
+        self.names = data["names"]
+        self.types = data["types"]
+        self._positions: Optional[Dict[str, int]] = None
+
+    @classmethod
+    def load(cls, path: str) -> 'V2Reader':
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls(json.load(f))
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def decode(self, row: List[Any]) -> Dict[str, Any]:
+        """v1 class dict for one row"""
+        names, types = self.names, self.types
+        return {
+            "N": row[ROW_NAME], "P": row[ROW_PARENT], "S": row[ROW_SIZE], "T": row[ROW_KIND],
+            "M": [
+                {"N": names[name_id], "T": types[type_id], "O": f"0x{offset:X}", "S": f"0x{size:X}"}
+                for name_id, type_id, offset, size in zip(row[ROW_MEMBER_NAMES], row[ROW_MEMBER_TYPES],
+                                                          row[ROW_OFFSETS], row[ROW_SIZES])
+            ],
+        }
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        for row in self.rows:
+            yield self.decode(row)
+
+    def get(self, name: str) -> Optional[Dict[str, Any]]:
+        """First class called name, in v1 format"""
+        if self._positions is None:
+            self._positions = {}
+            for index, row in enumerate(self.rows):
+                self._positions.setdefault(row[ROW_NAME], index)
+        index = self._positions.get(name)
+        return None if index is None else self.decode(self.rows[index])
+
+
+def decode_v2(data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Every class of a v2 document in v1 format"""
+    return list(V2Reader(data))
+
+
+def load_classes(path: str) -> List[Dict[str, Any]]:
+    """Classes of an sdk_data.json in either schema, in v1 format"""
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    return decode_v2(data) if detect_schema(data) == SCHEMA_V2 else data
+
+
+def _measure(path: str, decode: bool, repeat: int) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if decode and detect_schema(data) == SCHEMA_V2:
+            decode_v2(data)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def compare(v1_path: str, repeat: int = 3):
+    """Print file size and parse time of a v1 file against its v2 encoding"""
+    with open(v1_path, 'r', encoding='utf-8') as f:
+        classes = json.load(f)
+    if detect_schema(classes) != SCHEMA_V1:
+        raise SystemExit("❌ compare expects a v1 sdk_data.json")
+
+    with tempfile.TemporaryDirectory(prefix="sdk_schema_") as work:
+        compact_path = os.path.join(work, "v1_compact.json")
+        v2_path = os.path.join(work, "v2.json")
+        write_json_atomic(compact_path, classes, indent=None)
+        write_json_atomic(v2_path, encode_v2(classes), indent=None)
+
+        rows = [("v1 (as given)", v1_path), ("v1 compact", compact_path), ("v2", v2_path)]
+        print(f"📦 {len(classes):,} classes, {sum(len(c['M']) for c in classes):,} members")
+        for label, path in rows:
+            with open(path, 'rb') as f:
+                raw = f.read()
+            gzipped = len(gzip.compress(raw, 6))
+            parse = _measure(path, decode=False, repeat=repeat)
+            print(f"  {label:14} {len(raw) / 1024 / 1024:8.2f} MB  gzip {gzipped / 1024 / 1024:7.2f} MB  "
+                  f"json.load {parse * 1000:8.1f} ms")
+        print(f"  {'v2 + decode':14} {'':27}  load+decode {_measure(v2_path, decode=True, repeat=repeat) * 1000:6.1f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Validate, convert and compare sdk_data.json schemas')
+    commands = parser.add_subparsers(dest='command', required=True)
+    validate = commands.add_parser('validate', help='Check a v2 file (v1 files are only checked to be an array)')
+    validate.add_argument('sdk_file')
+    convert = commands.add_parser('convert', help='Rewrite a file in the other schema')
+    convert.add_argument('sdk_file')
+    convert.add_argument('output')
+    convert.add_argument('--to', type=int, choices=SCHEMAS, default=SCHEMA_V2)
+    convert.add_argument('--compact', action='store_true', help='Write v1 without indentation')
+    comparison = commands.add_parser('compare', help='Size and parse time of a v1 file against its v2 encoding')
+    comparison.add_argument('sdk_file')
+    comparison.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    if args.command == 'compare':
+        compare(args.sdk_file, args.repeat)
+        return
+
+    with open(args.sdk_file, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    schema = detect_schema(data)
+
+    if args.command == 'validate':
+        errors = validate_v2(data) if schema == SCHEMA_V2 else []
+        for error in errors:
+            print(f"  ❌ {error}")
+        if errors:
+            raise SystemExit(f"❌ {args.sdk_file} is not a valid v{schema} file")
+        count = len(data["classes"]) if schema == SCHEMA_V2 else len(data)
+        print(f"✅ {args.sdk_file}: schema v{schema}, {count:,} classes")
+        return
+
+    classes = decode_v2(data) if schema == SCHEMA_V2 else data
+    if args.to == SCHEMA_V2:
+        size = write_json_atomic(args.output, encode_v2(classes), indent=None)
+    else:
+        size = write_json_atomic(args.output, classes, indent=None if args.compact else 2)
+    print(f"💾 Wrote {args.output} as v{args.to} ({size:,} bytes)")
+
+
+if __name__ == "__main__":
+    main()
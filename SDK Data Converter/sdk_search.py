@@ -0,0 +1,220 @@
+"""
+Prebuilt trigram search index over class names, member names and offsets
+
+Mirrors the viewer's global search: a query matches a class whose name
+contains it, or a member whose name or offset contains it (case-insensitive).
+Instead of scanning every member, a query is answered by intersecting the
+posting lists of its trigrams and verifying the few surviving candidates.
+
+Index layout (search_index.json):
+    {
+      "version": 1,
+      "gram": 3,
+      "classes": ["AActor", ...],
+      "entries": [[class_index], [class_index, member_name, offset], ...],
+      "postings": {"act": [first_id, delta, delta, ...], ...}
+    }
+Entries are ordered class by class (the class entry followed by its members),
+so results come back in the same order as a brute-force scan. Posting lists
+are sorted entry ids stored as deltas.
+"""
+
+import json
+from bisect import bisect_left
+from typing import Dict, Iterator, List, Optional
+
+from sdk_writer import write_json_atomic
+
+
+SEARCH_INDEX_FILE = "search_index.json"
+SEARCH_INDEX_VERSION = 1
+GRAM = 3
+
+
+def _grams(text: str):
+    return {text[i:i + GRAM] for i in range(len(text) - GRAM + 1)}
+
+
+def build_search_index(classes: List[Dict]) -> Dict:
+    """Build the serializable index for classes in sdk_data.json format"""
+    names = []
+    entries = []
+    postings: Dict[str, List[int]] = {}
+
+    for class_index, record in enumerate(classes):
+        names.append(record["N"])
+        entry_id = len(entries)
+        entries.append([class_index])
+        for gram in _grams(record["N"].lower()):
+            postings.setdefault(gram, []).append(entry_id)
+
+        for member in record["M"]:
+            entry_id = len(entries)
+            entries.append([class_index, member["N"], member["O"]])
+            for gram in _grams(member["N"].lower()) | _grams(member["O"].lower()):
+                postings.setdefault(gram, []).append(entry_id)
+
+    # Ids were appended in increasing order, so every list is already sorted
+    encoded = {}
+    for gram, ids in postings.items():
+        previous = 0
+        deltas = []
+        for entry_id in ids:
+            deltas.append(entry_id - previous)
+            previous = entry_id
+        encoded[gram] = deltas
+
+    return {
+        "version": SEARCH_INDEX_VERSION,
+        "gram": GRAM,
+        "classes": names,
+        "entries": entries,
+        "postings": encoded,
+    }
+
+
+def write_search_index(classes: List[Dict], path: str) -> int:
+    """Build and atomically write the index; returns the file size in bytes"""
+    return write_json_atomic(path, build_search_index(classes), indent=None)
+
+
+class SearchIndex:
+    """Query side of the trigram index"""
+
+    def __init__(self, data: Dict):
+        if data.get("version") != SEARCH_INDEX_VERSION or data.get("gram") != GRAM:
+            raise ValueError(f"Unsupported search index version {data.get('version')}")
+        self.classes = data["classes"]
+        self.entries = data["entries"]
+        self._encoded = data["postings"]
+        self._decoded: Dict[str, List[int]] = {}
+
+    @classmethod
+    def load(cls, path: str) -> 'SearchIndex':
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls(json.load(f))
+
+    @classmethod
+    def from_classes(cls, classes: List[Dict]) -> 'SearchIndex':
+        return cls(build_search_index(classes))
+
+    def postings(self, gram: str) -> List[int]:
+        """Decoded, sorted entry ids containing gram (decoded lazily, then cached)"""
+        ids = self._decoded.get(gram)
+        if ids is None:
+            ids = []
+            current = 0
+            for delta in self._encoded.get(gram, ()):
+                current += delta
+                ids.append(current)
+            self._decoded[gram] = ids
+        return ids
+
+    def candidates(self, query: str) -> Iterator[int]:
+        """Entry ids that contain every trigram of query, lazily and in entry order"""
+        lists = sorted((self.postings(gram) for gram in _grams(query)), key=len)
+        if not lists or not lists[0]:
+            return
+        shortest, others = lists[0], lists[1:]
+        # Ids only grow, so each bisect resumes where the previous one stopped
+        positions = [0] * len(others)
+        for entry_id in shortest:
+            for i, other in enumerate(others):
+                position = bisect_left(other, entry_id, positions[i])
+                positions[i] = position
+                if position == len(other):
+                    return
+                if other[position] != entry_id:
+                    break
+            else:
+                yield entry_id
+
+    def search(self, query: str, limit: Optional[int] = None) -> List[Dict]:
+        """
+        Find classes and members matching query, like the viewer's global search
+
+        Queries shorter than a trigram fall back to a scan over the entries.
+        A limit of zero or less matches nothing.
+
+        Returns:
+            Result dicts: {"type": "class", "class": name} or
+            {"type": "member", "class": name, "name": member, "offset": offset, "match": "name"|"offset"}
+        """
+        query = query.lower()
+        if not query or (limit is not None and limit <= 0):
+            return []
+
+        entry_ids = self.candidates(query) if len(query) >= GRAM else range(len(self.entries))
+
+        results = []
+        for entry_id in entry_ids:
+            result = self._verify(self.entries[entry_id], query)
+            if result is not None:
+                results.append(result)
+                if limit is not None and len(results) >= limit:
+                    break
+        return results
+
+    def _verify(self, entry: List, query: str) -> Optional[Dict]:
+        class_name = self.classes[entry[0]]
+        if len(entry) == 1:
+            if query in class_name.lower():
+                return {"type": "class", "class": class_name}
+            return None
+
+        _, member_name, offset = entry
+        if query in member_name.lower():
+            match = "name"
+        elif query in offset.lower():
+            match = "offset"
+        else:
+            return None
+        return {"type": "member", "class": class_name, "name": member_name, "offset": offset, "match": match}
+
+
+def brute_force_search(classes: List[Dict], query: str, limit: Optional[int] = None) -> List[Dict]:
+    """Reference linear scan with the same semantics as SearchIndex.search"""
+    query = query.lower()
+    if not query or (limit is not None and limit <= 0):
+        return []
+
+    results = []
+    for record in classes:
+        class_name = record["N"]
+        if query in class_name.lower():
+            results.append({"type": "class", "class": class_name})
+            if limit is not None and len(results) >= limit:
+                return results
+        for member in record["M"]:
+            if query in member["N"].lower():
+                match = "name"
+            elif query in member["O"].lower():
+                match = "offset"
+            else:
+                continue
+            results.append({"type": "member", "class": class_name, "name": member["N"],
+                            "offset": member["O"], "match": match})
+            if limit is not None and len(results) >= limit:
+                return results
+    return results
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Query a prebuilt SDK search index')
+    parser.add_argument('index', help=f'Path to {SEARCH_INDEX_FILE}')
+    parser.add_argument('query', help='Case-insensitive substring to look for')
+    parser.add_argument('-n', '--limit', type=int, default=30, help='Maximum results (default: %(default)s)')
+    args = parser.parse_args()
+
+    index = SearchIndex.load(args.index)
+    for result in index.search(args.query, limit=args.limit):
+        if result["type"] == "class":
+            print(result["class"])
+        else:
+            print(f"{result['class']}: {result['name']} - {result['offset']}")
+
+
+if __name__ == "__main__":
+    main()
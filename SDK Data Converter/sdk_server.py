@@ -0,0 +1,289 @@
+"""
+Local query server over the converted SDK (stdlib only)
+
+Loads sdk_data.json (either schema) once, builds in-memory indexes and answers
+lookups without the client downloading the whole SDK:
+
+    GET /classes                   [[name, parent, size, member count], ...]
+    GET /class/<name>              one class in sdk_data.json format
+    GET /search?q=<text>&limit=30  same matching as the viewer's global search
+    GET /offset/<class>/<hex>      member covering that offset, walking up the parents
+
+Every response carries an ETag derived from the data file's content hash, so a
+client sending If-None-Match gets an empty 304. Bodies larger than
+GZIP_MIN_BYTES are gzipped for clients that accept it. Rendered responses are
+kept in a bounded cache, so repeated lookups cost a dict hit. Any other path is
+served from the static directory (the viewer in ../Latest by default). Its
+index.html gets a one-line SERVER_FLAG script, so the viewer knows to load
+classes from /classes and /class/<name> on demand; on static hosting the
+flag is absent and it never probes the API.
+
+Usage:
+    python sdk_server.py ../Latest/Data/sdk_data.json [--port 8000] [--static ../Latest]
+"""
+
+import gzip
+import json
+import os
+import threading
+import time
+from bisect import bisect_right
+from collections import OrderedDict
+from functools import partial
+from http import HTTPStatus
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from sdk_publish import content_hash
+from sdk_schema import SCHEMA_V2, decode_v2, detect_schema
+from sdk_search import SEARCH_INDEX_FILE, SearchIndex
+
+
+DEFAULT_PORT = 8000
+GZIP_MIN_BYTES = 1024
+GZIP_LEVEL = 6
+RESPONSE_CACHE_SIZE = 4096
+DEFAULT_SEARCH_LIMIT = 30
+MAX_SEARCH_LIMIT = 1000
+API_ROUTES = ("classes", "class", "search", "offset")
+INDEX_PAGES = ("/", "/index.html")
+# Injected into the viewer's index.html; loader.js only asks for /classes when it is set
+SERVER_FLAG = b'<script>window.SDKServer = true;</script>\n'
+
+
+class Response:
+    """A rendered API response; the gzipped body is produced on first request"""
+
+    __slots__ = ('status', 'body', '_gzipped')
+
+    def __init__(self, status: int, body: bytes):
+        self.status = status
+        self.body = body
+        self._gzipped: Optional[bytes] = None
+
+    @property
+    def gzipped(self) -> bytes:
+        if self._gzipped is None:
+            self._gzipped = gzip.compress(self.body, GZIP_LEVEL)
+        return self._gzipped
+
+
+class SDKStore:
+    """Converted SDK held in memory with the indexes behind each endpoint"""
+
+    def __init__(self, path: str, search_index_path: Optional[str] = None):
+        start = time.perf_counter()
+        self.path = path
+        with open(path, 'rb') as f:
+            raw = f.read()
+        # Same hash as sdk_publish, so the ETag changes exactly when the file does
+        self.etag = f'"{content_hash(raw)}"'
+        data = json.loads(raw)
+        del raw
+        self.classes: List[Dict[str, Any]] = decode_v2(data) if detect_schema(data) == SCHEMA_V2 else data
+
+        self.by_name: Dict[str, Dict[str, Any]] = {}
+        for record in self.classes:
+            self.by_name.setdefault(record["N"], record)
+        # class -> (sorted member offsets, members in the same order), built on first /offset lookup
+        self._layouts: Dict[str, Tuple[List[int], List[Tuple[int, int, Dict[str, str]]]]] = {}
+        # A search_index.json written by the same conversion loads several times faster than a rebuild
+        index_path = search_index_path or os.path.join(os.path.dirname(os.path.abspath(path)), SEARCH_INDEX_FILE)
+        if os.path.exists(index_path) and os.path.getmtime(index_path) >= os.path.getmtime(path):
+            self.search_index = SearchIndex.load(index_path)
+            self.search_index_source = index_path
+        else:
+            self.search_index = SearchIndex.from_classes(self.classes)
+            self.search_index_source = None
+        self._cache: 'OrderedDict[str, Response]' = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self.load_seconds = time.perf_counter() - start
+
+    def response(self, target: str) -> Optional[Response]:
+        """Cached response for an API request target (path + query), None if it isn't an API path"""
+        with self._cache_lock:
+            cached = self._cache.get(target)
+            if cached is not None:
+                self._cache.move_to_end(target)
+                return cached
+
+        parsed = urlsplit(target)
+        parts = [unquote(part) for part in parsed.path.strip('/').split('/')]
+        if not parts or parts[0] not in API_ROUTES:
+            return None
+        status, payload = self.route(parts, parse_qs(parsed.query))
+        response = Response(status, json.dumps(payload, separators=(',', ':')).encode('utf-8'))
+
+        with self._cache_lock:
+            self._cache[target] = response
+            if len(self._cache) > RESPONSE_CACHE_SIZE:
+                self._cache.popitem(last=False)
+        return response
+
+    def route(self, parts: List[str], query: Dict[str, List[str]]) -> Tuple[int, Any]:
+        route, args = parts[0], parts[1:]
+        if route == "classes" and not args:
+            return HTTPStatus.OK, {"count": len(self.classes), "fields": ["N", "P", "S", "members"],
+                                   "classes": [[c["N"], c["P"], c["S"], len(c["M"])] for c in self.classes]}
+        if route == "class" and len(args) == 1:
+            record = self.by_name.get(args[0])
+            if record is None:
+                return HTTPStatus.NOT_FOUND, {"error": f"Unknown class {args[0]!r}"}
+            return HTTPStatus.OK, record
+        if route == "search" and not args:
+            text = query.get("q", [""])[0]
+            try:
+                limit = min(int(query.get("limit", [DEFAULT_SEARCH_LIMIT])[0]), MAX_SEARCH_LIMIT)
+            except ValueError:
+                return HTTPStatus.BAD_REQUEST, {"error": "limit must be an integer"}
+            if limit < 1:
+                return HTTPStatus.BAD_REQUEST, {"error": "limit must be at least 1"}
+            return HTTPStatus.OK, {"query": text, "results": self.search_index.search(text, limit=limit)}
+        if route == "offset" and len(args) == 2:
+            try:
+                offset = int(args[1], 16)
+            except ValueError:
+                return HTTPStatus.BAD_REQUEST, {"error": f"Not a hex offset: {args[1]!r}"}
+            if args[0] not in self.by_name:
+                return HTTPStatus.NOT_FOUND, {"error": f"Unknown class {args[0]!r}"}
+            result = self.member_at(args[0], offset)
+            if result is None:
+                return HTTPStatus.NOT_FOUND, {"error": f"No member of {args[0]} covers 0x{offset:X}"}
+            return HTTPStatus.OK, result
+        return HTTPStatus.NOT_FOUND, {"error": "Unknown endpoint"}
+
+    def _layout(self, name: str) -> Tuple[List[int], List[Tuple[int, int, Dict[str, str]]]]:
+        layout = self._layouts.get(name)
+        if layout is None:
+            members = sorted(((int(m["O"], 16), int(m["S"], 16), m) for m in self.by_name[name]["M"]),
+                             key=lambda member: member[0])
+            layout = self._layouts[name] = ([member[0] for member in members], members)
+        return layout
+
+    def member_at(self, class_name: str, offset: int) -> Optional[Dict[str, Any]]:
+        """The member whose [offset, offset + size) covers offset, in class_name or its nearest parent"""
+        seen = set()
+        owner = class_name
+        while owner in self.by_name and owner not in seen:
+            seen.add(owner)
+            offsets, members = self._layout(owner)
+            position = bisect_right(offsets, offset) - 1
+            if position >= 0:
+                start, size, member = members[position]
+                if offset < start + max(size, 1):
+                    return {"class": class_name, "declared_in": owner, "member": member, "delta": offset - start}
+            owner = self.by_name[owner]["P"]
+        return None
+
+
+class SDKRequestHandler(SimpleHTTPRequestHandler):
+    """API routes from the store, everything else from the static directory"""
+
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out in separate writes; with Nagle on, keep-alive clients wait ~40 ms for each response
+    disable_nagle_algorithm = True
+    store: SDKStore = None
+    quiet = True
+
+    def do_GET(self):
+        response = self.store.response(self.path)
+        if response is None:
+            if urlsplit(self.path).path in INDEX_PAGES and self._send_index():
+                return
+            return super().do_GET()
+
+        if response.status == HTTPStatus.OK and self._not_modified():
+            self.send_response(HTTPStatus.NOT_MODIFIED)
+            self._send_common_headers()
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        body = response.body
+        self.send_response(response.status)
+        self._send_common_headers()
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        if len(body) >= GZIP_MIN_BYTES and "gzip" in self.headers.get("Accept-Encoding", ""):
+            body = response.gzipped
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Vary", "Accept-Encoding")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_index(self) -> bool:
+        """Serve the static index.html with SERVER_FLAG added to its head; False if there is none"""
+        path = os.path.join(self.directory, "index.html")
+        try:
+            with open(path, 'rb') as f:
+                page = f.read()
+        except OSError:
+            return False
+        head = page.find(b"</head>")
+        body = page[:head] + SERVER_FLAG + page[head:] if head >= 0 else SERVER_FLAG + page
+
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        return True
+
+    def _not_modified(self) -> bool:
+        tags = [tag.strip() for tag in self.headers.get("If-None-Match", "").split(",")]
+        return "*" in tags or self.store.etag in tags
+
+    def _send_common_headers(self):
+        self.send_header("ETag", self.store.etag)
+        # Always revalidate; If-None-Match makes that a bodyless round trip
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Access-Control-Allow-Origin", "*")
+
+    def log_message(self, format, *args):
+        if not self.quiet:
+            super().log_message(format, *args)
+
+
+def make_server(store: SDKStore, host: str = "127.0.0.1", port: int = DEFAULT_PORT,
+                static_dir: Optional[str] = None, quiet: bool = True) -> ThreadingHTTPServer:
+    """HTTP server answering from store; call serve_forever() on the result"""
+    handler = type("BoundSDKRequestHandler", (SDKRequestHandler,), {"store": store, "quiet": quiet})
+    return ThreadingHTTPServer((host, port), partial(handler, directory=static_dir or os.getcwd()))
+
+
+def main():
+    import argparse
+
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    parser = argparse.ArgumentParser(description='Serve the converted SDK over HTTP with in-memory indexes')
+    parser.add_argument('sdk_file', nargs='?', default=os.path.join(script_dir, '..', 'Latest', 'Data', 'sdk_data.json'),
+                        help='Converted sdk_data.json, either schema (default: ../Latest/Data/sdk_data.json)')
+    parser.add_argument('--host', default='127.0.0.1', help='Interface to bind (default: %(default)s)')
+    parser.add_argument('-p', '--port', type=int, default=DEFAULT_PORT, help='Port (default: %(default)s)')
+    parser.add_argument('--static', default=os.path.join(script_dir, '..', 'Latest'),
+                        help='Directory served for non-API paths (default: the viewer in ../Latest)')
+    parser.add_argument('--search-index', metavar='PATH',
+                        help=f'Prebuilt {SEARCH_INDEX_FILE} (default: the one beside sdk_file, if not older; '
+                             f'otherwise the index is built at startup)')
+    parser.add_argument('-v', '--verbose', action='store_true', help='Log every request')
+    args = parser.parse_args()
+
+    print(f"📦 Loading {args.sdk_file}...")
+    store = SDKStore(args.sdk_file, args.search_index)
+    source = f"search index from {store.search_index_source}" if store.search_index_source else "search index built"
+    print(f"✅ {len(store.classes):,} classes indexed in {store.load_seconds:.2f}s ({source}, ETag {store.etag})")
+
+    server = make_server(store, args.host, args.port, static_dir=args.static, quiet=not args.verbose)
+    print(f"🌐 Serving on http://{args.host}:{server.server_address[1]}/ (Ctrl+C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n🛑 Stopped")
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,173 @@
+"""
+Sharded SDK output for on-demand loading in the viewer
+
+Classes are split into size-balanced shard files, grouped either by name
+prefix (alphabetical runs) or by the Dumper-7 package they came from. A small
+manifest maps every class name to its shard, size, member count and parent
+so the sidebar and inheritance view can be drawn before any shard is
+downloaded.
+
+Manifest layout (sdk_manifest.json):
+    {
+      "version": 2,
+      "data": "<content hash of the sdk_data.json the shards were cut from>",
+      "shards": ["shards/sdk_<hash>.json", ...],
+      "classes": {"AFortPawn": [shard_index, size, member_count, parent], ...}
+    }
+Each shard is a compact JSON array in the same record format as sdk_data.json,
+named after its content hash so browsers may cache it indefinitely.
+"""
+
+import json
+import os
+import re
+from typing import Callable, Dict, Iterable, List, Optional
+
+from sdk_publish import content_hash
+from sdk_writer import write_bytes_atomic, write_json_atomic
+
+
+MANIFEST_FILE = "sdk_manifest.json"
+MANIFEST_VERSION = 2
+SHARD_DIR = "shards"
+DEFAULT_SHARD_KB = 512
+
+# Dumper-7 header suffixes stripped to get the package a class belongs to
+PACKAGE_SUFFIXES = ('_classes', '_structs', '_parameters', '_functions', '_enums')
+SHARD_PATTERN = re.compile(r'^sdk_[0-9a-z]+\.json$')
+
+
+def package_from_filename(filename: str) -> str:
+    """'FortniteGame_classes.h' -> 'FortniteGame'"""
+    stem = os.path.splitext(os.path.basename(filename))[0]
+    for suffix in PACKAGE_SUFFIXES:
+        if stem.endswith(suffix):
+            return stem[:-len(suffix)]
+    return stem
+
+
+def plan_shards(classes: Iterable[Dict], target_bytes: int, group_by: str = 'prefix',
+                packages: Optional[Dict[str, str]] = None) -> List[List[Dict]]:
+    """
+    Split classes into shards of roughly target_bytes serialized JSON each
+
+    Shards are cut at group boundaries once they would overflow the target;
+    a single group larger than the target is split mid-group.
+
+    Args:
+        classes: Class records in sdk_data.json format
+        target_bytes: Desired compact JSON size per shard
+        group_by: 'prefix' (alphabetical by name) or 'package' (source header)
+        packages: Class name -> package, required for group_by='package'
+
+    Returns:
+        List of shards, each a list of class records
+    """
+    if group_by == 'package':
+        packages = packages or {}
+        keyed = [(packages.get(c["N"], ''), c["N"], c) for c in classes]
+    else:
+        keyed = [(c["N"][:2], c["N"], c) for c in classes]
+    keyed.sort(key=lambda item: (item[0], item[1]))
+
+    shards = []
+    current = []
+    current_bytes = 0
+    current_key = None
+    for key, _, record in keyed:
+        size = len(json.dumps(record, separators=(',', ':')))
+        if current and current_bytes + size > target_bytes and (key != current_key or current_bytes >= target_bytes):
+            shards.append(current)
+            current = []
+            current_bytes = 0
+        current.append(record)
+        current_bytes += size
+        current_key = key
+    if current:
+        shards.append(current)
+    return shards
+
+
+def _manifest_shards(manifest_path: str) -> List[str]:
+    """Shard file names listed by an existing manifest, if any"""
+    try:
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            return [os.path.basename(path) for path in json.load(f).get("shards", [])]
+    except (OSError, ValueError, AttributeError):
+        return []
+
+
+def write_shards(classes: List[Dict], output_dir: str, target_kb: int = DEFAULT_SHARD_KB,
+                 group_by: str = 'prefix', packages: Optional[Dict[str, str]] = None,
+                 data_hash: Optional[str] = None, log: Callable[[str], None] = print) -> Dict:
+    """
+    Write shard files and the manifest into output_dir
+
+    Shards are written first and the manifest last, so a reader never sees a
+    manifest pointing at shards that don't exist yet. Shards from older runs
+    are removed afterwards, except the ones the previous manifest listed, so a
+    page that fetched that manifest a moment ago can still open its classes.
+
+    Args:
+        data_hash: content_hash() of the sdk_data.json the classes came from;
+            the viewer ignores the manifest once sdk_data.json moves on
+
+    Returns:
+        The manifest that was written
+    """
+    shards = plan_shards(classes, target_kb * 1024, group_by, packages)
+    shard_dir = os.path.join(output_dir, SHARD_DIR)
+    os.makedirs(shard_dir, exist_ok=True)
+    manifest_path = os.path.join(output_dir, MANIFEST_FILE)
+    previous = _manifest_shards(manifest_path)
+
+    manifest = {"version": MANIFEST_VERSION, "data": data_hash, "shards": [], "classes": {}}
+    total_bytes = 0
+    for index, shard in enumerate(shards):
+        data = json.dumps(shard, separators=(',', ':')).encode('utf-8')
+        name = f"sdk_{content_hash(data)}.json"
+        path = os.path.join(shard_dir, name)
+        if not os.path.exists(path):
+            write_bytes_atomic(path, data)
+        total_bytes += len(data)
+        manifest["shards"].append(f"{SHARD_DIR}/{name}")
+        for record in shard:
+            manifest["classes"][record["N"]] = [index, record["S"], len(record["M"]), record["P"]]
+
+    manifest_bytes = write_json_atomic(manifest_path, manifest, indent=None)
+
+    keep = {os.path.basename(path) for path in manifest["shards"]} | set(previous)
+    for leftover in os.listdir(shard_dir):
+        if SHARD_PATTERN.match(leftover) and leftover not in keep:
+            os.remove(os.path.join(shard_dir, leftover))
+
+    log(f"🧩 Wrote {len(shards)} shards ({total_bytes / 1024 / 1024:.2f} MB, grouped by {group_by}) "
+        f"and manifest {manifest_path} ({manifest_bytes / 1024:.1f} KB)")
+    return manifest
+
+
+def remove_shards(output_dir: str) -> bool:
+    """
+    Delete the manifest and shard files of an earlier --shards run
+
+    The viewer prefers a manifest over sdk_data.json, so one left behind by a
+    previous run would keep showing stale classes. The manifest goes first, so
+    a reader never follows it to a shard that's already gone.
+
+    Returns:
+        Whether anything was removed
+    """
+    removed = False
+    manifest_path = os.path.join(output_dir, MANIFEST_FILE)
+    if os.path.exists(manifest_path):
+        os.remove(manifest_path)
+        removed = True
+    shard_dir = os.path.join(output_dir, SHARD_DIR)
+    if os.path.isdir(shard_dir):
+        for leftover in os.listdir(shard_dir):
+            if SHARD_PATTERN.match(leftover):
+                os.remove(os.path.join(shard_dir, leftover))
+                removed = True
+        if not os.listdir(shard_dir):
+            os.rmdir(shard_dir)
+    return removed
@@ -0,0 +1,347 @@
+"""
+SQLite export of the converted SDK for ad-hoc queries
+
+Tables (sdk_data.sqlite):
+    classes      id, name, parent, parent_id, size, kind, member_count     id = position in sdk_data.json
+    members      id, class_id, position, name, type, offset, size
+    inheritance  class_id, ancestor_id, depth                             transitive closure, depth 0 = the class itself
+    search       FTS5 over every distinct class name, member name and type: text, kind ('class'|'member'|'type')
+
+Offsets and sizes are integers, so "8-byte members" is just size = 8; the
+saved queries print them back as hex. The inheritance closure turns "classes
+derived from AActor" into one indexed join. A parent that repeats a class
+name resolves to the first class with that name, like everywhere else.
+The full-text table holds each distinct string once (a dump repeats a few
+thousand types across hundreds of thousands of members) and hits are joined
+back to the tables by name. The whole file is written by executemany inside
+one transaction, into a temp file that is renamed into place.
+
+Saved queries are named SQL with :parameters, e.g.:
+    python sdk_sqlite.py export ../Latest/Data/sdk_data.json -o sdk_data.sqlite
+    python sdk_sqlite.py list
+    python sdk_sqlite.py query sdk_data.sqlite derived-members base=AActor name=%Component% size=8
+    python sdk_sqlite.py sql sdk_data.sqlite "SELECT name, size FROM classes ORDER BY size DESC LIMIT 10"
+"""
+
+import json
+import os
+import sqlite3
+import time
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from sdk_schema import load_classes
+
+
+SQLITE_FILE = "sdk_data.sqlite"
+# Stored in PRAGMA user_version; bump when the tables change
+SQLITE_VERSION = 1
+
+SCHEMA = """
+CREATE TABLE classes (
+    id           INTEGER PRIMARY KEY,
+    name         TEXT NOT NULL,
+    parent       TEXT NOT NULL,
+    parent_id    INTEGER REFERENCES classes(id),
+    size         INTEGER NOT NULL,
+    kind         TEXT NOT NULL,
+    member_count INTEGER NOT NULL
+);
+CREATE TABLE members (
+    id         INTEGER PRIMARY KEY,
+    class_id   INTEGER NOT NULL REFERENCES classes(id),
+    position   INTEGER NOT NULL,
+    name       TEXT NOT NULL,
+    type       TEXT NOT NULL,
+    offset     INTEGER NOT NULL,
+    size       INTEGER NOT NULL
+);
+CREATE TABLE inheritance (
+    class_id    INTEGER NOT NULL REFERENCES classes(id),
+    ancestor_id INTEGER NOT NULL REFERENCES classes(id),
+    depth       INTEGER NOT NULL,
+    PRIMARY KEY (class_id, ancestor_id)
+) WITHOUT ROWID;
+"""
+
+# Created after the bulk insert, which is much faster than maintaining them row by row
+INDEXES = """
+CREATE INDEX classes_name ON classes(name);
+CREATE INDEX classes_parent ON classes(parent_id);
+CREATE INDEX members_class ON members(class_id, offset);
+CREATE INDEX members_name ON members(name);
+CREATE INDEX members_type ON members(type);
+CREATE INDEX members_size ON members(size);
+CREATE INDEX inheritance_ancestor ON inheritance(ancestor_id, depth);
+"""
+
+FTS_TABLE = "CREATE VIRTUAL TABLE search USING fts5(text, kind UNINDEXED{tokenize})"
+
+SAVED_QUERIES: Dict[str, Tuple[str, str]] = {
+    "class": (
+        "Members of :class in offset order",
+        """SELECT m.name, m.type, printf('0x%X', m.offset) AS offset, printf('0x%X', m.size) AS size
+           FROM classes c JOIN members m ON m.class_id = c.id
+           WHERE c.id = (SELECT min(id) FROM classes WHERE name = :class)
+           ORDER BY m.offset""",
+    ),
+    "layout": (
+        "Members of :class including inherited ones, base classes first",
+        """SELECT a.name AS declared_in, m.name, m.type, printf('0x%X', m.offset) AS offset, printf('0x%X', m.size) AS size
+           FROM inheritance i
+           JOIN classes a ON a.id = i.ancestor_id
+           JOIN members m ON m.class_id = a.id
+           WHERE i.class_id = (SELECT min(id) FROM classes WHERE name = :class)
+           ORDER BY m.offset, i.depth DESC""",
+    ),
+    "subclasses": (
+        "Every class derived from :base, nearest first",
+        """SELECT c.name, c.parent, c.size, i.depth
+           FROM inheritance i JOIN classes c ON c.id = i.class_id
+           WHERE i.ancestor_id = (SELECT min(id) FROM classes WHERE name = :base) AND i.depth > 0
+           ORDER BY i.depth, c.name""",
+    ),
+    "ancestors": (
+        "Parent chain of :class up to its root",
+        """SELECT a.name, a.size, i.depth
+           FROM inheritance i JOIN classes a ON a.id = i.ancestor_id
+           WHERE i.class_id = (SELECT min(id) FROM classes WHERE name = :class)
+           ORDER BY i.depth""",
+    ),
+    "derived-members": (
+        "Members named like :name (SQL LIKE) of size :size bytes in :base and every class derived from it",
+        """SELECT c.name AS class, m.name, m.type, printf('0x%X', m.offset) AS offset, m.size
+           FROM inheritance i
+           JOIN classes c ON c.id = i.class_id
+           JOIN members m ON m.class_id = c.id
+           WHERE i.ancestor_id = (SELECT min(id) FROM classes WHERE name = :base)
+             AND m.size = :size AND m.name LIKE :name
+           ORDER BY c.name, m.offset""",
+    ),
+    "at-offset": (
+        "Member of :class (or an ancestor) covering byte :offset (hex or decimal)",
+        """SELECT a.name AS declared_in, m.name, m.type, printf('0x%X', m.offset) AS offset, printf('0x%X', m.size) AS size
+           FROM inheritance i
+           JOIN classes a ON a.id = i.ancestor_id
+           JOIN members m ON m.class_id = a.id
+           WHERE i.class_id = (SELECT min(id) FROM classes WHERE name = :class)
+             AND m.offset <= :offset AND :offset < m.offset + max(m.size, 1)
+           ORDER BY i.depth""",
+    ),
+    "type-users": (
+        "Members whose type is exactly :type",
+        """SELECT c.name AS class, m.name, printf('0x%X', m.offset) AS offset
+           FROM members m JOIN classes c ON c.id = m.class_id
+           WHERE m.type = :type
+           ORDER BY c.name, m.offset""",
+    ),
+    "search": (
+        "Full-text search over class names, member names and types (FTS5 syntax in :q)",
+        """WITH hits AS (SELECT text, kind FROM search WHERE search MATCH :q)
+           SELECT 'class' AS kind, c.name AS class, NULL AS member, NULL AS type, NULL AS offset
+           FROM hits h JOIN classes c ON c.name = h.text WHERE h.kind = 'class'
+           UNION ALL
+           SELECT h.kind, c.name, m.name, m.type, printf('0x%X', m.offset)
+           FROM hits h JOIN members m ON m.name = h.text JOIN classes c ON c.id = m.class_id WHERE h.kind = 'member'
+           UNION ALL
+           SELECT h.kind, c.name, m.name, m.type, printf('0x%X', m.offset)
+           FROM hits h JOIN members m ON m.type = h.text JOIN classes c ON c.id = m.class_id WHERE h.kind = 'type'
+           LIMIT 200""",
+    ),
+    "largest": (
+        "The :limit largest classes",
+        """SELECT name, parent, size, member_count
+           FROM classes ORDER BY size DESC LIMIT :limit""",
+    ),
+}
+
+
+def _fts_tokenizer(connection: sqlite3.Connection) -> str:
+    """trigram (substring matches, SQLite 3.34+) when available, else the default word tokenizer"""
+    try:
+        connection.execute("CREATE VIRTUAL TABLE temp.probe USING fts5(x, tokenize = 'trigram')")
+        connection.execute("DROP TABLE temp.probe")
+        return ", tokenize = 'trigram'"
+    except sqlite3.OperationalError:
+        return ""
+
+
+def _closure(classes: List[Dict], first_id: Dict[str, int]) -> Iterable[Tuple[int, int, int]]:
+    """(class_id, ancestor_id, depth) for every class and each of its ancestors, itself at depth 0"""
+    for class_id, record in enumerate(classes):
+        yield class_id, class_id, 0
+        seen = {class_id}
+        depth = 0
+        ancestor = first_id.get(record["P"])
+        while ancestor is not None and ancestor not in seen:
+            depth += 1
+            seen.add(ancestor)
+            yield class_id, ancestor, depth
+            ancestor = first_id.get(classes[ancestor]["P"])
+
+
+def write_sqlite(classes: List[Dict], path: str) -> Dict[str, Any]:
+    """
+    Build the database for classes in sdk_data.json format and move it into place
+
+    Returns:
+        Row counts, file size and elapsed seconds
+    """
+    start = time.perf_counter()
+    first_id: Dict[str, int] = {}
+    for class_id, record in enumerate(classes):
+        first_id.setdefault(record["N"], class_id)
+
+    tmp_path = f"{path}.tmp"
+    if os.path.exists(tmp_path):
+        os.remove(tmp_path)
+    connection = sqlite3.connect(tmp_path)
+    try:
+        # A half-written temp file is simply discarded, so skip the journal and fsyncs
+        connection.execute("PRAGMA journal_mode = OFF")
+        connection.execute("PRAGMA synchronous = OFF")
+        connection.executescript(SCHEMA)
+        connection.execute(FTS_TABLE.format(tokenize=_fts_tokenizer(connection)))
+
+        class_rows = [
+            (class_id, record["N"], record["P"], first_id.get(record["P"]), record["S"], record["T"], len(record["M"]))
+            for class_id, record in enumerate(classes)
+        ]
+        member_rows = []
+        member_names = {}
+        member_types = {}
+        for class_id, record in enumerate(classes):
+            for position, member in enumerate(record["M"]):
+                member_rows.append((len(member_rows), class_id, position, member["N"], member["T"],
+                                    int(member["O"], 16), int(member["S"], 16)))
+                member_names[member["N"]] = None
+                member_types[member["T"]] = None
+        inheritance_rows = list(_closure(classes, first_id))
+        search_rows = [(name, "class") for name in first_id]
+        search_rows += [(name, "member") for name in member_names]
+        search_rows += [(type_name, "type") for type_name in member_types]
+
+        with connection:
+            connection.executemany("INSERT INTO classes VALUES (?, ?, ?, ?, ?, ?, ?)", class_rows)
+            connection.executemany("INSERT INTO members VALUES (?, ?, ?, ?, ?, ?, ?)", member_rows)
+            connection.executemany("INSERT INTO inheritance VALUES (?, ?, ?)", inheritance_rows)
+            connection.executemany("INSERT INTO search VALUES (?, ?)", search_rows)
+            connection.executescript(INDEXES)
+            connection.execute(f"PRAGMA user_version = {SQLITE_VERSION}")
+        connection.execute("ANALYZE")
+        connection.close()
+        os.replace(tmp_path, path)
+    except BaseException:
+        connection.close()
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+    return {
+        "classes": len(class_rows),
+        "members": len(member_rows),
+        "inheritance": len(inheritance_rows),
+        "search": len(search_rows),
+        "bytes": os.path.getsize(path),
+        "seconds": time.perf_counter() - start,
+    }
+
+
+def open_database(path: str) -> sqlite3.Connection:
+    """Read-only connection to an exported database"""
+    if not os.path.exists(path):
+        raise FileNotFoundError(path)
+    connection = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+    version = connection.execute("PRAGMA user_version").fetchone()[0]
+    if version != SQLITE_VERSION:
+        connection.close()
+        raise ValueError(f"{path} has schema version {version}, expected {SQLITE_VERSION}; export it again")
+    return connection
+
+
+def _parameter(text: str) -> Any:
+    """Query parameters arrive as text; hex and decimal numbers become integers"""
+    try:
+        return int(text, 0)
+    except ValueError:
+        return text
+
+
+def run_query(connection: sqlite3.Connection, sql: str,
+              params: Optional[Dict[str, Any]] = None) -> Tuple[List[str], List[Sequence]]:
+    cursor = connection.execute(sql, params or {})
+    columns = [column[0] for column in cursor.description or ()]
+    return columns, cursor.fetchall()
+
+
+def print_table(columns: List[str], rows: List[Sequence]):
+    widths = [max([len(column)] + [len(str(row[i])) for row in rows]) for i, column in enumerate(columns)]
+    print("  ".join(column.ljust(width) for column, width in zip(columns, widths)))
+    print("  ".join("-" * width for width in widths))
+    for row in rows:
+        print("  ".join(str(value).ljust(width) for value, width in zip(row, widths)))
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Export the SDK to SQLite and run saved queries against it')
+    commands = parser.add_subparsers(dest='command', required=True)
+    export = commands.add_parser('export', help='Write a database from sdk_data.json (either schema)')
+    export.add_argument('sdk_file')
+    export.add_argument('-o', '--output', default=SQLITE_FILE, help='Database to write (default: %(default)s)')
+    commands.add_parser('list', help='Show the saved queries and their parameters')
+    query = commands.add_parser('query', help='Run a saved query')
+    query.add_argument('database')
+    query.add_argument('name', choices=sorted(SAVED_QUERIES))
+    query.add_argument('params', nargs='*', metavar='KEY=VALUE', help='Query parameters, e.g. base=AActor size=8')
+    query.add_argument('--json', action='store_true', help='Print rows as JSON objects')
+    sql = commands.add_parser('sql', help='Run any read-only SQL')
+    sql.add_argument('database')
+    sql.add_argument('statement')
+    sql.add_argument('--json', action='store_true', help='Print rows as JSON objects')
+    args = parser.parse_args()
+
+    if args.command == 'export':
+        stats = write_sqlite(load_classes(args.sdk_file), args.output)
+        print(f"🗄️  Wrote {args.output}: {stats['classes']:,} classes, {stats['members']:,} members, "
+              f"{stats['inheritance']:,} inheritance rows, {stats['search']:,} search terms ({stats['bytes'] / 1024 / 1024:.1f} MB) in {stats['seconds']:.2f}s")
+        return
+
+    if args.command == 'list':
+        for name, (description, _) in sorted(SAVED_QUERIES.items()):
+            print(f"  {name:16} {description}")
+        return
+
+    if args.command == 'query':
+        statement = SAVED_QUERIES[args.name][1]
+        params = {}
+        for item in args.params:
+            key, separator, value = item.partition('=')
+            if not separator:
+                parser.error(f"Parameters are KEY=VALUE, got {item!r}")
+            params[key] = _parameter(value)
+    else:
+        statement = args.statement
+        params = {}
+
+    connection = open_database(args.database)
+    try:
+        start = time.perf_counter()
+        columns, rows = run_query(connection, statement, params)
+        elapsed = time.perf_counter() - start
+    except sqlite3.Error as e:
+        raise SystemExit(f"❌ {e}")
+    finally:
+        connection.close()
+
+    if args.json:
+        print(json.dumps([dict(zip(columns, row)) for row in rows], indent=2))
+    else:
+        print_table(columns, rows)
+        print(f"{len(rows):,} rows in {elapsed * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+"""
+Reverse type-reference index ("who uses this type")
+
+Maps every type name that appears in a member type, with pointers,
+qualifiers and template wrappers stripped, to the members that use it.
+"TArray<AFortWeapon*>" is therefore listed under AFortWeapon, and
+"TMap<FName, FVector>" under both FName and FVector.
+
+Index layout (type_refs.json):
+    {
+      "version": 1,
+      "classes": ["AActor", ...],
+      "types": ["TArray<AFortWeapon*>", ...],       distinct raw member types
+      "refs": {"AFortWeapon": [[class_index, member_name, offset, type_index], ...], ...}
+    }
+References are listed in dump order.
+
+Usage:
+    python sdk_typerefs.py ../Latest/Data/type_refs.json USkeletalMeshComponent
+"""
+
+import json
+import re
+from typing import Dict, List
+
+from sdk_writer import write_json_atomic
+
+
+TYPE_REFS_FILE = "type_refs.json"
+TYPE_REFS_VERSION = 1
+
+TYPE_NAME_PATTERN = re.compile(r'[A-Za-z_]\w*(?:::[A-Za-z_]\w*)*')
+
+# Containers and smart pointers; only their arguments are real references
+TEMPLATE_WRAPPERS = frozenset({
+    'TArray', 'TMap', 'TSet', 'TOptional', 'TEnumAsByte', 'TSubclassOf', 'TScriptInterface',
+    'TObjectPtr', 'TWeakObjectPtr', 'TLazyObjectPtr', 'TSoftObjectPtr', 'TSoftClassPtr',
+    'TSharedPtr', 'TSharedRef', 'TWeakPtr', 'TUniquePtr', 'TFieldPath',
+})
+
+QUALIFIERS = frozenset({'const', 'volatile', 'class', 'struct', 'enum', 'union', 'unsigned', 'signed'})
+
+_REFERENCED_CACHE: Dict[str, List[str]] = {}
+
+
+def referenced_types(type_name: str) -> List[str]:
+    """Distinct type names referenced by a member type, outermost first"""
+    names = _REFERENCED_CACHE.get(type_name)
+    if names is None:
+        names = []
+        for name in TYPE_NAME_PATTERN.findall(type_name):
+            if name not in TEMPLATE_WRAPPERS and name not in QUALIFIERS and name not in names:
+                names.append(name)
+        _REFERENCED_CACHE[type_name] = names
+    return names
+
+
+def build_type_refs(classes: List[Dict]) -> Dict:
+    """Build the serializable index for classes in sdk_data.json format"""
+    names = []
+    type_ids: Dict[str, int] = {}
+    refs: Dict[str, List[List]] = {}
+
+    for class_index, record in enumerate(classes):
+        names.append(record["N"])
+        for member in record["M"]:
+            raw_type = member["T"]
+            type_id = type_ids.get(raw_type)
+            if type_id is None:
+                type_id = type_ids[raw_type] = len(type_ids)
+            entry = [class_index, member["N"], member["O"], type_id]
+            for name in referenced_types(raw_type):
+                refs.setdefault(name, []).append(entry)
+
+    return {
+        "version": TYPE_REFS_VERSION,
+        "classes": names,
+        "types": list(type_ids),
+        "refs": refs,
+    }
+
+
+def write_type_refs(classes: List[Dict], path: str) -> int:
+    """Build and atomically write the index; returns the file size in bytes"""
+    return write_json_atomic(path, build_type_refs(classes), indent=None)
+
+
+class TypeRefIndex:
+    """Query side of the reverse type-reference index"""
+
+    def __init__(self, data: Dict):
+        if data.get("version") != TYPE_REFS_VERSION:
+            raise ValueError(f"Unsupported type reference index version {data.get('version')}")
+        self.classes = data["classes"]
+        self.types = data["types"]
+        self.refs = data["refs"]
+
+    @classmethod
+    def load(cls, path: str) -> 'TypeRefIndex':
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls(json.load(f))
+
+    @classmethod
+    def from_classes(cls, classes: List[Dict]) -> 'TypeRefIndex':
+        return cls(build_type_refs(classes))
+
+    def users(self, type_name: str) -> List[Dict]:
+        """
+        Members referencing type_name, which may be written with wrappers ("USkeletalMeshComponent*")
+
+        If the query names several types ("TMap<FName, FVector>"), the last one is looked up.
+
+        Returns:
+            Result dicts: {"class": name, "member": member, "offset": offset, "type": raw member type}
+        """
+        names = referenced_types(type_name)
+        if not names:
+            return []
+        return [
+            {"class": self.classes[class_index], "member": member, "offset": offset, "type": self.types[type_id]}
+            for class_index, member, offset, type_id in self.refs.get(names[-1], ())
+        ]
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description='List the members that use a type')
+    parser.add_argument('index', help=f'Path to {TYPE_REFS_FILE}')
+    parser.add_argument('type', help='Type name, e.g. FVector or USkeletalMeshComponent*')
+    args = parser.parse_args()
+
+    results = TypeRefIndex.load(args.index).users(args.type)
+    for result in results:
+        print(f"{result['class']}: {result['member']} - {result['offset']}  ({result['type']})")
+    print(f"{len(results):,} references")
+
+
+if __name__ == "__main__":
+    main()
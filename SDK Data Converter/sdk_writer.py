@@ -0,0 +1,181 @@
+"""
+Streaming, atomic JSON output shared by the SDK converters
+
+Records are serialized one at a time into a temp file next to the target,
+which is renamed over the target only once the array is complete. The viewer
+therefore never sees a half-written sdk_data.json.
+"""
+
+import json
+import os
+import tempfile
+import time
+from typing import Any, Dict, Iterable, Optional
+
+
+def _make_temp(path: str):
+    """Create a temp file beside path with the permissions a plain open() would give"""
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=f".{os.path.basename(path)}.", suffix=".tmp")
+    # mkstemp creates 0600 files; static hosts need the usual umask-derived mode
+    umask = os.umask(0)
+    os.umask(umask)
+    os.chmod(tmp_path, 0o666 & ~umask)
+    return fd, tmp_path
+
+
+class StreamingJSONWriter:
+    """
+    Writes a JSON array record by record
+
+    With indent=2 the output is byte-identical to json.dump(records, f, indent=2);
+    with indent=None it is written compactly with no whitespace at all.
+    """
+
+    def __init__(self, path: str, indent: Optional[int] = 2, ensure_ascii: bool = True):
+        self.path = str(path)
+        self.indent = indent
+        self.ensure_ascii = ensure_ascii
+        self.records = 0
+        self.bytes_written = 0
+        # Time spent serializing and writing, excluding whatever the caller does between records
+        self.elapsed = 0.0
+
+        fd, self._tmp_path = _make_temp(self.path)
+        self._file = os.fdopen(fd, 'w', encoding='utf-8')
+
+        if indent is None:
+            self._separators = (',', ':')
+            self._prefix = '['
+            self._delimiter = ','
+            self._suffix = ']'
+        else:
+            self._separators = (',', ': ')
+            self._newline_indent = '\n' + ' ' * indent
+            self._prefix = '[' + self._newline_indent
+            self._delimiter = ',' + self._newline_indent
+            self._suffix = '\n]'
+        # Written instead of prefix + suffix when no record was written
+        self._empty = '[]'
+
+    def __enter__(self) -> 'StreamingJSONWriter':
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+        return False
+
+    def serialize(self, record: Dict[str, Any]) -> str:
+        """Text of one record exactly as write() would append it"""
+        text = json.dumps(record, indent=self.indent, separators=self._separators,
+                          ensure_ascii=self.ensure_ascii)
+        if self.indent is not None:
+            # JSON strings never contain raw newlines, so this only re-indents structure
+            text = text.replace('\n', self._newline_indent)
+        return text
+
+    def serialize_all(self, records: Iterable[Dict[str, Any]]) -> str:
+        """Text of several consecutive records, for write_serialized()"""
+        return self._delimiter.join(self.serialize(record) for record in records)
+
+    def write(self, record: Dict[str, Any]):
+        """Serialize one record and append it to the array"""
+        start = time.perf_counter()
+        self._file.write((self._delimiter if self.records else self._prefix) + self.serialize(record))
+        self.records += 1
+        self.elapsed += time.perf_counter() - start
+
+    def write_serialized(self, text: str, records: int = 1):
+        """
+        Append records that were serialized earlier with serialize()/serialize_all()
+
+        Lets a caller that rewrites the same file repeatedly keep the text of
+        unchanged records instead of serializing them again.
+        """
+        start = time.perf_counter()
+        self._file.write((self._delimiter if self.records else self._prefix) + text)
+        self.records += records
+        self.elapsed += time.perf_counter() - start
+
+    def write_all(self, records: Iterable[Dict[str, Any]]):
+        for record in records:
+            self.write(record)
+
+    def close(self):
+        """Finish the array and atomically move it into place"""
+        if self._file is None:
+            return
+        start = time.perf_counter()
+        self._file.write(self._suffix if self.records else self._empty)
+        self._file.close()
+        self._file = None
+        os.replace(self._tmp_path, self.path)
+        self.bytes_written = os.path.getsize(self.path)
+        self.elapsed += time.perf_counter() - start
+
+    def abort(self):
+        """Discard the temp file, leaving any existing output untouched"""
+        if self._file is None:
+            return
+        self._file.close()
+        self._file = None
+        try:
+            os.remove(self._tmp_path)
+        except OSError:
+            pass
+
+    @property
+    def throughput(self) -> float:
+        """Bytes per second for the completed write"""
+        return self.bytes_written / self.elapsed if self.elapsed > 0 else 0.0
+
+    def summary(self) -> str:
+        return (f"{self.bytes_written:,} bytes ({self.bytes_written / 1024 / 1024:.2f} MB) "
+                f"in {self.elapsed:.2f}s, {self.throughput / 1024 / 1024:.1f} MB/s")
+
+
+def write_json_atomic(path: str, data: Any, indent: Optional[int] = 2, ensure_ascii: bool = True) -> int:
+    """
+    Write any JSON value through a temp file and rename
+
+    Returns:
+        Size of the written file in bytes
+    """
+    fd, tmp_path = _make_temp(str(path))
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            separators = (',', ':') if indent is None else None
+            json.dump(data, f, indent=indent, separators=separators, ensure_ascii=ensure_ascii)
+        os.replace(tmp_path, str(path))
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+    return os.path.getsize(str(path))
+
+
+def write_bytes_atomic(path: str, data: bytes) -> int:
+    """
+    Write a binary blob through a temp file and rename
+
+    Returns:
+        Size of the written file in bytes
+    """
+    fd, tmp_path = _make_temp(str(path))
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, str(path))
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+    return len(data)
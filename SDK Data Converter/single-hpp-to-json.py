@@ -10,17 +10,26 @@ Author: SDK Converter
 Date: November 19, 2025
 """
 
+import atexit
 import json
+import queue
 import re
 import sys
 import time
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple
+from typing import Callable, Iterable, List, Dict, Optional, Tuple
 from datetime import datetime
 import logging
+import logging.handlers
 from dataclasses import dataclass
 import os
 
+from sdk_metrics import Metrics, add_profile_argument, format_bytes, get_peak_rss, run_profiled, wants_breakdown
+from sdk_records import LOWER_HEX_FORMATS, UPPER_HEX_FORMATS, ClassRecord, MemberRecord, to_dicts
+from sdk_writer import StreamingJSONWriter
+from sdk_schema import SCHEMA_V1, add_schema_argument, load_classes, open_sdk_writer
+from sdk_outputs import add_output_arguments, remove_stale_outputs, wants_extra_outputs, write_extra_outputs
+
 
 # Enable ANSI color support for Windows CMD
 def enable_windows_colors():
@@ -65,19 +74,48 @@ class ColoredFormatter(logging.Formatter):
         return formatted
 
 
-def setup_logging(verbose: bool = True) -> logging.Logger:
-    """Setup comprehensive logging with file and console handlers"""
+# --log-mode values: every structure and member / rate-limited progress / final summary only
+LOG_MODES = ('verbose', 'fast', 'summary')
+
+# Minimum seconds between progress lines in fast mode
+PROGRESS_SECONDS = 2.0
+
+
+class _DeferredQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler that leaves formatting to the listener thread
+    
+    The stock prepare() renders the message on the calling thread. The queue
+    never leaves this process, so the record can be passed through untouched.
+    """
+    
+    def prepare(self, record):
+        return record
+
+
+def setup_logging(verbose: bool = True, mode: str = 'verbose') -> logging.Logger:
+    """
+    Setup comprehensive logging with file and console handlers
+    
+    In 'fast' and 'summary' mode debug records are dropped, and the console
+    and file handlers run on a background QueueListener so their I/O and
+    formatting stay off the parse thread.
+    """
+    queued = mode != 'verbose'
+    if queued:
+        verbose = False
     logger = logging.getLogger('HPPConverter')
     logger.setLevel(logging.DEBUG if verbose else logging.INFO)
     
     # Remove existing handlers
     logger.handlers.clear()
+    handlers = []
     
     # Console handler with colors (Windows CMD compatible)
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(logging.DEBUG if verbose else logging.INFO)
     console_handler.setFormatter(ColoredFormatter())
-    logger.addHandler(console_handler)
+    handlers.append(console_handler)
     
     # File handler for detailed logs
     timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
@@ -89,15 +127,25 @@ def setup_logging(verbose: bool = True) -> logging.Logger:
         datefmt='%Y-%m-%d %H:%M:%S'
     )
     file_handler.setFormatter(file_formatter)
-    logger.addHandler(file_handler)
+    handlers.append(file_handler)
     
-    logger.info(f"Logging initialized. Log file: {log_file}")
+    if queued:
+        listener = logging.handlers.QueueListener(queue.SimpleQueue(), *handlers, respect_handler_level=True)
+        logger.addHandler(_DeferredQueueHandler(listener.queue))
+        listener.start()
+        # Drains whatever is still queued before the interpreter exits
+        atexit.register(listener.stop)
+    else:
+        for handler in handlers:
+            logger.addHandler(handler)
+    
+    logger.info("Logging initialized (%s mode). Log file: %s", mode, log_file)
     return logger
 
 
 @dataclass
-class ParseStats:
-    """Statistics tracker for parsing operations"""
+class ParseStats(Metrics):
+    """Statistics tracker for parsing operations, plus the shared phase timers and counters"""
     total_lines: int = 0
     classes_found: int = 0
     structs_found: int = 0
@@ -105,16 +153,25 @@ class ParseStats:
     errors: int = 0
     warnings: int = 0
     start_time: float = 0
+    peak_rss: Optional[int] = None
+    output_bytes: int = 0
+    write_seconds: float = 0
     
     def __post_init__(self):
+        Metrics.__init__(self)
         self.start_time = time.time()
     
     def get_elapsed(self) -> float:
         return time.time() - self.start_time
     
-    def log_summary(self, logger: logging.Logger):
-        """Log comprehensive statistics"""
+    def update_peak_rss(self):
+        """Sample the process high-water mark (bytes, None if unsupported)"""
+        self.peak_rss = get_peak_rss()
+    
+    def log_summary(self, logger: logging.Logger, detailed: bool = False):
+        """Log comprehensive statistics; detailed adds the phase breakdown and slowest items"""
         elapsed = self.get_elapsed()
+        self.update_peak_rss()
         logger.info("=" * 70)
         logger.info("PARSING STATISTICS SUMMARY")
         logger.info("=" * 70)
@@ -126,9 +183,44 @@ class ParseStats:
         logger.info(f"Errors Encountered:       {self.errors}")
         logger.info(f"Warnings:                 {self.warnings}")
         logger.info(f"Processing Time:          {elapsed:.2f} seconds")
+        logger.info(f"Peak Memory (RSS):        {format_bytes(self.peak_rss)}")
+        if self.output_bytes:
+            logger.info(f"Output Size:              {format_bytes(self.output_bytes)}")
+            if self.write_seconds > 0:
+                logger.info(f"Write Throughput:         {self.output_bytes / self.write_seconds / 1024 / 1024:,.1f} MB/s")
         if self.total_lines > 0:
             logger.info(f"Processing Speed:         {self.total_lines / elapsed:,.0f} lines/sec")
+        if detailed:
+            Metrics.log_summary(self, logger.info, detailed=True)
         logger.info("=" * 70)
+    
+    def report(self) -> Dict:
+        """Metrics report including the parse counters above"""
+        report = Metrics.report(self)
+        report["counters"].update(
+            total_lines=self.total_lines,
+            classes_found=self.classes_found,
+            structs_found=self.structs_found,
+            members_found=self.members_found,
+            errors=self.errors,
+            warnings=self.warnings,
+            output_bytes=self.output_bytes,
+        )
+        return report
+
+
+class StructureRecord(ClassRecord):
+    """ClassRecord that serializes with this converter's key order (type after members)"""
+    
+    __slots__ = ()
+    
+    def to_dict(self) -> Dict:
+        return {"N": self.name, "P": self.parent, "S": self.size,
+                "M": [member.to_dict() for member in self.members], "T": self.kind}
+
+
+# Read size used when scanning a dump in streaming mode
+STREAM_CHUNK_SIZE = 1024 * 1024
 
 
 class HPPToJSONConverter:
@@ -152,21 +244,34 @@ class HPPToJSONConverter:
         re.MULTILINE
     )
     
-    def __init__(self, logger: logging.Logger):
+    def __init__(self, logger: logging.Logger, sink: Optional[Callable[[StructureRecord], None]] = None,
+                 fast_log: bool = False):
+        """
+        Args:
+            logger: Logger for progress and diagnostics
+            sink: Optional callback receiving each completed structure. When set,
+                  structures are handed off instead of being kept in self.structures
+            fast_log: Log completed structures at DEBUG instead of INFO, and
+                      report progress at INFO at most every PROGRESS_SECONDS
+        """
         self.logger = logger
+        self.sink = sink
+        self.fast_log = fast_log
         self.stats = ParseStats()
         self.current_structure: Optional[Dict] = None
-        self.structures: List[Dict] = []
+        self.structures: List[StructureRecord] = []
+        self.completed_count = 0
         
-    def parse_hpp_file(self, hpp_path: Path) -> List[Dict]:
+    def parse_hpp_file(self, hpp_path: Path, stream: bool = False) -> List[StructureRecord]:
         """
         Parse HPP file and extract all structures with members
         
         Args:
             hpp_path: Path to the HPP file
+            stream: Iterate the file line by line instead of loading it into memory
             
         Returns:
-            List of structure dictionaries in SDK JSON format
+            List of structure records (to_dict() gives the SDK JSON format)
         """
         self.logger.info("=" * 70)
         self.logger.info(f"Starting HPP file parsing: {hpp_path}")
@@ -181,18 +286,25 @@ class HPPToJSONConverter:
         self.logger.info(f"File size: {file_size:,} bytes ({file_size / 1024 / 1024:.2f} MB)")
         
         try:
-            self.logger.info("Reading file content...")
-            with open(hpp_path, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
-            
-            lines = content.split('\n')
-            self.stats.total_lines = len(lines)
-            self.logger.info(f"Total lines to process: {self.stats.total_lines:,}")
-            
-            self.logger.info("Beginning line-by-line parsing...")
-            self._parse_content(content)
+            if stream:
+                self._parse_stream(hpp_path)
+            else:
+                self.logger.info("Reading file content...")
+                with self.stats.phase("read"):
+                    with open(hpp_path, 'r', encoding='utf-8', errors='ignore') as f:
+                        content = f.read()
+                
+                lines = content.split('\n')
+                self.stats.total_lines = len(lines)
+                self.logger.info(f"Total lines to process: {self.stats.total_lines:,}")
+                
+                self.logger.info("Beginning line-by-line parsing...")
+                with self.stats.phase("parse"):
+                    self._parse_content(content)
             
-            self.logger.info(f"Parsing complete! Found {len(self.structures)} structures")
+            self.stats.update_peak_rss()
+            self.logger.info(f"Parsing complete! Found {self.completed_count} structures")
+            self.logger.info(f"Peak memory (RSS): {format_bytes(self.stats.peak_rss)}")
             return self.structures
             
         except Exception as e:
@@ -200,27 +312,60 @@ class HPPToJSONConverter:
             self.stats.errors += 1
             return []
     
+    def _parse_stream(self, hpp_path: Path):
+        """Parse the file one line at a time so memory stays bounded by the current structure"""
+        self.logger.info("Counting lines (streaming mode)...")
+        newline_count = 0
+        with self.stats.phase("read"), open(hpp_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(STREAM_CHUNK_SIZE), b''):
+                newline_count += chunk.count(b'\n')
+        self.stats.total_lines = newline_count + 1
+        self.logger.info(f"Total lines to process: {self.stats.total_lines:,}")
+        
+        self.logger.info("Beginning streaming line-by-line parsing...")
+        # Structures are written as they complete, so "parse" includes serialization here
+        with self.stats.phase("parse"), open(hpp_path, 'r', encoding='utf-8', errors='ignore') as f:
+            self._parse_lines((line.rstrip('\n') for line in f), self.stats.total_lines)
+    
     def _parse_content(self, content: str):
         """Parse content and extract structures"""
         lines = content.split('\n')
+        self._parse_lines(lines, len(lines))
+    
+    def _parse_lines(self, lines: Iterable[str], total_lines: int):
+        """Parse an iterable of lines (without trailing newlines) and extract structures"""
         current_class_name = None
         current_parent = None
         current_type = None
         current_members = []
         in_class = False
         brace_count = 0
+        structure_started = 0.0
+        perf_counter = time.perf_counter
         
-        progress_interval = max(1, len(lines) // 100)  # Log every 1%
+        # Level checks are hoisted out of the loop; disabled records then cost one branch
+        logger = self.logger
+        debug = logger.isEnabledFor(logging.DEBUG)
+        structure_level = logging.DEBUG if self.fast_log else logging.INFO
+        log_structures = logger.isEnabledFor(structure_level)
+        progress_level = logging.INFO if self.fast_log else logging.DEBUG
+        log_progress = logger.isEnabledFor(progress_level)
+        last_progress = perf_counter()
+        
+        progress_interval = max(1, total_lines // 100)  # Check every 1%
         
         for line_num, line in enumerate(lines, 1):
-            # Progress logging
-            if line_num % progress_interval == 0:
-                progress = (line_num / len(lines)) * 100
-                self.logger.debug(
-                    f"Progress: {progress:.1f}% ({line_num:,}/{len(lines):,} lines) | "
-                    f"Structures: {len(self.structures)} | "
-                    f"Members: {self.stats.members_found}"
-                )
+            # Progress logging, at most every PROGRESS_SECONDS in fast mode
+            if log_progress and line_num % progress_interval == 0:
+                now = perf_counter()
+                if not self.fast_log or now - last_progress >= PROGRESS_SECONDS:
+                    last_progress = now
+                    logger.log(
+                        progress_level,
+                        "Progress: %.1f%% (%s/%s lines) | Structures: %d | Members: %d",
+                        line_num / total_lines * 100, f"{line_num:,}", f"{total_lines:,}",
+                        self.completed_count, self.stats.members_found
+                    )
             
             stripped = line.strip()
             
@@ -240,8 +385,10 @@ class HPPToJSONConverter:
                     current_members = []
                     in_class = True
                     brace_count = 1
+                    structure_started = perf_counter()
                     self.stats.classes_found += 1
-                    self.logger.debug(f"Found class: {current_class_name} (parent: {current_parent or 'none'})")
+                    if debug:
+                        logger.debug("Found class: %s (parent: %s)", current_class_name, current_parent or 'none')
                     
                 elif struct_match:
                     current_class_name = struct_match.group(1)
@@ -250,8 +397,10 @@ class HPPToJSONConverter:
                     current_members = []
                     in_class = True
                     brace_count = 1
+                    structure_started = perf_counter()
                     self.stats.structs_found += 1
-                    self.logger.debug(f"Found struct: {current_class_name} (parent: {current_parent or 'none'})")
+                    if debug:
+                        logger.debug("Found struct: %s (parent: %s)", current_class_name, current_parent or 'none')
                     
             else:
                 # Count braces to track nesting
@@ -266,43 +415,48 @@ class HPPToJSONConverter:
                         offset = member_match.group(2)
                         size = member_match.group(3)
                         
-                        member = {
-                            "N": member_name,
-                            "T": self._infer_type(member_name, size),
-                            "O": offset,
-                            "S": size
-                        }
-                        current_members.append(member)
+                        # sdk_records.parse_hex, inlined; the pattern guarantees the 0x prefix
+                        offset_digits = offset[2:]
+                        size_digits = size[2:]
+                        size_value = int(size_digits, 16)
+                        current_members.append(MemberRecord(
+                            member_name, self._infer_type(member_name, size_value),
+                            int(offset_digits, 16), size_value,
+                            (LOWER_HEX_FORMATS if offset_digits.islower() else UPPER_HEX_FORMATS)[len(offset_digits)],
+                            (LOWER_HEX_FORMATS if size_digits.islower() else UPPER_HEX_FORMATS)[len(size_digits)]
+                        ))
                         self.stats.members_found += 1
-                        self.logger.debug(f"  └─ Member: {member_name} @ {offset} (size: {size})")
+                        if debug:
+                            logger.debug("  └─ Member: %s @ %s (size: %s)", member_name, offset, size)
                 
                 # End of class/struct
                 if brace_count == 0 and in_class:
                     # Skip structures with no members
                     if len(current_members) == 0:
-                        self.logger.debug(
-                            f"Skipping {current_type}: {current_class_name} (no members)"
-                        )
+                        if debug:
+                            logger.debug("Skipping %s: %s (no members)", current_type, current_class_name)
                         in_class = False
                         continue
                     
                     # Calculate structure size from members
                     struct_size = self._calculate_size(current_members)
                     
-                    structure = {
-                        "N": current_class_name,
-                        "P": current_parent,
-                        "S": struct_size,
-                        "M": current_members,
-                        "T": current_type
-                    }
-                    
-                    self.structures.append(structure)
-                    self.logger.info(
-                        f"Completed {current_type}: {current_class_name} "
-                        f"(size: {struct_size}, members: {len(current_members)})"
+                    structure = StructureRecord(
+                        current_class_name, current_parent, struct_size, current_type, current_members
                     )
                     
+                    if self.sink:
+                        self.sink(structure)
+                    else:
+                        self.structures.append(structure)
+                    self.completed_count += 1
+                    self.stats.record("classes", current_class_name, perf_counter() - structure_started)
+                    if log_structures:
+                        logger.log(
+                            structure_level, "Completed %s: %s (size: %s, members: %d)",
+                            current_type, current_class_name, struct_size, len(current_members)
+                        )
+                    
                     # Reset state
                     in_class = False
                     current_class_name = None
@@ -310,19 +464,17 @@ class HPPToJSONConverter:
                     current_type = None
                     current_members = []
     
-    def _infer_type(self, name: str, size: str) -> str:
+    def _infer_type(self, name: str, size_int: int) -> str:
         """
         Infer member type from name and size
         
         Args:
             name: Member name
-            size: Member size in hex
+            size_int: Member size in bytes
             
         Returns:
             Inferred type string
         """
-        size_int = int(size, 16)
-        
         # Type inference based on size
         if size_int == 0x1:
             if 'b' in name.lower() and name.startswith('b'):
@@ -340,7 +492,7 @@ class HPPToJSONConverter:
                 # Try to infer pointer type from name
                 for word in name.split('_'):
                     if word and word[0].isupper():
-                        return f'U{word}*' if word.startswith('U') else f'A{word}*'
+                        return sys.intern(f'U{word}*' if word.startswith('U') else f'A{word}*')
                 return 'UObject*'
             return 'uint64_t'
         elif size_int == 0x10:
@@ -350,47 +502,37 @@ class HPPToJSONConverter:
         elif size_int == 0x20:
             return 'TArray<uint8_t>'
         else:
-            return f'uint8_t[{size_int}]'
+            return sys.intern(f'uint8_t[{size_int}]')
     
-    def _calculate_size(self, members: List[Dict]) -> int:
+    def _calculate_size(self, members: List[MemberRecord]) -> int:
         """
         Calculate total structure size from members
         
         Args:
-            members: List of member dictionaries
+            members: List of member records
             
         Returns:
             Total size in bytes
         """
-        if not members:
-            return 0
+        # Find the last member's offset + size
+        max_offset = 0
+        max_size = 0
         
-        try:
-            # Find the last member's offset + size
-            max_offset = 0
-            max_size = 0
-            
-            for member in members:
-                offset = int(member['O'], 16)
-                size = int(member['S'], 16)
-                
-                if offset >= max_offset:
-                    max_offset = offset
-                    max_size = size
-            
-            return max_offset + max_size
-            
-        except Exception as e:
-            self.logger.warning(f"Error calculating size: {e}")
-            self.stats.warnings += 1
-            return 0
+        for member in members:
+            if member.offset >= max_offset:
+                max_offset = member.offset
+                max_size = member.size
+        
+        return max_offset + max_size
     
-    def save_to_json(self, output_path: Path) -> bool:
+    def save_to_json(self, output_path: Path, compact: bool = False, schema: int = SCHEMA_V1) -> bool:
         """
         Save parsed structures to JSON file
         
         Args:
             output_path: Path to output JSON file
+            compact: Write without indentation or whitespace
+            schema: sdk_data.json layout (1 or 2, see sdk_schema.py)
             
         Returns:
             True if successful, False otherwise
@@ -401,17 +543,14 @@ class HPPToJSONConverter:
         try:
             self.logger.info(f"Writing {len(self.structures)} structures to file...")
             
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(self.structures, f, indent=2, ensure_ascii=False)
-            
-            file_size = output_path.stat().st_size
-            self.logger.info(f"Successfully saved JSON file")
-            self.logger.info(f"Output file size: {file_size:,} bytes ({file_size / 1024 / 1024:.2f} MB)")
+            with self.stats.phase("serialize"), self._open_writer(output_path, compact, schema) as writer:
+                writer.write_all(structure.to_dict() for structure in self.structures)
+            self._record_write(writer)
             
             # Log sample of first structure
             if self.structures:
                 self.logger.debug("First structure sample:")
-                self.logger.debug(json.dumps(self.structures[0], indent=2))
+                self.logger.debug(json.dumps(self.structures[0].to_dict(), indent=2))
             
             return True
             
@@ -419,6 +558,85 @@ class HPPToJSONConverter:
             self.logger.error(f"Error saving JSON file: {e}", exc_info=True)
             self.stats.errors += 1
             return False
+    
+    def convert_streaming(self, hpp_path: Path, output_path: Path, compact: bool = False,
+                          schema: int = SCHEMA_V1) -> bool:
+        """
+        Stream the HPP file straight into the JSON output
+        
+        Each structure is serialized as soon as its closing brace is seen, so
+        neither the dump nor the parsed structures are ever held in memory.
+        The output only replaces output_path if at least one structure was found.
+        
+        Args:
+            hpp_path: Path to the HPP file
+            output_path: Path to output JSON file
+            compact: Write without indentation or whitespace
+            schema: sdk_data.json layout (1 or 2, see sdk_schema.py)
+            
+        Returns:
+            True if structures were found and written, False otherwise
+        """
+        self.logger.info(f"Streaming structures to JSON: {output_path}")
+        
+        try:
+            writer = self._open_writer(output_path, compact, schema)
+        except Exception as e:
+            self.logger.error(f"Error opening JSON output: {e}", exc_info=True)
+            self.stats.errors += 1
+            return False
+        
+        self.sink = lambda structure: writer.write(structure.to_dict())
+        try:
+            self.parse_hpp_file(hpp_path, stream=True)
+        finally:
+            self.sink = None
+        
+        if self.completed_count == 0 or self.stats.errors:
+            writer.abort()
+            return False
+        
+        try:
+            writer.close()
+        except Exception as e:
+            self.logger.error(f"Error saving JSON file: {e}", exc_info=True)
+            self.stats.errors += 1
+            return False
+        
+        self._record_write(writer)
+        return True
+    
+    def _open_writer(self, output_path: Path, compact: bool, schema: int) -> StreamingJSONWriter:
+        return open_sdk_writer(output_path, schema, indent=None if compact else 2, ensure_ascii=False)
+    
+    def _record_write(self, writer: StreamingJSONWriter):
+        """Log and record output size and throughput of a finished write"""
+        self.stats.output_bytes = writer.bytes_written
+        self.stats.write_seconds = writer.elapsed
+        self.logger.info(f"Successfully saved JSON file")
+        self.logger.info(f"Output file size: {writer.bytes_written:,} bytes ({writer.bytes_written / 1024 / 1024:.2f} MB)")
+        self.logger.info(f"Write throughput: {writer.throughput / 1024 / 1024:.1f} MB/s")
+
+
+def parse_args():
+    """Parse command line arguments"""
+    import argparse
+    
+    parser = argparse.ArgumentParser(description='Convert a single HPP offset dump to SDK JSON')
+    parser.add_argument('hpp_file', nargs='?', help='Input HPP file (default: the dump next to this script)')
+    parser.add_argument('-o', '--output', help='Output JSON file (default: sdk_data_converted.json next to this script)')
+    parser.add_argument('--stream', action='store_true',
+                        help='Stream the dump line by line instead of loading it into memory, '
+                             'writing each structure to the output as soon as it is parsed')
+    parser.add_argument('--compact', action='store_true', help='Write JSON without indentation')
+    parser.add_argument('--log-mode', choices=LOG_MODES, default='verbose',
+                        help='verbose: every structure and member (default); fast: no per-structure lines, '
+                             'progress every few seconds, logging on a background thread; '
+                             'summary: only warnings, errors and the final summary')
+    add_schema_argument(parser)
+    add_output_arguments(parser)
+    add_profile_argument(parser, 'single_hpp_profile')
+    return parser.parse_args()
 
 
 def main():
@@ -427,13 +645,15 @@ def main():
     print("HPP to SDK JSON Converter")
     print("=" * 70 + "\n")
     
+    args = parse_args()
+    
     # Setup logging
-    logger = setup_logging(verbose=True)
+    logger = setup_logging(verbose=True, mode=args.log_mode)
     
     # Get file paths
     script_dir = Path(__file__).parent
-    hpp_file = script_dir / "++Fortnite+Release-38.11-CL-48390828.hpp"
-    output_file = script_dir / "sdk_data_converted.json"
+    hpp_file = Path(args.hpp_file) if args.hpp_file else script_dir / "++Fortnite+Release-38.11-CL-48390828.hpp"
+    output_file = Path(args.output) if args.output else script_dir / "sdk_data_converted.json"
     
     logger.info(f"Script directory: {script_dir}")
     logger.info(f"Input HPP file: {hpp_file}")
@@ -446,35 +666,84 @@ def main():
         return 1
     
     # Create converter and parse
-    converter = HPPToJSONConverter(logger)
-    
-    logger.info("\n" + "=" * 70)
-    logger.info("PHASE 1: PARSING HPP FILE")
-    logger.info("=" * 70)
+    converter = HPPToJSONConverter(logger, fast_log=args.log_mode != 'verbose')
+    if args.log_mode == 'summary':
+        # Raised back to INFO for the final statistics in convert()
+        logger.setLevel(logging.WARNING)
+    return run_profiled(lambda: convert(converter, args, hpp_file, output_file), args.profile,
+                        converter.stats, log=logger.info)
+
+
+def convert(converter: HPPToJSONConverter, args, hpp_file: Path, output_file: Path) -> int:
+    """Run the conversion phases and log the outcome; returns the process exit code"""
+    logger = converter.logger
     
-    structures = converter.parse_hpp_file(hpp_file)
+    def log_summary():
+        # --log-mode summary held the logger at WARNING until now
+        logger.setLevel(min(logger.level, logging.INFO))
+        converter.stats.log_summary(logger, detailed=wants_breakdown(args))
     
-    if not structures:
-        logger.error("No structures found in HPP file!")
-        converter.stats.log_summary(logger)
-        return 1
+    if args.stream:
+        logger.info("\n" + "=" * 70)
+        logger.info("PHASE 1+2: STREAMING HPP FILE TO JSON")
+        logger.info("=" * 70)
+        
+        success = converter.convert_streaming(hpp_file, output_file, compact=args.compact, schema=args.schema)
+        
+        if converter.completed_count == 0:
+            logger.error("No structures found in HPP file!")
+            log_summary()
+            return 1
+    else:
+        logger.info("\n" + "=" * 70)
+        logger.info("PHASE 1: PARSING HPP FILE")
+        logger.info("=" * 70)
+        
+        structures = converter.parse_hpp_file(hpp_file)
+        
+        if not structures:
+            logger.error("No structures found in HPP file!")
+            log_summary()
+            return 1
+        
+        logger.info("\n" + "=" * 70)
+        logger.info("PHASE 2: SAVING TO JSON")
+        logger.info("=" * 70)
+        
+        success = converter.save_to_json(output_file, compact=args.compact, schema=args.schema)
     
-    logger.info("\n" + "=" * 70)
-    logger.info("PHASE 2: SAVING TO JSON")
-    logger.info("=" * 70)
+    if success:
+        remove_stale_outputs(str(output_file.parent), args, log=logger.info)
     
-    success = converter.save_to_json(output_file)
+    if success and wants_extra_outputs(args):
+        logger.info("\n" + "=" * 70)
+        logger.info("PHASE 3: WRITING EXTRA OUTPUTS")
+        logger.info("=" * 70)
+        
+        try:
+            if args.stream:
+                # Streaming mode kept nothing in memory; read back what was just written
+                structures = load_classes(str(output_file))
+            else:
+                structures = to_dicts(converter.structures)
+            with converter.stats.phase("extra_outputs"):
+                write_extra_outputs(structures, str(output_file.parent), args, log=logger.info,
+                                    data_path=str(output_file))
+        except Exception as e:
+            logger.error(f"Error writing extra outputs: {e}", exc_info=True)
+            converter.stats.errors += 1
+            success = False
     
     # Log final statistics
     logger.info("\n")
-    converter.stats.log_summary(logger)
+    log_summary()
     
     if success:
         logger.info("\n" + "=" * 70)
         logger.info("CONVERSION COMPLETED SUCCESSFULLY!")
         logger.info("=" * 70)
         logger.info(f"✓ Output file: {output_file}")
-        logger.info(f"✓ Total structures: {len(structures)}")
+        logger.info(f"✓ Total structures: {converter.completed_count}")
         logger.info(f"✓ Processing time: {converter.stats.get_elapsed():.2f} seconds")
         return 0
     else:
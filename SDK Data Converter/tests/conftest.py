@@ -0,0 +1,68 @@
+"""
+Shared fixtures: a small synthetic dump converted once per test session
+
+The converter scripts import each other by module name, so the converter
+directory goes on sys.path the same way running a script from it would.
+"""
+
+import json
+import os
+import sys
+
+import pytest
+
+CONVERTER_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, CONVERTER_DIR)
+
+from convert_sdk import FortniteSDKConverter  # noqa: E402
+from sdk_corpus import generate_dumper7  # noqa: E402
+
+
+@pytest.fixture(scope="session")
+def sdk_dir(tmp_path_factory) -> str:
+    """A 400-class Dumper-7 header folder from sdk_corpus"""
+    path = str(tmp_path_factory.mktemp("corpus") / "SDK")
+    generate_dumper7(path, classes=400, members=12)
+    return path
+
+
+@pytest.fixture(scope="session")
+def sdk_json(tmp_path_factory, sdk_dir) -> str:
+    """Path of the compact v1 sdk_data.json convert_sdk.py makes of sdk_dir"""
+    output_dir = str(tmp_path_factory.mktemp("data"))
+    converter = FortniteSDKConverter()
+    converter.convert_sdk_directory(sdk_dir)
+    converter.save_to_json(output_dir, compact=True)
+    return os.path.join(output_dir, "sdk_data.json")
+
+
+@pytest.fixture(scope="session")
+def sdk_classes(sdk_json):
+    with open(sdk_json, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+@pytest.fixture
+def next_release(sdk_classes):
+    """
+    A copy of sdk_classes with one change of each kind the diff reports
+
+    First class resized and reparented, its first member moved, resized and
+    retyped, its last member removed and a member added; second class removed;
+    a new class appended.
+    """
+    classes = json.loads(json.dumps(sdk_classes))
+    changed = next(record for record in classes if len(record["M"]) >= 3)
+    changed["S"] += 8
+    changed["P"] = "UReparented"
+    first = changed["M"][0]
+    first["O"] = f"0x{int(first['O'], 16) + 8:04X}"
+    first["S"] = "0x0010"
+    first["T"] = "FRetyped"
+    changed["M"].pop()
+    changed["M"].append({"N": "AddedMember", "T": "int32", "O": "0x0F00", "S": "0x0004"})
+    removed = next(record for record in classes if record is not changed)
+    classes.remove(removed)
+    classes.append({"N": "UAddedClass", "P": "UObject", "S": 16, "T": "class",
+                    "M": [{"N": "Value", "T": "int32", "O": "0x0008", "S": "0x0004"}]})
+    return classes
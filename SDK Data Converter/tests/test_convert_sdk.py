@@ -0,0 +1,116 @@
+"""convert_sdk.py parsing, and the modes that must all produce the same sdk_data.json"""
+
+import os
+import shutil
+
+import convert_sdk
+from bench_members import build_class_body, parse_members_cascade
+
+from convert_sdk import FortniteSDKConverter
+
+
+def _convert(output_dir, sdk_dir, **kwargs) -> bytes:
+    converter = FortniteSDKConverter()
+    converter.convert_sdk_directory(sdk_dir, **kwargs)
+    converter.save_to_json(str(output_dir), compact=True)
+    with open(os.path.join(str(output_dir), "sdk_data.json"), 'rb') as f:
+        return f.read()
+
+
+def _read(path) -> bytes:
+    with open(path, 'rb') as f:
+        return f.read()
+
+
+def test_member_matcher_matches_the_regex_cascade():
+    converter = FortniteSDKConverter()
+    for seed in range(5):
+        body = build_class_body(2000, seed=seed)
+        assert [member.to_dict() for member in converter.parse_members_dumper7(body)] == \
+            parse_members_cascade(converter, body)
+
+
+def test_size_index_priority():
+    content = "\n".join([
+        "AFirst Thing; ASecond // 0x0040",
+        "// 0x0010 (0x0030) AFirst",
+        "// 0x0020 (0x0030) AFirst",
+        "static_assert(sizeof(AFirst) == 0x000050);",
+        "static_assert(sizeof(AThird) == 0x000060);",
+        "static_assert(sizeof(AThird) == 0x000070);",
+        "static_assert(sizeof(ASecond) == 0x000080);",
+    ])
+    converter = FortniteSDKConverter()
+    size_index = converter.build_size_index(content, ["AFirst", "ASecond", "AThird", "AThirdBig"])
+    # Size comment before the name, then the name before a comment, then sizeof; first occurrence wins
+    assert size_index == {"afirst": 0x10, "asecond": 0x40, "athird": 0x60}
+    assert converter.calculate_class_size(content, "AThird", []) == 0x60
+    assert converter.calculate_class_size(content, "AThirdBig", []) == 0
+
+
+def test_worker_processes_match_serial(tmp_path, sdk_dir, sdk_json):
+    assert _convert(tmp_path, sdk_dir, jobs=2) == _read(sdk_json)
+
+
+def _headers(sdk_dir):
+    return sorted(name for name in os.listdir(sdk_dir) if name.endswith(".h"))
+
+
+def test_incremental_cache_reuses_unchanged_headers(tmp_path, sdk_dir, sdk_json):
+    work = tmp_path / "SDK"
+    shutil.copytree(sdk_dir, work)
+    cache = str(tmp_path / "sdk_cache.json")
+    assert _convert(tmp_path / "first", str(work), cache_path=cache) == _read(sdk_json)
+
+    converter = FortniteSDKConverter()
+    converter.convert_sdk_directory(str(work), cache_path=cache)
+    assert converter.metrics.counters["files_cached"] == len(_headers(work))
+
+    edited = work / _headers(work)[0]
+    edited.write_text(edited.read_text() + "\nclass UIncrementalAdded : public UObject\n{\npublic:\n"
+                      "\tint32 Value; // 0x0028(0x0004)\n};\n")
+    converter = FortniteSDKConverter()
+    converter.convert_sdk_directory(str(work), cache_path=cache)
+    assert converter.metrics.counters["files_cached"] == len(_headers(work)) - 1
+    assert "UIncrementalAdded" in {record.name for record in converter.classes}
+    assert _convert(tmp_path / "cached", str(work), cache_path=cache) == _convert(tmp_path / "fresh", str(work))
+
+
+def test_streaming_matches_in_memory(tmp_path, sdk_dir, sdk_json):
+    for jobs in (1, 2):
+        output_dir = str(tmp_path / f"stream{jobs}")
+        assert FortniteSDKConverter().convert_sdk_streaming(sdk_dir, output_dir, jobs=jobs, compact=True)
+        assert _read(os.path.join(output_dir, "sdk_data.json")) == _read(sdk_json)
+
+
+def test_streaming_v2_matches_in_memory_v2(tmp_path, sdk_dir):
+    converter = FortniteSDKConverter()
+    converter.convert_sdk_directory(sdk_dir)
+    converter.save_to_json(str(tmp_path / "memory"), schema=2)
+    assert FortniteSDKConverter().convert_sdk_streaming(sdk_dir, str(tmp_path / "stream"), schema=2)
+    assert _read(tmp_path / "stream" / "sdk_data.json") == _read(tmp_path / "memory" / "sdk_data.json")
+
+
+def test_watch_rewrites_changed_and_removed_headers(tmp_path, sdk_dir, monkeypatch):
+    work = tmp_path / "SDK"
+    shutil.copytree(sdk_dir, work)
+    cache = str(tmp_path / "sdk_cache.json")
+    headers = _headers(work)
+
+    def edit(seconds):
+        # Stands in for the poll interval: the headers change while "sleeping"
+        edited = work / headers[0]
+        edited.write_text(edited.read_text() + "\nclass UWatchAdded : public UObject\n{\npublic:\n"
+                          "\tint32 Value; // 0x0028(0x0004)\n};\n")
+        (work / headers[-1]).unlink()
+
+    monkeypatch.setattr(convert_sdk.time, "sleep", edit)
+    converter = FortniteSDKConverter()
+    converter.watch_sdk_directory(str(work), str(tmp_path / "watched"), cache_path=cache, compact=True, max_updates=1)
+    assert converter.metrics.counters["watch_updates"] == 1
+    assert _read(tmp_path / "watched" / "sdk_data.json") == _convert(tmp_path / "fresh", str(work))
+
+    # The watch kept the cache current, so a later run reparses nothing
+    converter = FortniteSDKConverter()
+    converter.convert_sdk_directory(str(work), cache_path=cache)
+    assert converter.metrics.counters["files_cached"] == len(headers) - 1
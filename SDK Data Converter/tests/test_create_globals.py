@@ -0,0 +1,69 @@
+"""create_globals.py --from-sdk offset resolution"""
+
+import json
+
+import pytest
+
+from create_globals import GLOBAL_BASES, OffsetIndex, regenerate_from_sdk, resolve_offsets
+from sdk_binary import write_binary
+from sdk_schema import encode_v2
+
+
+def _class(name, parent, **members):
+    return {"N": name, "P": parent, "S": 0, "T": "class",
+            "M": [{"N": member, "T": "int32", "O": offset, "S": "0x4"} for member, offset in members.items()]}
+
+
+CLASSES = [
+    _class("UObject", "", Class="0x10", Name="0x18", Outer="0x20"),
+    _class("AActor", "UObject", RootComponent="0x1b0"),
+    _class("APawn", "AActor", PawnPrivate="0x328"),
+    _class("AFortPawn", "APawn", Mesh="0x330", CurrentWeapon="0x990"),
+    _class("AFortPawn", "APawn", Mesh="0x999"),
+    _class("ALoopA", "ALoopB"),
+    _class("ALoopB", "ALoopA"),
+]
+
+
+@pytest.fixture(params=["v1", "v2", "bin"])
+def sdk_file(request, tmp_path):
+    if request.param == "bin":
+        path = tmp_path / "sdk_data.bin"
+        write_binary(CLASSES, str(path))
+    else:
+        path = tmp_path / "sdk_data.json"
+        path.write_text(json.dumps(CLASSES if request.param == "v1" else encode_v2(CLASSES)))
+    return str(path)
+
+
+def test_resolves_through_parents_in_every_format(sdk_file):
+    index = OffsetIndex.load(sdk_file, ["AFortPawn", "ALoopA", "UMissing"])
+    assert index.resolve("AFortPawn", "Mesh") == (0x330, "AFortPawn")
+    assert index.resolve("AFortPawn", "RootComponent") == (0x1B0, "AActor")
+    assert index.resolve("AFortPawn", "Outer") == (0x20, "UObject")
+    assert index.resolve("AFortPawn", "Nothing") is None
+    assert index.resolve("ALoopA", "Nothing") is None
+    assert index.resolve("UMissing", "Class") is None
+
+    resolved, missing = resolve_offsets(index, {"AFortPawn": ["CurrentWeapon", "Name", "Gone"]})
+    assert resolved == {"AFortPawn": {"CurrentWeapon": "0x990", "Name": "0x18"}}
+    assert missing == ["AFortPawn.Gone"]
+
+
+def test_regenerate_keeps_what_the_sdk_lacks(tmp_path, sdk_file):
+    globals_file = tmp_path / "globals.json"
+    globals_file.write_text(json.dumps({
+        "bases": {"Custom": "0x1"},
+        "offsets": {"AFortPawn": {"Mesh": "0x1", "Extra": "0x2"}, "UCustom": {"Value": "0x3"}},
+    }))
+    data = regenerate_from_sdk(sdk_file, str(globals_file))
+    with open(globals_file, 'r', encoding='utf-8') as f:
+        assert json.load(f) == data
+
+    assert data["bases"] == {"Custom": "0x1", **GLOBAL_BASES}
+    offsets = data["offsets"]
+    assert offsets["AFortPawn"]["Mesh"] == "0x330"
+    assert offsets["AFortPawn"]["CurrentWeapon"] == "0x990"
+    assert offsets["AFortPawn"]["Extra"] == "0x2"
+    assert offsets["UCustom"] == {"Value": "0x3"}
+    assert offsets["UObject"] == {"Class": "0x10", "Name": "0x18", "Outer": "0x20"}
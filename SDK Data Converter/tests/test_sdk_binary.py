@@ -0,0 +1,83 @@
+"""Round trips of sdk_data.bin against the converter's JSON output"""
+
+import pytest
+
+from sdk_binary import SDKBinaryReader, encode_sdk, write_binary
+
+
+def test_every_class_by_index(tmp_path, sdk_classes):
+    path = str(tmp_path / "sdk_data.bin")
+    write_binary(sdk_classes, path)
+    with SDKBinaryReader(path) as reader:
+        assert len(reader) == len(sdk_classes)
+        assert reader.member_count == sum(len(c["M"]) for c in sdk_classes)
+        for index, record in enumerate(sdk_classes):
+            assert reader.get_class(index) == record
+
+
+def test_every_class_by_name(tmp_path, sdk_classes):
+    path = str(tmp_path / "sdk_data.bin")
+    write_binary(sdk_classes, path)
+    first = {}
+    for record in sdk_classes:
+        first.setdefault(record["N"], record)
+    with SDKBinaryReader(path) as reader:
+        for name, record in first.items():
+            assert reader.find_class(name) == record
+        assert reader.find_class("NoSuchClass") is None
+
+
+def test_iter_classes_matches_json(tmp_path, sdk_classes):
+    path = str(tmp_path / "sdk_data.bin")
+    write_binary(sdk_classes, path)
+    with SDKBinaryReader(path) as reader:
+        assert list(reader.iter_classes()) == sdk_classes
+
+
+def test_hex_padding_and_case_survive(tmp_path):
+    classes = [
+        {"N": "FPadded", "P": "", "S": 8, "T": "struct",
+         "M": [{"N": "Lower", "T": "int32", "O": "0x01b0", "S": "0x4"},
+               {"N": "Upper", "T": "uint8", "O": "0x0001B4", "S": "0x01"}]},
+        {"N": "FEmpty", "P": "FPadded", "S": 0, "T": "class", "M": []},
+    ]
+    path = str(tmp_path / "sdk_data.bin")
+    write_binary(classes, path)
+    with SDKBinaryReader(path) as reader:
+        assert list(reader.iter_classes()) == classes
+
+
+def test_rejects_what_it_cannot_reproduce(tmp_path):
+    with pytest.raises(ValueError):
+        encode_sdk([{"N": "A", "P": "", "S": 0, "T": "class",
+                     "M": [{"N": "x", "T": "int32", "O": "0x1aB", "S": "0x4"}]}])
+
+    empty = tmp_path / "empty.bin"
+    empty.write_bytes(b"")
+    with pytest.raises(ValueError):
+        SDKBinaryReader(str(empty))
+
+    junk = tmp_path / "junk.bin"
+    junk.write_bytes(b"JUNK" + bytes(64))
+    with pytest.raises(ValueError):
+        SDKBinaryReader(str(junk))
+
+
+def test_index_out_of_range(tmp_path, sdk_classes):
+    path = str(tmp_path / "sdk_data.bin")
+    write_binary(sdk_classes, path)
+    with SDKBinaryReader(path) as reader:
+        with pytest.raises(IndexError):
+            reader.get_class(len(sdk_classes))
+
+
+def test_duplicate_names_resolve_to_the_first(tmp_path):
+    classes = [
+        {"N": "UDup", "P": "", "S": 4, "T": "class", "M": [{"N": "A", "T": "int32", "O": "0x0", "S": "0x4"}]},
+        {"N": "UDup", "P": "", "S": 8, "T": "class", "M": []},
+    ]
+    path = str(tmp_path / "sdk_data.bin")
+    write_binary(classes, path)
+    with SDKBinaryReader(path) as reader:
+        assert reader.find_class("UDup") == classes[0]
+        assert reader.get_class(1) == classes[1]
@@ -0,0 +1,40 @@
+"""The synthetic corpus is deterministic and parses into what it reports"""
+
+import filecmp
+import logging
+import os
+
+from bench_converters import load_hpp_module
+from convert_sdk import FortniteSDKConverter
+from sdk_corpus import generate_dumper7, generate_hpp
+
+
+def test_dumper7_is_reproducible(tmp_path):
+    first = generate_dumper7(str(tmp_path / "a"), classes=120, members=6)
+    second = generate_dumper7(str(tmp_path / "b"), classes=120, members=6)
+    assert first == second
+    comparison = filecmp.dircmp(tmp_path / "a", tmp_path / "b")
+    assert not comparison.diff_files and not comparison.left_only and not comparison.right_only
+    assert generate_dumper7(str(tmp_path / "c"), classes=120, members=6, seed=2) != first
+
+
+def test_dumper7_members_are_found(tmp_path):
+    counts = generate_dumper7(str(tmp_path), classes=120, members=6)
+    assert counts["files"] == len([name for name in os.listdir(tmp_path) if name.endswith(".h")])
+    assert counts["bytes"] == sum(os.path.getsize(tmp_path / name) for name in os.listdir(tmp_path))
+
+    converter = FortniteSDKConverter()
+    converter.convert_sdk_directory(str(tmp_path))
+    # Classes without a base are not picked up, so the converter sees a subset
+    assert 0 < len(converter.classes) <= counts["classes"]
+    assert 0 < sum(len(record.members) for record in converter.classes) <= counts["members"]
+
+
+def test_hpp_members_are_found(tmp_path):
+    path = tmp_path / "dump.hpp"
+    counts = generate_hpp(str(path), classes=150, members=6)
+    assert counts["bytes"] == os.path.getsize(path)
+
+    converter = load_hpp_module().HPPToJSONConverter(logging.getLogger("HPPConverterTest"))
+    structures = converter.parse_hpp_file(path)
+    assert sum(len(structure.members) for structure in structures) == counts["members"]
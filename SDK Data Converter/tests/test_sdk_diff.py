@@ -0,0 +1,35 @@
+"""sdk_diff.py change records between two releases"""
+
+import json
+
+from sdk_diff import diff_sdk, write_delta
+
+
+def test_identical_dumps_have_no_changes(sdk_classes):
+    assert list(diff_sdk(sdk_classes, sdk_classes)) == []
+
+
+def test_every_kind_of_change(sdk_classes, next_release):
+    changes = list(diff_sdk(sdk_classes, next_release))
+    kinds = sorted(change["change"] for change in changes)
+    assert kinds == sorted([
+        "class_resized", "class_reparented", "member_moved", "member_resized", "member_retyped",
+        "member_added", "member_removed", "class_removed", "class_added",
+    ])
+    added = next(change for change in changes if change["change"] == "class_added")
+    assert added["class"] == "UAddedClass" and added["members"] == 1
+
+
+def test_zero_padding_is_not_a_move(sdk_classes):
+    unpadded = [{**record, "M": [{**member, "O": f"0x{int(member['O'], 16):X}", "S": f"0x{int(member['S'], 16):X}"}
+                                 for member in record["M"]]}
+                for record in sdk_classes]
+    assert list(diff_sdk(sdk_classes, unpadded)) == []
+
+
+def test_write_delta_counts(tmp_path, sdk_classes, next_release):
+    path = str(tmp_path / "delta.json")
+    counts = write_delta(sdk_classes, next_release, path, compact=True)
+    with open(path, 'r', encoding='utf-8') as f:
+        written = json.load(f)
+    assert len(written) == sum(counts.values()) == 9
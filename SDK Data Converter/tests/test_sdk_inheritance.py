@@ -0,0 +1,78 @@
+"""inheritance.json resolution, ordering and flattened layouts"""
+
+import pytest
+
+from sdk_inheritance import InheritanceIndex, build_inheritance, write_inheritance
+
+
+def _class(name, parent, *members):
+    return {"N": name, "P": parent, "S": 0, "T": "class",
+            "M": [{"N": member, "T": "int32", "O": "0x0", "S": "0x4"} for member in members]}
+
+
+HIERARCHY = [
+    _class("AActor", "UObject", "RootComponent"),
+    _class("UObject", "", "ClassPrivate"),
+    _class("APawn", "AActor", "Controller"),
+    _class("AOrphan", "UMissing"),
+    _class("ALoopA", "ALoopB"),
+    _class("ALoopB", "ALoopA"),
+    _class("ABelowLoop", "ALoopA"),
+]
+
+
+@pytest.fixture
+def hierarchy():
+    return InheritanceIndex(build_inheritance(HIERARCHY, flatten=True))
+
+
+def test_parents_come_first(sdk_classes):
+    data = build_inheritance(sdk_classes)
+    order = data["classes"]
+    assert sorted(order) == sorted({record["N"] for record in sdk_classes})
+    for position in range(data["ordered"]):
+        assert data["parents"][position] < position
+    for position, children in enumerate(data["children"]):
+        for child in children:
+            assert data["parents"][child] == position
+
+
+def test_flattened_layouts_match_a_parent_walk(tmp_path, sdk_classes):
+    path = str(tmp_path / "inheritance.json")
+    write_inheritance(sdk_classes, path, flatten=True)
+    index = InheritanceIndex.load(path)
+    records = {}
+    for record in sdk_classes:
+        records.setdefault(record["N"], record)
+
+    for name, members in index.flattened.items():
+        expected = []
+        for owner in reversed([name] + index.ancestors(name)):
+            expected += [dict(member, D=owner) for member in records[owner]["M"]]
+        assert members == expected
+
+
+def test_missing_parents_and_cycles(hierarchy):
+    assert hierarchy.missing_parents == {"UMissing": ["AOrphan"]}
+    assert [sorted(cycle) for cycle in hierarchy.cycles] == [["ALoopA", "ALoopB"]]
+    assert hierarchy.classes[:4] == ["UObject", "AActor", "APawn", "AOrphan"]
+    assert set(hierarchy.classes[4:]) == {"ALoopA", "ALoopB", "ABelowLoop"}
+    # Only the ordered classes are flattened
+    assert set(hierarchy.flattened) == {"UObject", "AActor", "APawn", "AOrphan"}
+
+
+def test_queries(hierarchy):
+    assert hierarchy.parent("APawn") == "AActor"
+    assert hierarchy.parent("UObject") is None
+    assert hierarchy.parent("AOrphan") is None
+    assert hierarchy.ancestors("APawn") == ["AActor", "UObject"]
+    assert hierarchy.ancestors("ABelowLoop") == ["ALoopA", "ALoopB"]
+    assert list(hierarchy.descendants("UObject")) == ["AActor", "APawn"]
+    assert set(hierarchy.descendants("ALoopA")) == {"ALoopB", "ABelowLoop"}
+    assert list(hierarchy.descendants("NoSuchClass")) == []
+    assert [member["D"] for member in hierarchy.flattened["APawn"]] == ["UObject", "AActor", "APawn"]
+
+
+def test_rejects_other_versions():
+    with pytest.raises(ValueError):
+        InheritanceIndex({"version": 0})
@@ -0,0 +1,106 @@
+"""sdk_lookup.idx lookups against the converter's JSON output"""
+
+import pytest
+
+from sdk_lookup import LookupIndex, write_lookup_index
+
+
+HIERARCHY = [
+    {"N": "UObject", "P": "", "S": 0x28, "T": "class",
+     "M": [{"N": "ClassPrivate", "T": "UClass*", "O": "0x10", "S": "0x8"},
+           {"N": "NamePrivate", "T": "FName", "O": "0x18", "S": "0x8"}]},
+    {"N": "AActor", "P": "UObject", "S": 0x40, "T": "class",
+     "M": [{"N": "RootComponent", "T": "USceneComponent*", "O": "0x28", "S": "0x8"},
+           {"N": "bHidden", "T": "uint8", "O": "0x30", "S": "0x1"}]},
+    {"N": "APawn", "P": "AActor", "S": 0x50, "T": "class",
+     "M": [{"N": "Controller", "T": "AController*", "O": "0x40", "S": "0x8"},
+           {"N": "RootComponent", "T": "UCapsuleComponent*", "O": "0x48", "S": "0x8"}]},
+    {"N": "AOrphan", "P": "AMissing", "S": 0x8, "T": "class",
+     "M": [{"N": "Flags", "T": "int32", "O": "0x0", "S": "0x4"}]},
+    {"N": "APawn", "P": "", "S": 0x4, "T": "class", "M": []},
+]
+
+
+@pytest.fixture
+def hierarchy(tmp_path):
+    path = str(tmp_path / "sdk_lookup.idx")
+    write_lookup_index(HIERARCHY, path)
+    with LookupIndex(path) as index:
+        yield index
+
+
+@pytest.fixture(scope="module")
+def corpus_index(tmp_path_factory, sdk_classes):
+    path = str(tmp_path_factory.mktemp("lookup") / "sdk_lookup.idx")
+    write_lookup_index(sdk_classes, path)
+    with LookupIndex(path) as index:
+        yield index
+
+
+def _first_by_name(classes):
+    first = {}
+    for record in classes:
+        first.setdefault(record["N"], record)
+    return first
+
+
+def test_every_class_and_member_is_found(corpus_index, sdk_classes):
+    first = _first_by_name(sdk_classes)
+    assert len(corpus_index) == len(first)
+    for name, record in first.items():
+        assert corpus_index.class_info(name) == {"class": name, "parent": record["P"],
+                                                 "size": record["S"], "members": len(record["M"])}
+        for member in record["M"]:
+            result = corpus_index.find_member(name, member["N"])
+            assert (result["declared_in"], result["name"]) == (name, member["N"])
+            assert (result["type"], result["offset"], result["size"]) in {
+                (m["T"], int(m["O"], 16), int(m["S"], 16)) for m in record["M"] if m["N"] == member["N"]}
+    assert corpus_index.class_info("NoSuchClass") is None
+    assert corpus_index.find_member("NoSuchClass", "Anything") is None
+
+
+def test_every_member_byte_resolves(corpus_index, sdk_classes):
+    for name, record in _first_by_name(sdk_classes).items():
+        for member in record["M"]:
+            start, size = int(member["O"], 16), int(member["S"], 16)
+            for offset in {start, start + max(size, 1) - 1}:
+                result = corpus_index.member_at(name, offset)
+                assert result is not None
+                assert result["offset"] <= offset < result["offset"] + max(result["size"], 1)
+                assert result["delta"] == offset - result["offset"]
+
+
+def test_members_are_inherited_nearest_first(hierarchy):
+    assert hierarchy.find_member("APawn", "NamePrivate")["declared_in"] == "UObject"
+    assert hierarchy.find_member("APawn", "bHidden")["declared_in"] == "AActor"
+    shadowed = hierarchy.find_member("APawn", "RootComponent")
+    assert (shadowed["declared_in"], shadowed["type"], shadowed["offset"]) == ("APawn", "UCapsuleComponent*", 0x48)
+    assert hierarchy.find_member("AActor", "RootComponent")["type"] == "USceneComponent*"
+    assert hierarchy.find_member("AActor", "Controller") is None
+    # A parent missing from the dump ends the walk
+    assert hierarchy.find_member("AOrphan", "ClassPrivate") is None
+
+
+def test_member_at_reports_the_delta(hierarchy):
+    result = hierarchy.member_at("APawn", 0x1C)
+    assert (result["class"], result["declared_in"], result["name"], result["delta"]) == \
+        ("APawn", "UObject", "NamePrivate", 4)
+    assert hierarchy.member_at("APawn", 0x31) is None
+    assert hierarchy.member_at("APawn", 0x4F)["name"] == "RootComponent"
+    assert hierarchy.member_at("APawn", 0x50) is None
+
+
+def test_duplicate_names_resolve_to_the_first(hierarchy):
+    assert hierarchy.class_info("APawn") == {"class": "APawn", "parent": "AActor", "size": 0x50, "members": 2}
+
+
+def test_rejects_other_files(tmp_path):
+    empty = tmp_path / "empty.idx"
+    empty.write_bytes(b"")
+    with pytest.raises(ValueError):
+        LookupIndex(str(empty))
+
+    junk = tmp_path / "junk.idx"
+    junk.write_bytes(b"JUNK" + bytes(64))
+    with pytest.raises(ValueError):
+        LookupIndex(str(junk))
@@ -0,0 +1,62 @@
+"""Metrics collection, merging and the --profile / -v reporting switches"""
+
+import argparse
+import json
+
+from sdk_metrics import Metrics, add_profile_argument, run_profiled, wants_breakdown
+
+
+def _parse(*argv):
+    parser = argparse.ArgumentParser()
+    add_profile_argument(parser, "test_profile")
+    return parser.parse_args(argv)
+
+
+def test_breakdown_only_when_asked():
+    assert not wants_breakdown(_parse())
+    assert wants_breakdown(_parse("-v"))
+    assert wants_breakdown(_parse("--verbose"))
+    assert wants_breakdown(_parse("--profile"))
+    assert _parse("--profile").profile == "test_profile"
+
+
+def test_summary_is_one_line_by_default():
+    metrics = Metrics()
+    with metrics.phase("parse"):
+        metrics.count("files", 3)
+    metrics.record("files", "Engine_classes.h", 0.5)
+
+    lines = []
+    metrics.log_summary(lines.append)
+    assert len(lines) == 1 and lines[0].startswith("⏱️ ") and "total" in lines[0]
+
+    lines = []
+    metrics.log_summary(lines.append, detailed=True)
+    text = "\n".join(lines)
+    assert "parse" in text and "files 3" in text and "Engine_classes.h" in text
+
+
+def test_merge_keeps_the_slowest():
+    main = Metrics(top_n=2)
+    main.add_time("parse", 1.0)
+    main.record("files", "a.h", 0.1)
+    worker = Metrics(top_n=2)
+    worker.add_time("parse", 2.0)
+    worker.count("files", 5)
+    worker.record("files", "b.h", 0.3)
+    worker.record("files", "c.h", 0.2)
+
+    main.merge(worker.snapshot())
+    assert main.phases == {"parse": 3.0}
+    assert main.counters == {"files": 5}
+    assert main.slowest("files") == [(0.3, "b.h"), (0.2, "c.h")]
+
+
+def test_run_profiled_writes_the_report(tmp_path):
+    metrics = Metrics()
+    prefix = str(tmp_path / "run")
+    assert run_profiled(lambda: metrics.count("calls") or 42, prefix, metrics, log=lambda message: None) == 42
+    assert (tmp_path / "run.pstats").exists()
+    with open(tmp_path / "run_metrics.json", 'r', encoding='utf-8') as f:
+        assert json.load(f)["counters"] == {"calls": 1}
+    assert run_profiled(lambda: "plain", None, metrics) == "plain"
@@ -0,0 +1,62 @@
+"""Class-level patches reproduce the new sdk_data.json byte for byte"""
+
+import argparse
+import json
+import os
+
+import pytest
+
+from sdk_outputs import add_output_arguments, write_extra_outputs
+from sdk_patch import PATCH_DIR, apply_patch_bytes, make_patch, serialize, write_patch
+from sdk_schema import add_schema_argument, encode_v2
+
+
+@pytest.mark.parametrize("indent", [None, 2])
+def test_patch_reproduces_new_file(sdk_classes, next_release, indent):
+    fmt = {"indent": indent, "ensure_ascii": True}
+    old_data = serialize(sdk_classes, fmt)
+    new_data = serialize(next_release, fmt)
+    patch = make_patch(old_data, new_data)
+    assert apply_patch_bytes(old_data, patch) == new_data
+    # Only the touched classes travel in the patch
+    assert len(patch["upserts"]) == 2
+    assert len(patch["deletes"]) == 1
+
+
+def test_patch_for_reordered_classes(sdk_classes):
+    fmt = {"indent": None, "ensure_ascii": True}
+    old_data = serialize(sdk_classes, fmt)
+    new_data = serialize(sdk_classes[1:] + sdk_classes[:1], fmt)
+    assert apply_patch_bytes(old_data, make_patch(old_data, new_data)) == new_data
+
+
+def test_patch_refuses_other_bases(sdk_classes, next_release):
+    fmt = {"indent": None, "ensure_ascii": True}
+    patch = make_patch(serialize(sdk_classes, fmt), serialize(next_release, fmt))
+    with pytest.raises(ValueError):
+        apply_patch_bytes(serialize(next_release, fmt), patch)
+
+
+def test_only_converter_output_can_be_patched(sdk_classes):
+    old_data = serialize(sdk_classes, {"indent": None, "ensure_ascii": True})
+    with pytest.raises(ValueError):
+        make_patch(old_data, json.dumps(sdk_classes, indent=4).encode('utf-8'))
+
+
+def test_v2_old_file_is_not_a_patch_base(tmp_path, sdk_classes, next_release):
+    old_path = tmp_path / "old.json"
+    old_path.write_text(json.dumps(encode_v2(sdk_classes)))
+    new_path = tmp_path / "sdk_data.json"
+    new_path.write_bytes(serialize(next_release, {"indent": None, "ensure_ascii": True}))
+    with pytest.raises(ValueError, match="schema v2"):
+        write_patch(str(old_path), str(new_path), str(tmp_path / PATCH_DIR))
+
+    # A v1 conversion given a v2 --patch-from skips the patch instead of failing
+    parser = argparse.ArgumentParser()
+    add_schema_argument(parser)
+    add_output_arguments(parser)
+    args = parser.parse_args(["--patch-from", str(old_path)])
+    messages = []
+    write_extra_outputs(next_release, str(tmp_path), args, log=messages.append)
+    assert any("skipping --patch-from" in message for message in messages)
+    assert not os.path.exists(tmp_path / PATCH_DIR)
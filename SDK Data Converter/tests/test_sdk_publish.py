@@ -0,0 +1,52 @@
+"""Content-hashed, precompressed copies and data_manifest.json"""
+
+import gzip
+import json
+import os
+
+import sdk_publish
+from sdk_publish import DATA_MANIFEST_FILE, content_hash, publish_artifacts
+
+
+def _publish(data_dir):
+    return publish_artifacts(str(data_dir), log=lambda message: None)
+
+
+def _hashed_files(data_dir, stem):
+    return sorted(name for name in os.listdir(data_dir) if name.startswith(f"{stem}.") and name != f"{stem}.json")
+
+
+def test_copies_match_the_source(tmp_path):
+    data = json.dumps([{"N": "UObject"}] * 50).encode()
+    (tmp_path / "sdk_data.json").write_bytes(data)
+    (tmp_path / "globals.json").write_bytes(b"{}")
+
+    manifest = _publish(tmp_path)
+    assert set(manifest["files"]) == {"sdk_data.json", "globals.json"}
+    entry = manifest["files"]["sdk_data.json"]
+    assert entry["hash"] == content_hash(data)
+    assert entry["bytes"] == len(data)
+    assert (tmp_path / entry["path"]).read_bytes() == data
+    assert gzip.decompress((tmp_path / entry["gzip"]["path"]).read_bytes()) == data
+    assert ("br" in entry) == (sdk_publish.brotli is not None)
+    with open(tmp_path / DATA_MANIFEST_FILE, 'r', encoding='utf-8') as f:
+        assert json.load(f) == manifest
+
+
+def test_unchanged_files_are_not_rewritten(tmp_path):
+    (tmp_path / "sdk_data.json").write_bytes(b"[]")
+    entry = _publish(tmp_path)["files"]["sdk_data.json"]
+    gzip_path = tmp_path / entry["gzip"]["path"]
+    os.utime(gzip_path, (0, 0))
+    assert _publish(tmp_path)["files"]["sdk_data.json"] == entry
+    assert os.path.getmtime(gzip_path) == 0
+
+
+def test_keeps_one_previous_generation(tmp_path):
+    source = tmp_path / "sdk_data.json"
+    hashes = []
+    for generation in range(3):
+        source.write_bytes(json.dumps([generation]).encode())
+        hashes.append(_publish(tmp_path)["files"]["sdk_data.json"]["hash"])
+        kept = {name.split(".")[1] for name in _hashed_files(tmp_path, "sdk_data")}
+        assert kept == set(hashes[-2:])
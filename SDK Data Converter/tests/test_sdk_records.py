@@ -0,0 +1,36 @@
+"""Slot records round-trip the sdk_data.json and cache layouts byte for byte"""
+
+import pickle
+
+from sdk_records import ClassRecord, MemberRecord, parse_hex
+
+
+def test_hex_spelling_round_trips():
+    for text in ("0x0", "0x0010", "0x1b0", "0x1B0", "0x00001c8", "0xABCDEF01"):
+        member = MemberRecord.from_hex("Value", "int32", text, text)
+        assert member.to_dict()["O"] == member.to_dict()["S"] == text
+    # Mixed case comes back uppercase; the prefix is optional
+    assert MemberRecord.from_hex("Value", "int32", "0x1aB", "10").to_row()[2:] == ["0x1AB", "0x10"]
+    assert parse_hex("0X20")[0] == 0x20
+
+
+def test_corpus_round_trips(sdk_classes):
+    records = [ClassRecord.from_dict(record) for record in sdk_classes]
+    assert [record.to_dict() for record in records] == sdk_classes
+    assert [ClassRecord.from_row(record.to_row()) for record in records] == records
+
+
+def test_pickles_for_the_process_pool(sdk_classes):
+    records = [ClassRecord.from_dict(record) for record in sdk_classes[:50]]
+    restored = pickle.loads(pickle.dumps(records))
+    assert restored == records
+    assert [record.to_dict() for record in restored] == sdk_classes[:50]
+
+
+def test_equality_and_end():
+    member = MemberRecord.from_hex("Mesh", "USkeletalMeshComponent*", "0x330", "0x8")
+    assert member.end == 0x338
+    assert member == MemberRecord("Mesh", "USkeletalMeshComponent*", 0x330, 8, "0x%03X", "0x%X")
+    assert member != MemberRecord("Mesh", "USkeletalMeshComponent*", 0x330, 8, "0x%04X", "0x%X")
+    assert ClassRecord("AFortPawn", "APawn", 0x338, "class", [member]) != \
+        ClassRecord("AFortPawn", "APawn", 0x338, "struct", [member])
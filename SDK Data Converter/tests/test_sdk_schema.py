@@ -0,0 +1,56 @@
+"""Columnar v2 sdk_data.json: encoding, streaming, validation and decoding back to v1"""
+
+import json
+
+from convert_sdk import FortniteSDKConverter
+from sdk_schema import (SCHEMA_V2, V2Reader, decode_v2, encode_v2, load_classes, open_sdk_writer,
+                        validate_v2)
+
+
+def _numeric(classes):
+    """v1 classes with hex offsets and sizes as integers; v2 doesn't keep zero padding"""
+    return [
+        {**record, "M": [{**member, "O": int(member["O"], 16), "S": int(member["S"], 16)} for member in record["M"]]}
+        for record in classes
+    ]
+
+
+def test_encode_decode_round_trip(sdk_classes):
+    document = encode_v2(sdk_classes)
+    assert validate_v2(document) == []
+    assert _numeric(decode_v2(document)) == _numeric(sdk_classes)
+
+
+def test_streaming_writer_matches_encode(tmp_path, sdk_classes):
+    path = str(tmp_path / "sdk_data.json")
+    with open_sdk_writer(path, SCHEMA_V2, indent=None) as writer:
+        writer.write_all(sdk_classes)
+    with open(path, 'r', encoding='utf-8') as f:
+        assert json.load(f) == encode_v2(sdk_classes)
+
+
+def test_converter_writes_v2(tmp_path, sdk_dir, sdk_classes):
+    converter = FortniteSDKConverter()
+    converter.convert_sdk_directory(sdk_dir)
+    converter.save_to_json(str(tmp_path), schema=SCHEMA_V2)
+    assert _numeric(load_classes(str(tmp_path / "sdk_data.json"))) == _numeric(sdk_classes)
+
+
+def test_reader_get_returns_the_first_class_with_a_name():
+    classes = [
+        {"N": "UDup", "P": "", "S": 4, "T": "class", "M": [{"N": "A", "T": "int32", "O": "0x0", "S": "0x4"}]},
+        {"N": "UDup", "P": "", "S": 8, "T": "class", "M": []},
+    ]
+    reader = V2Reader(encode_v2(classes))
+    assert len(reader) == 2
+    assert reader.get("UDup") == classes[0]
+    assert reader.get("Missing") is None
+
+
+def test_validate_reports_bad_ids(sdk_classes):
+    document = encode_v2(sdk_classes[:5])
+    row = next(row for row in document["classes"] if row[4])
+    row[4][0] = len(document["names"])
+    errors = validate_v2(document)
+    assert len(errors) == 1 and "name id" in errors[0]
+    assert validate_v2([]) == ["document is not an object"]
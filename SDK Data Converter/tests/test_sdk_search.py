@@ -0,0 +1,50 @@
+"""search_index.json against the brute-force scan it replaces"""
+
+import random
+
+import pytest
+
+from sdk_search import SearchIndex, brute_force_search, write_search_index
+
+
+def _queries(classes, count=200, seed=1):
+    """Substrings of real class and member names and offsets, plus a few edge cases"""
+    rng = random.Random(seed)
+    texts = [record["N"] for record in classes]
+    texts += [member[key] for record in classes for member in record["M"] for key in ("N", "O")]
+    queries = ["a", "Ac", "0x", "0X1", "zzzz", "component", "COMPONENT", "ü"]
+    for _ in range(count):
+        text = rng.choice(texts)
+        start = rng.randrange(len(text))
+        queries.append(text[start:start + rng.randint(1, 8)])
+    return queries
+
+
+@pytest.fixture(scope="module")
+def index(tmp_path_factory, sdk_classes):
+    # Through the file, so the JSON round trip of the posting lists is covered too
+    path = str(tmp_path_factory.mktemp("search") / "search_index.json")
+    write_search_index(sdk_classes, path)
+    return SearchIndex.load(path)
+
+
+def test_matches_brute_force(index, sdk_classes):
+    for query in _queries(sdk_classes):
+        assert index.search(query) == brute_force_search(sdk_classes, query), query
+
+
+def test_limits_match_brute_force(index, sdk_classes):
+    for query in _queries(sdk_classes, count=50, seed=2):
+        for limit in (1, 3, 25):
+            assert index.search(query, limit) == brute_force_search(sdk_classes, query, limit), (query, limit)
+
+
+def test_empty_queries_and_limits(index, sdk_classes):
+    assert index.search("") == brute_force_search(sdk_classes, "") == []
+    assert index.search("a", 0) == brute_force_search(sdk_classes, "a", 0) == []
+    assert index.search("a", -1) == []
+
+
+def test_rejects_other_versions():
+    with pytest.raises(ValueError):
+        SearchIndex({"version": 0, "gram": 3, "classes": [], "entries": [], "postings": {}})
@@ -0,0 +1,86 @@
+"""sdk_server.py routes over a live server on a free port"""
+
+import http.client
+import json
+import threading
+
+import pytest
+
+from sdk_search import SearchIndex, brute_force_search
+from sdk_server import SERVER_FLAG, SDKStore, make_server
+
+
+@pytest.fixture(scope="module")
+def server(tmp_path_factory, sdk_json):
+    static = tmp_path_factory.mktemp("static")
+    (static / "index.html").write_bytes(b"<html><head><title>t</title></head><body></body></html>")
+    store = SDKStore(sdk_json)
+    httpd = make_server(store, port=0, static_dir=str(static))
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield store, httpd.server_address[1]
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def _get(port, path, headers=None):
+    connection = http.client.HTTPConnection("127.0.0.1", port, timeout=10)
+    connection.request("GET", path, headers=headers or {})
+    response = connection.getresponse()
+    body = response.read()
+    connection.close()
+    return response, body
+
+
+def test_class_and_revalidation(server, sdk_classes):
+    store, port = server
+    record = sdk_classes[0]
+    response, body = _get(port, f"/class/{record['N']}")
+    assert response.status == 200
+    assert json.loads(body) == record
+
+    response, body = _get(port, f"/class/{record['N']}", {"If-None-Match": store.etag})
+    assert response.status == 304
+    assert body == b""
+
+
+def test_offset_inside_a_member(server, sdk_classes):
+    _, port = server
+    record = next(c for c in sdk_classes if any(int(m["S"], 16) > 1 for m in c["M"]))
+    member = next(m for m in record["M"] if int(m["S"], 16) > 1)
+    inside = int(member["O"], 16) + 1
+    response, body = _get(port, f"/offset/{record['N']}/{inside:X}")
+    result = json.loads(body)
+    assert response.status == 200
+    assert result["delta"] == 1
+    assert result["member"]["O"] == member["O"]
+
+
+@pytest.mark.parametrize("limit", ["0", "-1", "x"])
+def test_search_rejects_bad_limits(server, limit):
+    _, port = server
+    response, _ = _get(port, f"/search?q=a&limit={limit}")
+    assert response.status == 400
+
+
+def test_search_limit(server):
+    _, port = server
+    response, body = _get(port, "/search?q=a&limit=3")
+    assert response.status == 200
+    assert len(json.loads(body)["results"]) == 3
+
+
+def test_search_index_honours_non_positive_limits(sdk_classes):
+    index = SearchIndex.from_classes(sdk_classes)
+    for limit in (0, -5):
+        assert index.search("a", limit=limit) == []
+        assert brute_force_search(sdk_classes, "a", limit=limit) == []
+    assert index.search("comp", limit=None) == brute_force_search(sdk_classes, "comp")
+
+
+def test_index_page_carries_the_server_flag(server):
+    _, port = server
+    for path in ("/", "/index.html"):
+        response, body = _get(port, path)
+        assert response.status == 200
+        assert SERVER_FLAG + b"</head>" in body
@@ -0,0 +1,53 @@
+"""Sharded output: every class lands in exactly one shard and stale shards go away"""
+
+import json
+import os
+
+from sdk_publish import content_hash
+from sdk_shards import MANIFEST_FILE, SHARD_DIR, remove_shards, write_shards
+
+
+def _load(output_dir):
+    with open(os.path.join(output_dir, MANIFEST_FILE), 'r', encoding='utf-8') as f:
+        manifest = json.load(f)
+    shards = []
+    for path in manifest["shards"]:
+        with open(os.path.join(output_dir, path), 'rb') as f:
+            data = f.read()
+        assert os.path.basename(path) == f"sdk_{content_hash(data)}.json"
+        shards.append(json.loads(data))
+    return manifest, shards
+
+
+def test_shards_cover_every_class_once(tmp_path, sdk_classes):
+    write_shards(sdk_classes, str(tmp_path), target_kb=16, data_hash="abc", log=lambda _: None)
+    manifest, shards = _load(str(tmp_path))
+    assert manifest["data"] == "abc"
+    assert len(shards) > 1
+
+    seen = {}
+    for index, shard in enumerate(shards):
+        for record in shard:
+            assert record["N"] not in seen
+            seen[record["N"]] = record
+            assert manifest["classes"][record["N"]] == [index, record["S"], len(record["M"]), record["P"]]
+    assert seen == {record["N"]: record for record in sdk_classes}
+
+
+def test_rewrite_keeps_one_previous_generation(tmp_path, sdk_classes):
+    generations = []
+    for skip in range(3):
+        manifest = write_shards(sdk_classes[skip:], str(tmp_path), target_kb=16, log=lambda _: None)
+        generations.append({os.path.basename(path) for path in manifest["shards"]})
+    on_disk = set(os.listdir(tmp_path / SHARD_DIR))
+    assert on_disk == generations[2] | generations[1]
+    assert generations[0] - generations[1] - generations[2]
+    assert not (generations[0] - generations[1] - generations[2]) & on_disk
+
+
+def test_remove_shards(tmp_path, sdk_classes):
+    assert not remove_shards(str(tmp_path))
+    write_shards(sdk_classes, str(tmp_path), target_kb=16, log=lambda _: None)
+    (tmp_path / "sdk_data.json").write_text("[]")
+    assert remove_shards(str(tmp_path))
+    assert sorted(os.listdir(tmp_path)) == ["sdk_data.json"]
@@ -0,0 +1,99 @@
+"""sdk_data.sqlite export and its saved queries"""
+
+import sqlite3
+
+import pytest
+
+from sdk_sqlite import SAVED_QUERIES, SQLITE_VERSION, open_database, run_query, write_sqlite
+
+
+HIERARCHY = [
+    {"N": "UObject", "P": "", "S": 0x28, "T": "class",
+     "M": [{"N": "ClassPrivate", "T": "UClass*", "O": "0x10", "S": "0x8"},
+           {"N": "NamePrivate", "T": "FName", "O": "0x18", "S": "0x8"}]},
+    {"N": "AActor", "P": "UObject", "S": 0x40, "T": "class",
+     "M": [{"N": "RootComponent", "T": "USceneComponent*", "O": "0x28", "S": "0x8"},
+           {"N": "bHidden", "T": "uint8", "O": "0x30", "S": "0x1"}]},
+    {"N": "APawn", "P": "AActor", "S": 0x50, "T": "class",
+     "M": [{"N": "Controller", "T": "AController*", "O": "0x40", "S": "0x8"},
+           {"N": "MovementComponent", "T": "UPawnMovementComponent*", "O": "0x48", "S": "0x8"}]},
+    {"N": "ALoopA", "P": "ALoopB", "S": 0x8, "T": "class", "M": []},
+    {"N": "ALoopB", "P": "ALoopA", "S": 0x8, "T": "class", "M": []},
+]
+
+
+@pytest.fixture
+def hierarchy(tmp_path):
+    path = str(tmp_path / "sdk_data.sqlite")
+    write_sqlite(HIERARCHY, path)
+    connection = open_database(path)
+    yield connection
+    connection.close()
+
+
+def _saved(connection, query, **params):
+    return run_query(connection, SAVED_QUERIES[query][1], params)[1]
+
+
+def test_export_round_trips_the_corpus(tmp_path, sdk_classes):
+    path = str(tmp_path / "sdk_data.sqlite")
+    stats = write_sqlite(sdk_classes, path)
+    assert stats["classes"] == len(sdk_classes)
+    assert stats["members"] == sum(len(c["M"]) for c in sdk_classes)
+
+    connection = open_database(path)
+    try:
+        classes = connection.execute("SELECT name, parent, size, kind FROM classes ORDER BY id").fetchall()
+        assert classes == [(c["N"], c["P"], c["S"], c["T"]) for c in sdk_classes]
+        members = connection.execute("SELECT class_id, name, type, offset, size FROM members ORDER BY id").fetchall()
+        assert members == [(class_id, m["N"], m["T"], int(m["O"], 16), int(m["S"], 16))
+                           for class_id, c in enumerate(sdk_classes) for m in c["M"]]
+        assert connection.execute("PRAGMA user_version").fetchone()[0] == SQLITE_VERSION
+    finally:
+        connection.close()
+
+
+def test_every_saved_query_runs(hierarchy):
+    params = {"class": "APawn", "base": "AActor", "name": "%", "size": 8, "offset": 0x18,
+              "type": "FName", "q": "Component", "limit": 2}
+    for _, sql in SAVED_QUERIES.values():
+        run_query(hierarchy, sql, params)
+
+
+def test_layout_and_ancestry(hierarchy):
+    layout = _saved(hierarchy, "layout", **{"class": "APawn"})
+    assert [(row[0], row[1]) for row in layout] == [
+        ("UObject", "ClassPrivate"), ("UObject", "NamePrivate"), ("AActor", "RootComponent"),
+        ("AActor", "bHidden"), ("APawn", "Controller"), ("APawn", "MovementComponent")]
+    assert _saved(hierarchy, "ancestors", **{"class": "APawn"}) == [("APawn", 0x50, 0), ("AActor", 0x40, 1),
+                                                                    ("UObject", 0x28, 2)]
+    assert _saved(hierarchy, "subclasses", base="UObject") == [("AActor", "UObject", 0x40, 1),
+                                                               ("APawn", "AActor", 0x50, 2)]
+    # A parent cycle ends instead of looping
+    assert [row[0] for row in _saved(hierarchy, "ancestors", **{"class": "ALoopA"})] == ["ALoopA", "ALoopB"]
+
+
+def test_member_queries(hierarchy):
+    assert _saved(hierarchy, "at-offset", **{"class": "APawn", "offset": 0x1C}) == [
+        ("UObject", "NamePrivate", "FName", "0x18", "0x8")]
+    assert _saved(hierarchy, "at-offset", **{"class": "APawn", "offset": 0x31}) == []
+    found = _saved(hierarchy, "derived-members", base="AActor", name="%Component", size=8)
+    assert [(row[0], row[1]) for row in found] == [("AActor", "RootComponent"), ("APawn", "MovementComponent")]
+    assert [row[0] for row in _saved(hierarchy, "type-users", type="FName")] == ["UObject"]
+
+
+def test_full_text_search(hierarchy):
+    hits = _saved(hierarchy, "search", q="RootComponent")
+    assert ("member", "AActor", "RootComponent", "USceneComponent*", "0x28") in hits
+    assert ("class", "APawn", None, None, None) in _saved(hierarchy, "search", q="APawn")
+
+
+def test_rejects_other_versions(tmp_path):
+    path = str(tmp_path / "old.sqlite")
+    connection = sqlite3.connect(path)
+    connection.execute(f"PRAGMA user_version = {SQLITE_VERSION + 1}")
+    connection.close()
+    with pytest.raises(ValueError):
+        open_database(path)
+    with pytest.raises(FileNotFoundError):
+        open_database(str(tmp_path / "missing.sqlite"))
@@ -0,0 +1,41 @@
+"""type_refs.json against a scan of every member type"""
+
+import pytest
+
+from sdk_typerefs import TypeRefIndex, referenced_types, write_type_refs
+
+
+def test_referenced_types():
+    assert referenced_types("AFortWeapon*") == ["AFortWeapon"]
+    assert referenced_types("TArray<class AFortWeapon*>") == ["AFortWeapon"]
+    assert referenced_types("TMap<FName, FVector>") == ["FName", "FVector"]
+    assert referenced_types("TMap<FName, TArray<FName>>") == ["FName"]
+    assert referenced_types("TEnumAsByte<EFortTeam::Type>") == ["EFortTeam::Type"]
+    assert referenced_types("const unsigned int32&") == ["int32"]
+    assert referenced_types("TArray<>") == []
+
+
+def test_users_match_a_scan(tmp_path, sdk_classes):
+    path = str(tmp_path / "type_refs.json")
+    write_type_refs(sdk_classes, path)
+    index = TypeRefIndex.load(path)
+
+    expected = {}
+    for record in sdk_classes:
+        for member in record["M"]:
+            for name in referenced_types(member["T"]):
+                expected.setdefault(name, []).append(
+                    {"class": record["N"], "member": member["N"], "offset": member["O"], "type": member["T"]})
+
+    assert expected
+    for name, users in expected.items():
+        assert index.users(name) == users
+        # A wrapped query finds the same members
+        assert index.users(f"TArray<{name}*>") == users
+    assert index.users("UNoSuchType") == []
+    assert index.users("const*") == []
+
+
+def test_rejects_other_versions():
+    with pytest.raises(ValueError):
+        TypeRefIndex({"version": 0})
@@ -0,0 +1,67 @@
+"""StreamingJSONWriter output against json.dump, and its atomic replace"""
+
+import json
+import os
+
+import pytest
+
+from sdk_writer import StreamingJSONWriter, write_bytes_atomic, write_json_atomic
+
+
+RECORDS = [
+    {"N": "UObject", "P": "", "S": 40, "T": "class", "M": []},
+    {"N": "AActor", "P": "UObject", "S": 0x1B0, "T": "class",
+     "M": [{"N": "RootComponent", "T": "USceneComponent*", "O": "0x1B0", "S": "0x8"}]},
+    {"N": "FNäme \"quoted\"\\", "P": "", "S": 8, "T": "struct",
+     "M": [{"N": "Ünïcode", "T": "TMap<FName, int32>", "O": "0x0", "S": "0x50"}]},
+]
+
+
+def _json_dump(records, indent, ensure_ascii):
+    separators = (',', ':') if indent is None else None
+    return json.dumps(records, indent=indent, separators=separators, ensure_ascii=ensure_ascii)
+
+
+@pytest.mark.parametrize("indent", [2, None])
+@pytest.mark.parametrize("ensure_ascii", [True, False])
+@pytest.mark.parametrize("count", [0, 1, 3])
+def test_matches_json_dump(tmp_path, indent, ensure_ascii, count):
+    path = tmp_path / "sdk_data.json"
+    with StreamingJSONWriter(str(path), indent=indent, ensure_ascii=ensure_ascii) as writer:
+        writer.write_all(RECORDS[:count])
+    assert path.read_text(encoding='utf-8') == _json_dump(RECORDS[:count], indent, ensure_ascii)
+    assert writer.bytes_written == os.path.getsize(path)
+
+
+def test_write_serialized_matches_write(tmp_path):
+    path = tmp_path / "sdk_data.json"
+    with StreamingJSONWriter(str(path)) as writer:
+        writer.write(RECORDS[0])
+        writer.write_serialized(writer.serialize_all(RECORDS[1:]), records=len(RECORDS) - 1)
+    assert writer.records == len(RECORDS)
+    assert path.read_text(encoding='utf-8') == _json_dump(RECORDS, 2, True)
+
+
+def test_failed_write_keeps_the_old_file(tmp_path):
+    path = tmp_path / "sdk_data.json"
+    path.write_text("old")
+    with pytest.raises(RuntimeError):
+        with StreamingJSONWriter(str(path)) as writer:
+            writer.write(RECORDS[0])
+            raise RuntimeError("interrupted")
+    assert path.read_text() == "old"
+    assert os.listdir(tmp_path) == ["sdk_data.json"]
+
+    with pytest.raises(TypeError):
+        write_json_atomic(str(path), {"not": object()})
+    assert path.read_text() == "old"
+    assert os.listdir(tmp_path) == ["sdk_data.json"]
+
+
+def test_atomic_helpers(tmp_path):
+    path = tmp_path / "nested" / "data.json"
+    assert write_json_atomic(str(path), RECORDS, indent=None) == os.path.getsize(path)
+    assert json.loads(path.read_text(encoding='utf-8')) == RECORDS
+    blob = tmp_path / "data.bin"
+    assert write_bytes_atomic(str(blob), b"\x00\x01") == 2
+    assert blob.read_bytes() == b"\x00\x01"
@@ -0,0 +1,71 @@
+"""single-hpp-to-json.py: in-memory, streaming and fast-logging conversions must agree"""
+
+import logging
+
+import pytest
+
+from bench_converters import load_hpp_module
+from sdk_corpus import generate_hpp
+from sdk_schema import SCHEMA_V2
+
+single_hpp = load_hpp_module()
+
+
+@pytest.fixture(scope="module")
+def hpp_file(tmp_path_factory):
+    path = tmp_path_factory.mktemp("hpp") / "dump.hpp"
+    generate_hpp(str(path), classes=300, members=10)
+    return path
+
+
+@pytest.fixture
+def logger():
+    # setup_logging() writes a log file next to the script; tests only need the records
+    logger = logging.getLogger("HPPConverterTest")
+    logger.setLevel(logging.DEBUG)
+    return logger
+
+
+def _in_memory(logger, hpp_file, output_path, **kwargs):
+    converter = single_hpp.HPPToJSONConverter(logger)
+    assert converter.parse_hpp_file(hpp_file)
+    assert converter.save_to_json(output_path, **kwargs)
+    return output_path.read_bytes()
+
+
+@pytest.mark.parametrize("schema", [1, SCHEMA_V2])
+def test_streaming_matches_in_memory(tmp_path, logger, hpp_file, schema):
+    expected = _in_memory(logger, hpp_file, tmp_path / "memory.json", compact=True, schema=schema)
+    converter = single_hpp.HPPToJSONConverter(logger)
+    assert converter.convert_streaming(hpp_file, tmp_path / "stream.json", compact=True, schema=schema)
+    assert (tmp_path / "stream.json").read_bytes() == expected
+    assert converter.structures == []
+
+
+def test_streaming_without_structures_keeps_the_old_output(tmp_path, logger):
+    empty = tmp_path / "empty.hpp"
+    empty.write_text("// nothing here\n")
+    output_path = tmp_path / "sdk_data.json"
+    output_path.write_text("[]")
+    assert not single_hpp.HPPToJSONConverter(logger).convert_streaming(empty, output_path)
+    assert output_path.read_text() == "[]"
+    # Nor a temp file left behind
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["empty.hpp", "sdk_data.json"]
+
+
+def test_fast_log_moves_structure_lines_to_debug(tmp_path, logger, hpp_file, caplog):
+    caplog.set_level(logging.INFO, logger=logger.name)
+
+    def completed_lines():
+        return [record for record in caplog.records if record.getMessage().startswith("Completed ")]
+
+    expected = _in_memory(logger, hpp_file, tmp_path / "verbose.json")
+    assert completed_lines()
+    caplog.clear()
+
+    converter = single_hpp.HPPToJSONConverter(logger, fast_log=True)
+    converter.parse_hpp_file(hpp_file)
+    assert converter.save_to_json(tmp_path / "fast.json")
+    assert (tmp_path / "fast.json").read_bytes() == expected
+    assert converter.completed_count
+    assert not completed_lines()